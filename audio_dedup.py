@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Find clips that sound identical and alias them to one canonical file
+
+Every clip under audio/ is decoded to PCM with ffmpeg (leading and
+trailing digital silence stripped) and hashed in a process pool, so files
+that differ only in tags or container details still match. Without ffmpeg
+the MPEG frame data is hashed instead, which still ignores ID3 tags and
+encoder info frames. Hashes are cached by file content in the TTS store.
+
+Each group of identical clips gets one canonical path - the one chapter
+pages reference most, then by category order and name - and the others are
+written to audio-aliases.json, with the content hash of every file
+involved. --rewrite points every play()/playAudio() call in the chapter
+pages at the canonical file, so browsers and the service worker fetch and
+cache each sound once. load_aliases() drops pairs that no longer sound the
+same, e.g. after a clip was resynthesized for new text, so a build never
+serves the old canonical audio for it.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import audio_refs
+import corpus
+import mp3_check
+import tts_cache
+
+ALIASES_PATH = "audio-aliases.json"
+HASH_CACHE = "pcm_hashes.json"
+FFMPEG = "ffmpeg"
+
+
+def file_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def pcm_hash(path, ffmpeg=FFMPEG):
+    """Hash of the decoded 16-bit mono samples without silent ends"""
+    command = [ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-i", path,
+               "-f", "s16le", "-ac", "1", "-ar", "24000", "-"]
+    completed = subprocess.run(command, capture_output=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.decode("utf-8", "replace").strip())
+    samples = completed.stdout
+    start, end = 0, len(samples) - len(samples) % 2
+    while start < end and samples[start:start + 2] == b"\0\0":
+        start += 2
+    while end > start and samples[end - 2:end] == b"\0\0":
+        end -= 2
+    return "pcm:" + file_hash(samples[start:end])
+
+
+def frames_hash(data):
+    """Hash of the MPEG frames, ignoring tags and the encoder info frame"""
+    frames = mp3_check.audio_frames(data)
+    return "frames:" + file_hash(b"".join(data[pos:pos + h["length"]] for pos, h in frames))
+
+
+def hash_clip(task):
+    path, ffmpeg = task
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        audio = pcm_hash(path, ffmpeg) if ffmpeg else frames_hash(data)
+        error = None
+    except RuntimeError as e:
+        audio, error = None, str(e)
+    return {"path": path, "content": file_hash(data), "audio": audio, "error": error}
+
+
+def load_hash_cache(cache_dir=tts_cache.CACHE_DIR):
+    path = os.path.join(cache_dir, HASH_CACHE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_hash_cache(hashes, cache_dir=tts_cache.CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, HASH_CACHE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=0, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def audio_hashes(paths, ffmpeg=None, workers=None, cache_dir=tts_cache.CACHE_DIR):
+    """{path: audio hash}, decoding only files whose content is not cached"""
+    cached = load_hash_cache(cache_dir)
+    method = "pcm:" if ffmpeg else "frames:"
+    results = {}
+    todo = []
+    for path in paths:
+        with open(path, "rb") as f:
+            content = file_hash(f.read())
+        known = cached.get(content)
+        if known and known.startswith(method):
+            results[path] = known
+        else:
+            todo.append(path)
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(hash_clip, [(p, ffmpeg) for p in todo], chunksize=16):
+                if result["error"]:
+                    print(f"❌ {result['path']}: {result['error']}")
+                    continue
+                results[result["path"]] = result["audio"]
+                cached[result["content"]] = result["audio"]
+        save_hash_cache(cached, cache_dir)
+    return results, len(todo)
+
+
+def choose_canonical(paths, ref_counts):
+    """Most referenced first, then by category order, then shortest name"""
+    def rank(path):
+        parts = path.replace(os.sep, "/").split("/")
+        category = parts[-2] if len(parts) >= 2 else ""
+        order = corpus.CATEGORIES.index(category) if category in corpus.CATEGORIES else len(corpus.CATEGORIES)
+        return (-ref_counts.get(os.path.normpath(path), 0), order, len(path), path)
+    return min(paths, key=rank)
+
+
+def build_aliases(hashes, ref_counts):
+    """{duplicate path: canonical path} with site-relative forward slashes"""
+    groups = {}
+    for path, digest in sorted(hashes.items()):
+        groups.setdefault(digest, []).append(path)
+    aliases = {}
+    for paths in groups.values():
+        if len(paths) < 2:
+            continue
+        canonical = choose_canonical(paths, ref_counts)
+        for path in paths:
+            if path != canonical:
+                aliases[path.replace(os.sep, "/")] = canonical.replace(os.sep, "/")
+    return aliases
+
+
+def checked_aliases(path=ALIASES_PATH, cache_dir=tts_cache.CACHE_DIR):
+    """(aliases, stale): the alias pairs whose files still match, and the rest
+
+    A pair still matches if neither file changed since the aliases were
+    written, or else if the audio hashes cached for their current contents,
+    or failing that their MPEG frames, are equal. Pairs with a missing
+    file are stale.
+    """
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    recorded = document.get("content", {})
+    cached = load_hash_cache(cache_dir)
+    contents = {}
+    data = {}
+    for clip in set(document["aliases"]) | set(document["aliases"].values()):
+        if os.path.isfile(clip):
+            with open(clip, "rb") as f:
+                data[clip] = f.read()
+            contents[clip] = file_hash(data[clip])
+
+    def same(alias, canonical):
+        if alias not in contents or canonical not in contents:
+            return False
+        if all(recorded.get(clip) == contents[clip] for clip in (alias, canonical)):
+            return True
+        known = [cached.get(contents[clip]) for clip in (alias, canonical)]
+        if all(known) and known[0].split(":")[0] == known[1].split(":")[0]:
+            return known[0] == known[1]
+        return frames_hash(data[alias]) == frames_hash(data[canonical])
+
+    aliases, stale = {}, {}
+    for alias, canonical in document["aliases"].items():
+        (aliases if same(alias, canonical) else stale)[alias] = canonical
+    return aliases, stale
+
+
+def load_aliases(path=ALIASES_PATH, cache_dir=tts_cache.CACHE_DIR):
+    """The alias map without stale pairs, or {} if the dedup tool has not been run"""
+    return checked_aliases(path, cache_dir)[0]
+
+
+def save_aliases(aliases, method, path=ALIASES_PATH):
+    content = {}
+    for clip in sorted(set(aliases) | set(aliases.values())):
+        with open(clip, "rb") as f:
+            content[clip] = file_hash(f.read())
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "hash": method, "aliases": aliases, "content": content}, f,
+                  ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def rewrite_text(text, page, aliases):
+    """Point every audio call in one page's HTML at canonical files
+
+    Returns the new text and the number of rewritten calls.
+    """
+    base = os.path.dirname(page)
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        quote, src = match.group(1), match.group(2)
+        resolved = os.path.normpath(os.path.join(base, src)).replace(os.sep, "/")
+        canonical = aliases.get(resolved)
+        if canonical is None:
+            return match.group(0)
+        count += 1
+        new_src = os.path.relpath(canonical, base or ".").replace(os.sep, "/")
+        return match.group(0).replace(f"{quote}{src}{quote}", f"{quote}{new_src}{quote}")
+
+    return audio_refs.AUDIO_CALL.sub(replace, text), count
+
+
+def rewrite_pages(pages, aliases):
+    total = 0
+    for page in pages:
+        with open(page, "r", encoding="utf-8") as f:
+            text = f.read()
+        new_text, count = rewrite_text(text, page, aliases)
+        if count:
+            with open(page, "w", encoding="utf-8") as f:
+                f.write(new_text)
+            print(f"✏️  {page}: {count} references")
+            total += count
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Alias audio clips that sound identical to one canonical file")
+    parser.add_argument("--audio-dir", default=corpus.AUDIO_DIR)
+    parser.add_argument("--cache-dir", default=tts_cache.CACHE_DIR)
+    parser.add_argument("--output", default=ALIASES_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--ffmpeg", default=FFMPEG, help="ffmpeg binary used to decode to PCM")
+    parser.add_argument("--no-decode", action="store_true",
+                        help="hash MPEG frame data instead of decoded PCM")
+    parser.add_argument("--rewrite", nargs="*", metavar="DIR",
+                        help="rewrite audio references in chapter pages (default dirs: "
+                             f"{', '.join(audio_refs.CHAPTER_DIRS)})")
+    args = parser.parse_args()
+
+    ffmpeg = None if args.no_decode else shutil.which(args.ffmpeg)
+    if ffmpeg is None and not args.no_decode:
+        print(f"⚠️  {args.ffmpeg} not found, comparing MPEG frame data instead of PCM")
+
+    started = time.monotonic()
+    paths = [
+        path for path in sorted(glob.glob(os.path.join(args.audio_dir, "*", "*.mp3")))
+        if not mp3_check.is_broken(mp3_check.scan_file(path))
+    ]
+    hashes, decoded = audio_hashes(paths, ffmpeg, args.workers, args.cache_dir)
+    refs, _ = audio_refs.build_index(audio_refs.chapter_pages())
+    aliases = build_aliases(hashes, {path: len(uses) for path, uses in refs.items()})
+    save_aliases(aliases, "pcm" if ffmpeg else "frames", args.output)
+
+    canonical = set(aliases.values())
+    saved = sum(os.path.getsize(path) for path in aliases)
+    elapsed = time.monotonic() - started
+    print(f"🔍 {len(paths)} clips hashed ({decoded} decoded) in {elapsed:.1f}s")
+    print(f"🔗 {len(aliases)} duplicates of {len(canonical)} clips, {saved / 1024:.0f} KB redundant")
+    print(f"✅ Wrote {args.output}")
+
+    if args.rewrite is not None:
+        pages = audio_refs.chapter_pages(args.rewrite or audio_refs.CHAPTER_DIRS)
+        print(f"\n✏️  Rewrote {rewrite_pages(pages, aliases)} references to canonical files")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trim silence and normalize loudness of the generated clips
+
+Each clip is decoded with ffmpeg, stripped of leading and trailing silence
+(a short pad is kept), normalized to TARGET_LUFS with a true-peak ceiling
+and re-encoded in the corpus format, one process per CPU. Results are cached
+in the TTS store by the hash of the input file and the processing settings,
+and the hashes of processed outputs are remembered, so a rerun only touches
+new or resynthesized clips. Clips linked from the store are replaced in the
+store too, so build_audio.py keeps the processed version.
+
+Needs the ffmpeg binary on PATH.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import build_plan
+import corpus
+import mp3_check
+import tts_cache
+
+FFMPEG = "ffmpeg"
+TARGET_LUFS = -16.0
+TRUE_PEAK = -1.5
+SILENCE_THRESHOLD = "-45dB"
+KEEP_SILENCE = 0.1  # seconds of silence left before and after the speech
+ENCODE_ARGS = ["-ar", "24000", "-ac", "1", "-c:a", "libmp3lame", "-b:a", "48k",
+               "-map_metadata", "-1", "-id3v2_version", "0", "-write_xing", "0"]
+PROCESSED_DIR = "processed"
+
+
+def filter_chain(target=TARGET_LUFS, true_peak=TRUE_PEAK, threshold=SILENCE_THRESHOLD,
+                 keep=KEEP_SILENCE):
+    """ffmpeg audio filter: trim the start, trim the (reversed) end, normalize"""
+    trim = f"silenceremove=start_periods=1:start_threshold={threshold}:start_silence={keep}"
+    return f"{trim},areverse,{trim},areverse,loudnorm=I={target}:TP={true_peak}:LRA=11"
+
+
+def settings_hash(audio_filter):
+    material = json.dumps([audio_filter, ENCODE_ARGS])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:12]
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def processed_path(input_hash, settings, cache_dir=tts_cache.CACHE_DIR):
+    return os.path.join(cache_dir, PROCESSED_DIR, input_hash[:2], f"{input_hash}.{settings}.mp3")
+
+
+def index_path(settings, cache_dir=tts_cache.CACHE_DIR):
+    return os.path.join(cache_dir, PROCESSED_DIR, f"outputs.{settings}.json")
+
+
+def load_outputs(settings, cache_dir=tts_cache.CACHE_DIR):
+    """Hashes of files that already are processing results for these settings"""
+    path = index_path(settings, cache_dir)
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return set(json.load(f))
+
+
+def save_outputs(outputs, settings, cache_dir=tts_cache.CACHE_DIR):
+    path = index_path(settings, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(sorted(outputs), f, indent=0)
+    os.replace(path + ".tmp", path)
+
+
+def run_ffmpeg(ffmpeg, src, dest, args):
+    """Encode src into dest with the given output arguments; returns an error or None"""
+    command = [ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-y", "-i", src] + args + [dest]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        if os.path.exists(dest):
+            os.remove(dest)
+        return completed.stderr.strip() or f"ffmpeg exited {completed.returncode}"
+    return None
+
+
+def process_file(task):
+    """Run ffmpeg on one clip into its cache object; returns a result dict"""
+    src, dest, audio_filter, ffmpeg = task
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    error = run_ffmpeg(ffmpeg, src, tmp, ["-af", audio_filter] + ENCODE_ARGS + ["-f", "mp3"])
+    if error:
+        return {"path": src, "error": error}
+    check = mp3_check.scan_file(tmp)
+    if mp3_check.is_broken(check):
+        os.remove(tmp)
+        return {"path": src, "error": f"invalid output: {', '.join(check['problems'])}"}
+    os.replace(tmp, dest)
+    return {"path": src, "error": None}
+
+
+def install(path, processed, key=None, cache_dir=tts_cache.CACHE_DIR):
+    """Put a processed clip at path, through the store if path comes from it"""
+    if key and tts_cache.has(key, cache_dir):
+        current = tts_cache.object_path(key, cache_dir)
+        if tts_cache.is_materialized(key, path, cache_dir) or file_hash(current) == file_hash(processed):
+            tmp = tts_cache.temp_path(key, cache_dir)
+            tts_cache._link_or_copy(processed, tmp)
+            tts_cache.commit(key, tmp, cache_dir)
+            tts_cache.materialize(key, path, cache_dir)
+            return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    tts_cache._link_or_copy(processed, tmp)
+    os.replace(tmp, path)
+
+
+def store_keys(manifest, audio_dir=corpus.AUDIO_DIR):
+    """Store key of every output path that is synthesized from text"""
+    return {
+        os.path.normpath(job["path"]): tts_cache.cache_key(job)
+        for job in manifest.jobs(manifest.clips, audio_dir)
+    }
+
+
+def refresh_state(state, manifest, paths, audio_dir=corpus.AUDIO_DIR):
+    """Record the new size and mtime of replaced clips so they still plan as current"""
+    for clip in manifest.clips:
+        path = corpus.clip_path(clip, audio_dir)
+        entry = state.get(clip["id"])
+        if entry and os.path.normpath(path) in paths and os.path.exists(path):
+            st = os.stat(path)
+            entry["size"], entry["mtime_ns"] = st.st_size, st.st_mtime_ns
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trim silence and normalize loudness of generated clips")
+    parser.add_argument("--audio-dir", default=corpus.AUDIO_DIR)
+    parser.add_argument("--cache-dir", default=tts_cache.CACHE_DIR)
+    parser.add_argument("--state", default=build_plan.STATE_PATH,
+                        help="build state to keep in step with replaced clips")
+    parser.add_argument("--target", type=float, default=TARGET_LUFS, help="integrated loudness in LUFS")
+    parser.add_argument("--true-peak", type=float, default=TRUE_PEAK, help="peak ceiling in dBTP")
+    parser.add_argument("--silence-threshold", default=SILENCE_THRESHOLD)
+    parser.add_argument("--keep-silence", type=float, default=KEEP_SILENCE,
+                        help="seconds of silence kept at each end")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--ffmpeg", default=FFMPEG, help="ffmpeg binary")
+    parser.add_argument("--dry-run", action="store_true", help="only count what would be processed")
+    args = parser.parse_args()
+
+    if shutil.which(args.ffmpeg) is None:
+        print(f"❌ {args.ffmpeg} not found; install ffmpeg to post-process clips")
+        raise SystemExit(1)
+
+    audio_filter = filter_chain(args.target, args.true_peak, args.silence_threshold, args.keep_silence)
+    settings = settings_hash(audio_filter)
+    outputs = load_outputs(settings, args.cache_dir)
+    started = time.monotonic()
+
+    todo = {}  # processed object -> input paths
+    cached = {}
+    done = 0
+    paths = sorted(glob.glob(os.path.join(args.audio_dir, "*", "*.mp3")))
+    for path in paths:
+        if not os.path.getsize(path) or mp3_check.is_broken(mp3_check.scan_file(path)):
+            continue
+        digest = file_hash(path)
+        if digest in outputs:
+            done += 1
+            continue
+        processed = processed_path(digest, settings, args.cache_dir)
+        (cached if os.path.exists(processed) else todo).setdefault(processed, []).append(path)
+
+    print(f"🎚️  {len(paths)} clips: {done} already processed, "
+          f"{sum(map(len, cached.values()))} from cache, {sum(map(len, todo.values()))} to process")
+    if args.dry_run:
+        raise SystemExit(0)
+
+    errors = 0
+    if todo:
+        tasks = [(sources[0], processed, audio_filter, args.ffmpeg) for processed, sources in todo.items()]
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for task, result in zip(tasks, pool.map(process_file, tasks)):
+                if result["error"]:
+                    errors += 1
+                    print(f"❌ {result['path']}: {result['error']}")
+                    del todo[task[1]]
+                else:
+                    cached.setdefault(task[1], []).extend(todo.pop(task[1]))
+
+    manifest = corpus.load()
+    keys = store_keys(manifest, args.audio_dir)
+    replaced = set()
+    before = after = 0
+    for processed, sources in cached.items():
+        outputs.add(file_hash(processed))
+        for path in sources:
+            before += os.path.getsize(path)
+            install(path, processed, keys.get(os.path.normpath(path)), args.cache_dir)
+            after += os.path.getsize(path)
+            replaced.add(os.path.normpath(path))
+    save_outputs(outputs, settings, args.cache_dir)
+
+    if replaced and os.path.exists(args.state):
+        state = build_plan.load_state(args.state)
+        refresh_state(state, manifest, replaced, args.audio_dir)
+        build_plan.save_state(state, args.state)
+
+    elapsed = time.monotonic() - started
+    print(f"\n✅ Processed {len(replaced)} clips ({before / 1024:.0f} KB -> {after / 1024:.0f} KB), "
+          f"❌ {errors} errors in {elapsed:.1f}s")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index every audio reference in the chapter HTML
+
+One streaming pass over chapters/, content/ and chapters/content/ collects
+both play('...') and playAudio('...') calls for every category, resolves
+them relative to the page, and reports missing files, orphan MP3s that no
+page references, and the audio bytes each page pulls in. --check exits
+non-zero on missing files so it can run as a pre-commit hook.
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+CHAPTER_DIRS = ("chapters", "content", os.path.join("chapters", "content"))
+AUDIO_DIR = "audio"
+AUDIO_CALL = re.compile(r"""\bplay(?:Audio)?\(\s*(['"])([^'"]+?\.mp3)\1\s*\)""")
+
+
+def chapter_pages(dirs=CHAPTER_DIRS):
+    pages = []
+    for directory in dirs:
+        pages.extend(sorted(glob.glob(os.path.join(directory, "*.html"))))
+    return pages
+
+
+def index_page(page):
+    """Yield (resolved path, line number) for every audio call in a page"""
+    base = os.path.dirname(page)
+    with open(page, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if "play" not in line:
+                continue
+            for match in AUDIO_CALL.finditer(line):
+                src = match.group(2)
+                yield os.path.normpath(os.path.join(base, src)), number
+
+
+def build_index(pages):
+    """Map each resolved audio path to the (page, line) pairs using it"""
+    refs = {}
+    by_page = {}
+    for page in pages:
+        page_refs = by_page.setdefault(page, set())
+        for path, number in index_page(page):
+            refs.setdefault(path, []).append((page, number))
+            page_refs.add(path)
+    return refs, by_page
+
+
+def audio_files(audio_dir=AUDIO_DIR):
+    return {os.path.normpath(p) for p in glob.glob(os.path.join(audio_dir, "*", "*.mp3"))}
+
+
+def report(refs, by_page, files):
+    """Missing references, orphan files and per-page audio bytes"""
+    sizes = {path: os.path.getsize(path) for path in files}
+    missing = {path: uses for path, uses in refs.items() if path not in sizes}
+    orphans = sorted(files - set(refs))
+    page_bytes = {
+        page: (len(paths), sum(sizes.get(path, 0) for path in paths))
+        for page, paths in by_page.items()
+    }
+    return missing, orphans, page_bytes
+
+
+def find_missing(pages=None):
+    """Missing audio references as (page, line, path) tuples"""
+    refs, by_page = build_index(chapter_pages() if pages is None else pages)
+    missing, _, _ = report(refs, by_page, audio_files())
+    return sorted((page, number, path) for path, uses in missing.items() for page, number in uses)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report missing and orphan audio referenced by chapter HTML")
+    parser.add_argument("dirs", nargs="*", default=list(CHAPTER_DIRS),
+                        help="directories of chapter pages to index")
+    parser.add_argument("--check", action="store_true",
+                        help="only print problems; exit 1 if any reference is missing")
+    parser.add_argument("--orphans", action="store_true", help="list orphan MP3 files")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    pages = chapter_pages(args.dirs)
+    refs, by_page = build_index(pages)
+    missing, orphans, page_bytes = report(refs, by_page, audio_files())
+    elapsed = time.monotonic() - started
+
+    if not args.check:
+        print("📊 Audio per page:")
+        for page, (count, size) in page_bytes.items():
+            print(f"  {page:40} {count:4} clips {size / 1024:8.0f} KB")
+    for path, uses in sorted(missing.items()):
+        pages_using = sorted({page for page, _ in uses})
+        print(f"❌ Missing: {path} ({len(uses)} refs in {', '.join(pages_using)})")
+    if args.orphans:
+        for path in orphans:
+            print(f"👻 Orphan: {path}")
+
+    print(f"\n🔍 {len(pages)} pages, {sum(len(u) for u in refs.values())} references to "
+          f"{len(refs)} files in {elapsed * 1000:.0f} ms")
+    print(f"❌ {len(missing)} missing files, 👻 {len(orphans)} orphan files")
+    if args.check and missing:
+        sys.exit(1)
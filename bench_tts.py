@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+End-to-end benchmark of audio generation
+
+Replays every clip of the corpus manifest (the clips of all create_* /
+generate_* scripts) through tts_engine.run_jobs() against the offline
+FakeBackend, once per concurrency level, and reports clips per second,
+p50/p95/p99 per-clip latency (wall time across all attempts, so failed
+attempts and retry backoff count), the same for the successful request
+alone and its time to first byte, CPU time and peak memory. Each level
+runs in a fresh process with its own empty cache and output directory, so
+levels don't share warm caches or memory. The fake backend is seeded, so
+two runs with the same options draw from the same latencies and errors;
+the order requests draw them in, and the engine's retry backoff, still
+vary, so --repeat runs each level several times and keeps the run with
+the median throughput.
+
+The results are written as JSON together with the commit they were taken
+at; --compare prints the change against an earlier results file, so a
+regression between commits shows up as a drop in clips/s or a rise in
+latency.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import corpus
+import tts_backends
+import tts_engine
+
+try:
+    import resource
+except ImportError:  # Windows: no peak memory
+    resource = None
+
+OUTPUT = "tts-benchmark.json"
+LEVELS = (1, 4, 16, 64)
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def latency_summary(values):
+    """{p50, p95, p99, max} in milliseconds"""
+    if not values:
+        return None
+    summary = {f"p{round(p * 100)}": tts_engine.percentile(values, p) * 1000 for p in PERCENTILES}
+    summary["max"] = max(values) * 1000
+    return {name: round(ms, 1) for name, ms in summary.items()}
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_level(task):
+    """Generate the corpus once at one concurrency level; runs in its own process"""
+    concurrency, settings = task
+    with tempfile.TemporaryDirectory(prefix="tts-bench-") as tmp:
+        manifest = corpus.load(settings["manifest"])
+        clips = manifest.select(categories=settings["categories"])
+        jobs = manifest.jobs(clips, audio_dir=os.path.join(tmp, "audio"))
+        backend = tts_backends.FakeBackend(latency=settings["latency"], jitter=settings["jitter"],
+                                           error_rate=settings["error_rate"], seed=settings["seed"])
+        metrics_path = os.path.join(tmp, "metrics.json")
+        log = io.StringIO()
+        cpu = time.process_time()
+        started = time.monotonic()
+        with contextlib.redirect_stdout(sys.stdout if settings["verbose"] else log):
+            stats = asyncio.run(tts_engine.run_jobs(
+                jobs, concurrency=concurrency, cache_dir=os.path.join(tmp, "cache"),
+                retries=settings["retries"], timeout=settings["timeout"], backend=backend,
+                metrics_path=metrics_path, batch_size=settings["batch"]))
+        elapsed = time.monotonic() - started
+        cpu = time.process_time() - cpu
+        metrics = []
+        if os.path.exists(metrics_path):
+            with open(metrics_path, "r", encoding="utf-8") as f:
+                metrics = json.load(f)
+
+    return {
+        "concurrency": concurrency,
+        "jobs": len(jobs),
+        "clips": stats["created"],
+        "errors": stats["errors"],
+        "retries": sum(m.get("attempts", 1) - 1 for m in metrics),
+        "seconds": round(elapsed, 3),
+        "clips_per_second": round(stats["created"] / elapsed, 2) if elapsed else None,
+        "latency_ms": latency_summary([m["elapsed"] for m in metrics]),
+        "request_ms": latency_summary([m["seconds"] for m in metrics]),
+        "ttfb_ms": latency_summary([m["ttfb"] for m in metrics]),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_percent": round(100 * cpu / elapsed, 1) if elapsed else None,
+        "max_rss_mb": peak_rss_mb(),
+        "bytes": sum(m["bytes"] for m in metrics),
+    }
+
+
+def print_level(level):
+    latency = level["latency_ms"] or {}
+    print(f"  {level['concurrency']:5} {level['clips']:6} {level['errors']:6} {level['seconds']:8.2f}s "
+          f"{level['clips_per_second'] or 0:9.1f} "
+          + " ".join(f"{latency.get(name, 0):8.0f}" for name in ("p50", "p95", "p99"))
+          + f" {level['cpu_percent'] or 0:5.0f}% {level['max_rss_mb'] or 0:7.1f}")
+
+
+def compare(results, baseline):
+    """Print the change of each level's throughput and tail latency against baseline"""
+    before = {level["concurrency"]: level for level in baseline["levels"]}
+    print(f"📊 Against {baseline.get('commit') or 'baseline'}:")
+    for level in results["levels"]:
+        old = before.get(level["concurrency"])
+        if old is None or not old.get("clips_per_second"):
+            continue
+        changes = [f"clips/s {_change(level['clips_per_second'], old['clips_per_second'])}"]
+        for name in ("p95", "p99"):
+            if level["latency_ms"] and old.get("latency_ms"):
+                changes.append(f"{name} {_change(level['latency_ms'][name], old['latency_ms'][name])}")
+        print(f"  concurrency {level['concurrency']:3}: " + ", ".join(changes))
+
+
+def _change(new, old):
+    return f"{new:g} ({(new - old) / old * 100:+.1f}%)" if old else f"{new:g}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark audio generation against the fake TTS backend")
+    parser.add_argument("--manifest", default=corpus.MANIFEST_PATH)
+    parser.add_argument("--category", action="append", choices=corpus.CATEGORIES,
+                        help="only clips of this category (repeatable)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(LEVELS),
+                        help="concurrency levels to measure")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds before the first chunk")
+    parser.add_argument("--jitter", type=float, default=0.02, help="+/- seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability that a request fails")
+    parser.add_argument("--seed", type=int, default=0, help="fake backend random seed")
+    parser.add_argument("--batch", type=int, default=1, metavar="N", help="clips per request, as in build_audio.py")
+    parser.add_argument("--retries", type=int, default=tts_engine.DEFAULT_RETRIES)
+    parser.add_argument("--timeout", type=float, default=tts_engine.DEFAULT_TIMEOUT)
+    parser.add_argument("--repeat", type=int, default=1, help="runs per level; the median run is kept")
+    parser.add_argument("--output", default=OUTPUT, help="where to write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results to compare against")
+    parser.add_argument("--verbose", action="store_true", help="show the engine's per-clip output")
+    args = parser.parse_args()
+
+    settings = {
+        "manifest": args.manifest, "categories": args.category, "latency": args.latency,
+        "jitter": args.jitter, "error_rate": args.error_rate, "seed": args.seed, "batch": args.batch,
+        "retries": max(0, args.retries), "timeout": args.timeout, "verbose": args.verbose,
+    }
+    print(f"🏁 Fake backend: {args.latency * 1000:.0f} ms ± {args.jitter * 1000:.0f} ms, "
+          f"{args.error_rate:.0%} errors, batch {args.batch}")
+    print(f"  {'conc':>5} {'clips':>6} {'errors':>6} {'time':>9} {'clips/s':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu':>6} {'rss MB':>7}")
+    levels = []
+    for concurrency in args.concurrency:
+        # a fresh interpreter per level, so peak memory and CPU are its own
+        runs = []
+        for _ in range(max(1, args.repeat)):
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                runs.append(pool.submit(run_level, (max(1, concurrency), settings)).result())
+        runs.sort(key=lambda run: run["clips_per_second"] or 0)
+        level = runs[len(runs) // 2]
+        level["runs"] = [run["clips_per_second"] for run in runs]
+        print_level(level)
+        levels.append(level)
+
+    results = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "settings": {name: value for name, value in settings.items() if name != "verbose"},
+        "repeat": max(1, args.repeat),
+        "levels": levels,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=1)
+    print(f"💾 Results written to {args.output}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
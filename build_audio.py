@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incrementally build German audio from the corpus manifest
+
+Plans against the persisted build state and only synthesizes, relinks or
+deletes what changed. Without a state (a fresh checkout), the valid MP3s
+already in audio/ are adopted as current instead of resynthesized. Use
+--dry-run to print the plan without touching audio/.
+"""
+import argparse
+import os
+import time
+
+import build_plan
+import corpus
+import tts_cache
+import tts_engine
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate audio from the corpus manifest")
+    parser.add_argument("--manifest", default=corpus.MANIFEST_PATH)
+    parser.add_argument("--state", default=build_plan.STATE_PATH,
+                        help="build state file recording what produced each output")
+    parser.add_argument("--chapter", type=int, action="append",
+                        help="only this chapter (repeatable)")
+    parser.add_argument("--category", action="append", choices=corpus.CATEGORIES,
+                        help="only this category (repeatable)")
+    parser.add_argument("--group", help="only the clips of one old generator script")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the plan and exit")
+    tts_engine.add_arguments(parser)
+    return parser
+
+
+def apply_plan(manifest, actions, state, args):
+    """Carry out a plan and record every clip that is now up to date"""
+    jobs = []
+    for action in actions:
+        if action["action"] == "delete":
+            os.remove(action["path"])
+            state.pop(action["id"], None)
+            print(f"🗑️  Deleted: {action['path']}")
+        elif action["action"] == "relink":
+            tts_cache.materialize(action["key"], action["path"], args.cache_dir)
+        elif action["action"] == "adopt":
+            tts_cache.adopt(action["key"], action["path"], args.cache_dir)
+        elif action["action"] == "synthesize":
+            if action["broken"]:
+                tts_cache.discard(action["key"], args.cache_dir)
+            jobs.extend(manifest.jobs([manifest.get(action["id"])]))
+        elif action["action"] == "missing":
+            print(f"❓ Missing recording without source text: {action['path']}")
+
+    if jobs:
+        tts_engine.run_from_args(jobs, args)
+
+    for action in actions:
+        if action["action"] in ("relink", "adopt", "synthesize") and tts_cache.has(action["key"], args.cache_dir) \
+                and tts_cache.is_materialized(action["key"], action["path"], args.cache_dir):
+            clip = manifest.get(action["id"])
+            state[action["id"]] = build_plan.state_entry(clip, action["key"], action["path"])
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    started = time.monotonic()
+    manifest = corpus.load(args.manifest)
+    filtered = bool(args.chapter or args.category or args.group)
+    clips = manifest.select(chapters=args.chapter, categories=args.category,
+                            group=args.group) if filtered else None
+    state = build_plan.load_state(args.state)
+
+    if args.overwrite:
+        for clip in manifest.clips if clips is None else clips:
+            state.pop(clip["id"], None)
+    actions = build_plan.plan(manifest, state, clips, cache_dir=args.cache_dir,
+                              prune=not filtered)
+    if args.overwrite:
+        for action in actions:
+            if action["action"] in ("relink", "adopt"):
+                action["action"] = "synthesize"
+    if args.dry_run or not actions:
+        build_plan.print_plan(actions)
+        print(f"⏱️  planned in {(time.monotonic() - started) * 1000:.1f} ms")
+        if not args.dry_run:  # keep the file checks plan() just did
+            build_plan.save_state(state, args.state)
+    else:
+        apply_plan(manifest, actions, state, args)
+        build_plan.save_state(state, args.state)
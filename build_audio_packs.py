@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pack the audio of each chapter page into one or a few sprite files
+
+For every chapter page, the clips its play()/playAudio() buttons use are
+concatenated frame by frame (tags and LAME info frames dropped, a short
+run of silent frames between clips) into <page>.audio.mp3 next to the page,
+splitting into <page>.audio-2.mp3, ... past --max-bytes. <page>.audio.json
+maps each src exactly as the page writes it to its pack, start time and
+duration, so script.js can seek into a pack the browser already fetched
+instead of requesting every clip on its own. Clips that are missing,
+broken or in another format stay out of the pack and play from their own
+file. Clips aliased to one canonical file by audio_dedup.py share one copy
+in the pack. Rerun after regenerating audio; unchanged packs are not
+rewritten.
+"""
+import argparse
+import json
+import os
+import time
+
+import audio_dedup
+import audio_refs
+import mp3_check
+from tts_backends import FRAME_HEADER, FRAME_SIZE
+
+PACK_SUFFIX = ".audio"
+MAX_PACK_BYTES = 1536 * 1024
+GAP_FRAMES = 10  # 240 ms of silence so a late stop never reaches the next clip
+SILENT_FRAME = FRAME_HEADER + bytes(FRAME_SIZE - len(FRAME_HEADER))
+
+
+def page_sources(page):
+    """Audio srcs of one page as written, in order of first use"""
+    sources = []
+    with open(page, "r", encoding="utf-8") as f:
+        for line in f:
+            if "play" not in line:
+                continue
+            for match in audio_refs.AUDIO_CALL.finditer(line):
+                src = match.group(2)
+                if src not in sources:
+                    sources.append(src)
+    return sources
+
+
+def clip_frames(path):
+    """Frame data of a clip, or None if it can't go into a pack"""
+    if not os.path.isfile(path):
+        return None
+    result = mp3_check.scan_file(path)
+    if result["problems"]:
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    frames = mp3_check.audio_frames(data)
+    return b"".join(data[pos:pos + header["length"]] for pos, header in frames), len(frames)
+
+
+def build_page(page, max_bytes=MAX_PACK_BYTES, aliases=None):
+    """Pack bytes and the offset index for one page"""
+    base = os.path.dirname(page)
+    stem = os.path.splitext(os.path.basename(page))[0] + PACK_SUFFIX
+    frame_seconds = 576 / mp3_check.EXPECTED_FORMAT["sample_rate"]
+    gap = SILENT_FRAME * GAP_FRAMES
+
+    packs = []
+    frames_before = 0
+    index = {"packs": [], "clips": {}}
+    skipped = []
+    packed = {}  # canonical path -> index entry
+    for src in page_sources(page):
+        path = os.path.normpath(os.path.join(base, src)).replace(os.sep, "/")
+        path = (aliases or {}).get(path, path)
+        if path in packed:
+            index["clips"][src] = packed[path]
+            continue
+        clip = clip_frames(path)
+        if clip is None:
+            skipped.append(src)
+            continue
+        data, frame_count = clip
+        if not packs or (len(packs[-1]) > len(gap) and len(packs[-1]) + len(data) + len(gap) > max_bytes):
+            packs.append(bytearray(gap))
+            frames_before = GAP_FRAMES
+            index["packs"].append(f"{stem}{'' if len(packs) == 1 else f'-{len(packs)}'}.mp3")
+        pack = packs[-1]
+        index["clips"][src] = packed[path] = {
+            "pack": len(packs) - 1,
+            "start": round(frames_before * frame_seconds, 3),
+            "duration": round(frame_count * frame_seconds, 3),
+            "byteOffset": len(pack),
+            "byteLength": len(data),
+        }
+        pack += data + gap
+        frames_before += frame_count + GAP_FRAMES
+    return [bytes(p) for p in packs], index, skipped
+
+
+def _write_if_changed(path, data):
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_page(page, packs, index):
+    """Write the packs and index next to the page, drop stale extra packs"""
+    base = os.path.dirname(page)
+    stem = os.path.splitext(os.path.basename(page))[0] + PACK_SUFFIX
+    written = 0
+    for name, data in zip(index["packs"], packs):
+        written += _write_if_changed(os.path.join(base, name), data)
+    index_data = (json.dumps(index, ensure_ascii=False, indent=1) + "\n").encode("utf-8")
+    written += _write_if_changed(os.path.join(base, stem + ".json"), index_data)
+
+    number = len(packs) + 1
+    while os.path.isfile(os.path.join(base, f"{stem}-{number}.mp3")):
+        os.remove(os.path.join(base, f"{stem}-{number}.mp3"))
+        number += 1
+    return written
+
+
+def remove_page(page):
+    base = os.path.dirname(page)
+    stem = os.path.splitext(os.path.basename(page))[0] + PACK_SUFFIX
+    for name in os.listdir(base or "."):
+        if name.startswith(stem) and name.endswith((".mp3", ".json")):
+            os.remove(os.path.join(base, name))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack each chapter's audio into sprite files with an offset index")
+    parser.add_argument("dirs", nargs="*", default=list(audio_refs.CHAPTER_DIRS),
+                        help="directories of chapter pages to pack")
+    parser.add_argument("--max-bytes", type=int, default=MAX_PACK_BYTES,
+                        help="start a new pack past this size")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be packed")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    aliases = audio_dedup.load_aliases()
+    total_clips = total_bytes = changed = 0
+    for page in audio_refs.chapter_pages(args.dirs):
+        packs, index, skipped = build_page(page, args.max_bytes, aliases)
+        if not index["clips"]:
+            if not args.dry_run:
+                remove_page(page)
+            continue
+        size = sum(len(p) for p in packs)
+        total_clips += len(index["clips"])
+        total_bytes += size
+        if not args.dry_run:
+            changed += bool(write_page(page, packs, index))
+        note = f", {len(skipped)} left out" if skipped else ""
+        print(f"📦 {page:40} {len(index['clips']):3} clips in {len(packs)} pack(s) {size / 1024:6.0f} KB{note}")
+
+    elapsed = time.monotonic() - started
+    print(f"\n✅ {total_clips} clips, {total_bytes / 1024 / 1024:.1f} MB of packs, "
+          f"{changed} pages updated in {elapsed * 1000:.0f} ms")
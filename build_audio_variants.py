@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Encode smaller alternatives of every clip and list them in a manifest
+
+For each MP3 under audio/ this writes low-bitrate Opus (WebM) and a
+smaller MP3 tier to audio/variants/<tier>/<category>/, and records in
+audio-variants.json which variants exist for which clip, with their MIME
+type and size, smallest first. play() in script.js uses the smallest one
+the browser can play. Encodes run in a process pool and are cached in the
+TTS store by source hash, so only new or changed clips are encoded again.
+
+Needs the ffmpeg binary on PATH.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import audio_postprocess
+import mp3_check
+import tts_cache
+
+AUDIO_DIR = "audio"
+VARIANTS_DIR = "variants"
+MANIFEST_PATH = "audio-variants.json"
+
+# Speech-tuned encodings, each with the MIME type browsers are asked about
+TIERS = {
+    "opus": {
+        "ext": ".webm",
+        "type": 'audio/webm; codecs="opus"',
+        "args": ["-ac", "1", "-c:a", "libopus", "-b:a", "16k", "-application", "voip",
+                 "-map_metadata", "-1", "-f", "webm"],
+    },
+    "mp3-low": {
+        "ext": ".mp3",
+        "type": "audio/mpeg",
+        "args": ["-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "24k",
+                 "-map_metadata", "-1", "-id3v2_version", "0", "-write_xing", "0", "-f", "mp3"],
+    },
+}
+
+
+def tier_hash(tier):
+    return hashlib.sha256(json.dumps(TIERS[tier]).encode("utf-8")).hexdigest()[:12]
+
+
+def cached_path(source_hash, tier, cache_dir=tts_cache.CACHE_DIR):
+    return os.path.join(cache_dir, VARIANTS_DIR, source_hash[:2],
+                        f"{source_hash}.{tier}.{tier_hash(tier)}{TIERS[tier]['ext']}")
+
+
+def variant_path(path, tier, audio_dir=AUDIO_DIR):
+    """audio/vocab/brot.mp3 -> audio/variants/opus/vocab/brot.webm"""
+    relative = os.path.relpath(path, audio_dir)
+    return os.path.join(audio_dir, VARIANTS_DIR, tier, os.path.splitext(relative)[0] + TIERS[tier]["ext"])
+
+
+def encode(task):
+    """Encode one clip into one tier's cache object"""
+    src, tier, dest, ffmpeg = task
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    error = audio_postprocess.run_ffmpeg(ffmpeg, src, tmp, TIERS[tier]["args"])
+    if error is None and not os.path.getsize(tmp):
+        os.remove(tmp)
+        error = "empty output"
+    if error is None:
+        os.replace(tmp, dest)
+    return {"path": src, "tier": tier, "error": error}
+
+
+def _place(cached, dest):
+    """Link the cached encode to dest unless it is already there"""
+    if os.path.exists(dest) and (os.path.samefile(cached, dest) or
+                                 audio_postprocess.file_hash(cached) == audio_postprocess.file_hash(dest)):
+        return False
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    tts_cache._link_or_copy(cached, tmp)
+    os.replace(tmp, dest)
+    return True
+
+
+def build_manifest(sources, audio_dir=AUDIO_DIR, tiers=TIERS):
+    """Variants smaller than their source, smallest first, keyed by site path"""
+    clips = {}
+    for path, source_hash in sources.items():
+        size = os.path.getsize(path)
+        variants = []
+        for tier in tiers:
+            dest = variant_path(path, tier, audio_dir)
+            if os.path.exists(dest) and os.path.getsize(dest) < size:
+                variants.append({"url": dest.replace(os.sep, "/"), "type": TIERS[tier]["type"],
+                                 "size": os.path.getsize(dest)})
+        if variants:
+            variants.sort(key=lambda v: v["size"])
+            clips[path.replace(os.sep, "/")] = {"hash": source_hash[:12], "size": size,
+                                                "variants": variants}
+    return {"version": 1, "clips": clips}
+
+
+def remove_stale(sources, audio_dir=AUDIO_DIR):
+    """Delete variants whose source clip is gone"""
+    wanted = {variant_path(path, tier, audio_dir) for path in sources for tier in TIERS}
+    removed = 0
+    for tier in TIERS:
+        for path in glob.glob(os.path.join(audio_dir, VARIANTS_DIR, tier, "*", "*")):
+            if path not in wanted:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Encode smaller variants of every clip")
+    parser.add_argument("--audio-dir", default=AUDIO_DIR)
+    parser.add_argument("--cache-dir", default=tts_cache.CACHE_DIR)
+    parser.add_argument("--manifest", default=MANIFEST_PATH)
+    parser.add_argument("--tier", action="append", choices=sorted(TIERS),
+                        help="only build these tiers (repeatable; default: all)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--ffmpeg", default=audio_postprocess.FFMPEG, help="ffmpeg binary")
+    args = parser.parse_args()
+
+    if shutil.which(args.ffmpeg) is None:
+        print(f"❌ {args.ffmpeg} not found; install ffmpeg to encode variants")
+        raise SystemExit(1)
+
+    tiers = args.tier or list(TIERS)
+    started = time.monotonic()
+    sources = {}
+    for path in sorted(glob.glob(os.path.join(args.audio_dir, "*", "*.mp3"))):
+        if os.path.getsize(path) and not mp3_check.is_broken(mp3_check.scan_file(path)):
+            sources[path] = audio_postprocess.file_hash(path)
+
+    tasks = {}
+    for path, source_hash in sources.items():
+        for tier in tiers:
+            cached = cached_path(source_hash, tier, args.cache_dir)
+            if not os.path.exists(cached):
+                tasks.setdefault(cached, (path, tier, cached, args.ffmpeg))
+    print(f"🎛️  {len(sources)} clips x {len(tiers)} tiers: {len(tasks)} encodes needed")
+
+    errors = 0
+    if tasks:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for result in pool.map(encode, tasks.values(), chunksize=8):
+                if result["error"]:
+                    errors += 1
+                    print(f"❌ {result['path']} ({result['tier']}): {result['error']}")
+
+    placed = 0
+    for path, source_hash in sources.items():
+        for tier in tiers:
+            cached = cached_path(source_hash, tier, args.cache_dir)
+            if os.path.exists(cached):
+                placed += _place(cached, variant_path(path, tier, args.audio_dir))
+    removed = remove_stale(sources, args.audio_dir)
+
+    manifest = build_manifest(sources, args.audio_dir, tiers)
+    with open(args.manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))  # fetched by every page
+        f.write("\n")
+
+    source_bytes = sum(os.path.getsize(p) for p in sources)
+    smallest = sum(c["variants"][0]["size"] for c in manifest["clips"].values())
+    smallest += sum(os.path.getsize(p) for p in sources if p.replace(os.sep, "/") not in manifest["clips"])
+    elapsed = time.monotonic() - started
+    print(f"\n✅ {placed} variants updated, {removed} stale removed, ❌ {errors} errors in {elapsed:.1f}s")
+    print(f"💾 {source_bytes / 1024 / 1024:.1f} MB of MP3 -> {smallest / 1024 / 1024:.1f} MB "
+          f"with the smallest variants")
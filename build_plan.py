@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental audio build planner
+
+Compares the corpus manifest with the persisted build state (which text
+and voice settings produced each output file, and that file's size and
+mtime) and emits the minimal list of actions:
+
+    synthesize  clip text/voice changed and the result is not in the store,
+                or the file (and its store object) is empty or broken
+    relink      the result is in the store but audio/ has a stale or no file
+    adopt       a valid file in audio/ has no state entry (a fresh checkout)
+                and no store object: it is taken as the result for its clip
+    delete      a file in audio/ no longer belongs to any manifest clip
+    missing     a clip without source text whose recording is gone
+
+An up-to-date tree costs one stat() per clip and no hashing of audio:
+each file's frames are checked once, when it is recorded in the state,
+so a truncated file can't be treated as done forever.
+"""
+import hashlib
+import json
+import os
+
+import corpus
+import mp3_check
+import tts_cache
+
+STATE_PATH = "audio_build_state.json"
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["clips"]
+
+
+def save_state(state, path=STATE_PATH):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "clips": state}, f, ensure_ascii=False,
+                  indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def text_hash(text):
+    return hashlib.sha256(tts_cache.normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def state_entry(clip, key, path):
+    """What the state file remembers about a materialized clip"""
+    st = os.stat(path)
+    entry = {"key": key, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "valid": is_valid(path)}
+    if clip["text"] is not None:
+        entry["text_hash"] = text_hash(clip["text"])
+        entry.update({field: clip[field] for field in corpus.VOICE_FIELDS})
+    return entry
+
+
+def is_valid(path):
+    return not mp3_check.is_broken(mp3_check.scan_file(path))
+
+
+def _is_current(entry, key, path):
+    if entry is None or entry["key"] != key:
+        return False
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+
+def plan(manifest, state, clips=None, audio_dir=corpus.AUDIO_DIR,
+         cache_dir=tts_cache.CACHE_DIR, prune=True):
+    """List the actions that bring audio_dir in line with the manifest
+
+    `clips` restricts planning to a subset; orphaned files are only
+    reported for deletion when planning the whole manifest with prune.
+    """
+    actions = []
+    adopted = set()  # keys a clip earlier in the plan adopts; later clips relink to it
+    for clip in manifest.clips if clips is None else clips:
+        path = corpus.clip_path(clip, audio_dir)
+        entry = state.get(clip["id"])
+        if clip["text"] is None:
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                actions.append({"action": "missing", "id": clip["id"], "path": path})
+            continue
+        key = tts_cache.cache_key(manifest.jobs([clip], audio_dir)[0])
+        if _is_current(entry, key, path):
+            if "valid" not in entry:  # recorded before files were checked
+                entry["valid"] = is_valid(path)
+            if entry["valid"] and entry["size"]:
+                continue
+            broken = True  # the store object is this same file
+        elif key in adopted:
+            actions.append({"action": "relink", "id": clip["id"], "path": path, "key": key, "broken": False})
+            continue
+        elif entry is None and not tts_cache.has(key, cache_dir) and os.path.exists(path) and is_valid(path):
+            adopted.add(key)
+            actions.append({"action": "adopt", "id": clip["id"], "path": path, "key": key, "broken": False})
+            continue
+        else:
+            broken = tts_cache.has(key, cache_dir) and not is_valid(tts_cache.object_path(key, cache_dir))
+        action = "relink" if tts_cache.has(key, cache_dir) and not broken else "synthesize"
+        actions.append({"action": action, "id": clip["id"], "path": path, "key": key, "broken": broken})
+
+    if clips is None and prune:
+        for category in corpus.CATEGORIES:
+            category_dir = os.path.join(audio_dir, category)
+            if not os.path.isdir(category_dir):
+                continue
+            for entry in os.scandir(category_dir):
+                if not entry.name.endswith(".mp3"):
+                    continue
+                clip_id = f"{category}/{entry.name[:-4]}"
+                if clip_id not in manifest.by_id:
+                    actions.append({"action": "delete", "id": clip_id,
+                                    "path": f"{audio_dir}/{clip_id}.mp3"})
+    return actions
+
+
+def print_plan(actions):
+    icons = {"synthesize": "🔊", "relink": "🔗", "adopt": "📥", "delete": "🗑️ ", "missing": "❓"}
+    for action in actions:
+        note = " (broken)" if action.get("broken") else ""
+        print(f"{icons[action['action']]} {action['action']:10} {action['path']}{note}")
+    counts = {}
+    for action in actions:
+        counts[action["action"]] = counts.get(action["action"], 0) + 1
+    summary = ", ".join(f"{name} {count}" for name, count in sorted(counts.items()))
+    print(f"📋 {len(actions)} actions" + (f" ({summary})" if summary else " - up to date"))
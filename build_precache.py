@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate the service-worker precache manifest
+
+Crawls the site from index.html (links, scripts, styles, web app manifest
+icons) and lists every reachable asset with its content hash and size in
+precache-manifest.js, which sw.js loads with importScripts(). Pages, styles,
+scripts and icons form the "shell" installed up front; the audio the pages
+reference, with their smaller encodings from audio-variants.json, forms the
+"audio" group, and each chapter page's audio (its packs from
+build_audio_packs.py, then any clips not in a pack) is listed in order for
+the worker's prefetcher. The cache version is a hash of all
+entries, so the worker updates exactly when an asset changes and only
+re-downloads the assets whose hash changed. Rerun it after editing any page
+or asset.
+"""
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+
+import audio_refs
+import build_audio_packs
+
+ROOT = "."
+ENTRY_PAGES = ("index.html",)
+OUTPUT = "precache-manifest.js"
+HASH_LENGTH = 12
+VARIANTS_MANIFEST = "audio-variants.json"
+
+LINK = re.compile(r"""\b(?:href|src)\s*=\s*["']([^"'#?]+)""")
+EXTERNAL = ("http:", "https:", "mailto:", "javascript:", "data:", "//")
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+
+def _local_links(path, root):
+    """Site-relative paths referenced by one HTML page or the web app manifest"""
+    base = posixpath.dirname(path)
+    full = os.path.join(root, path)
+    with open(full, "r", encoding="utf-8") as f:
+        text = f.read()
+    if path.endswith(".json"):
+        links = [icon["src"] for icon in json.loads(text).get("icons", [])]
+    else:
+        links = LINK.findall(text)
+    for link in links:
+        if link.startswith(EXTERNAL) or not link.strip():
+            continue
+        yield posixpath.normpath(posixpath.join(base, link))
+
+
+def crawl(root=ROOT, entry_pages=ENTRY_PAGES):
+    """Every local file reachable from the entry pages, in discovery order"""
+    seen = []
+    queue = list(entry_pages)
+    while queue:
+        path = queue.pop(0)
+        if path in seen or not os.path.isfile(os.path.join(root, path)):
+            continue
+        seen.append(path)
+        if path.endswith((".html", "manifest.json")):
+            queue.extend(_local_links(path, root))
+    return seen
+
+
+def chapter_audio(page, root=ROOT):
+    """Site-relative audio files one page plays: pack index and packs first"""
+    base = posixpath.dirname(page)
+    full = os.path.join(root, page)
+    files = []
+    packed = set()
+    index_path = os.path.splitext(page)[0] + build_audio_packs.PACK_SUFFIX + ".json"
+    if os.path.isfile(os.path.join(root, index_path)):
+        with open(os.path.join(root, index_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        files.append(index_path)
+        files += [posixpath.join(base, name) for name in index["packs"]]
+        packed = set(index["clips"])
+    for src in build_audio_packs.page_sources(full):
+        path = posixpath.normpath(posixpath.join(base, src))
+        if src not in packed and path not in files and os.path.isfile(os.path.join(root, path)):
+            files.append(path)
+    return files
+
+
+def build_manifest(root=ROOT, entry_pages=ENTRY_PAGES):
+    shell = crawl(root, entry_pages)
+    pages = [os.path.join(root, p) for p in shell if p.endswith(".html")]
+    refs, _ = audio_refs.build_index(pages)
+    audio = sorted(
+        posixpath.relpath(path.replace(os.sep, "/"), root.replace(os.sep, "/"))
+        for path in refs
+        if os.path.isfile(path)
+    )
+    variants_path = os.path.join(root, VARIANTS_MANIFEST)
+    if os.path.isfile(variants_path):
+        shell.append(VARIANTS_MANIFEST)
+        with open(variants_path, "r", encoding="utf-8") as f:
+            variants = json.load(f)["clips"]
+        audio += [
+            variant["url"]
+            for path in audio
+            for variant in variants.get(path, {}).get("variants", [])
+            if os.path.isfile(os.path.join(root, variant["url"]))
+        ]
+
+    chapters = []
+    for page in shell:
+        files = chapter_audio(page, root) if page.endswith(".html") else []
+        if files:
+            chapters.append({"page": f"./{page}", "audio": [f"./{path}" for path in files]})
+            audio += [path for path in files if path not in audio]
+
+    assets = []
+    for group, paths in (("shell", shell), ("audio", audio)):
+        for path in paths:
+            full = os.path.join(root, path)
+            assets.append({"url": f"./{path}", "hash": file_hash(full),
+                           "size": os.path.getsize(full), "group": group})
+    version = hashlib.sha256(
+        "".join(f"{a['url']}:{a['hash']}\n" for a in assets).encode("utf-8")
+    ).hexdigest()[:HASH_LENGTH]
+    return {"version": version, "assets": assets, "chapters": chapters}
+
+
+def write_manifest(manifest, path):
+    lines = [
+        "// Generated by build_precache.py - do not edit",
+        "self.PRECACHE_MANIFEST = {",
+        f'  "version": "{manifest["version"]}",',
+        '  "assets": [',
+    ]
+    lines += [
+        "    " + json.dumps(asset, ensure_ascii=False) + ("," if i < len(manifest["assets"]) - 1 else "")
+        for i, asset in enumerate(manifest["assets"])
+    ]
+    lines += ["  ],", '  "chapters": [']
+    lines += [
+        "    " + json.dumps(chapter, ensure_ascii=False) + ("," if i < len(manifest["chapters"]) - 1 else "")
+        for i, chapter in enumerate(manifest["chapters"])
+    ]
+    lines += ["  ]", "};"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the service-worker precache manifest")
+    parser.add_argument("--root", default=ROOT, help="site root to crawl")
+    parser.add_argument("--output", default=None, help=f"default: <root>/{OUTPUT}")
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.root)
+    output = args.output or os.path.join(args.root, OUTPUT)
+    write_manifest(manifest, output)
+    for group in ("shell", "audio"):
+        assets = [a for a in manifest["assets"] if a["group"] == group]
+        print(f"📦 {group:5}: {len(assets):4} assets, {sum(a['size'] for a in assets) / 1024:8.0f} KB")
+    print(f"✅ Wrote {output} (version {manifest['version']})")
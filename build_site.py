@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build the deployable site into dist/
+
+Chapter pages are rendered from templates/chapter.html and the per-chapter
+data in chapters.json (page title, header title; prev/next follow the list
+order). Each chapter exists in up to three source trees (content/,
+chapters/, chapters/content/); the one whose lesson content has the fewest
+links and audio calls that don't resolve is used, preferring that order on
+ties, and a unified diff of every copy that differs from it is written to
+chapter-divergence.diff. The lesson content is taken from the chosen page,
+with the navigation header, notes panel and script includes stripped, and
+its audio calls are pointed at the canonical clips from audio-aliases.json.
+Rendering runs in a process pool, and a chapter is skipped when the hash
+of its inputs (template, data, source page, alias map, asset names, the
+build code) matches the last build. Everything else the site links to -
+index.html, styles, scripts, icons, the referenced audio and its variants -
+is hardlinked into dist/, each chapter's audio packs are built from its
+page in dist/, files that are no longer part of the site are removed, and
+the precache manifest is generated for the result. Styles,
+scripts and audio get content-hashed names and every reference to them is
+rewritten (see fingerprint_assets.py), with a _headers file marking them
+immutable. HTML, CSS, JS and JSON are written minified (see
+minify_assets.py) instead of linked, and .gz/.br siblings of the text
+assets are written in a process pool, with a report of the bytes saved per
+asset class. Finally every page in dist/ is checked for links that don't
+resolve inside dist/, which fail the build, and for audio calls whose clip
+has not been generated yet, which are reported.
+
+This replaces fix-headers.ps1 and update-chapter-headers.ps1, which patched
+the headers of the chapter pages in place.
+"""
+import argparse
+import difflib
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from string import Template
+
+import audio_dedup
+import audio_refs
+import build_audio_packs
+import build_precache
+import fingerprint_assets
+import minify_assets
+import tts_cache
+
+DIST = "dist"
+CHAPTERS_DATA = "chapters.json"
+TEMPLATE = os.path.join("templates", "chapter.html")
+SOURCE_DIRS = ("content", "chapters", os.path.join("chapters", "content"))  # preferred first
+OUTPUT_DIR = "content"  # where index.html links the chapters
+STATE_FILE = ".build-state.json"  # outside dist/, which is published
+REPORT = "chapter-divergence.diff"
+EXTRA_FILES = ("sw.js",)  # registered from script, not linked
+HEADERS = "_headers"  # per-path response headers, for hosts that read them
+
+BODY = re.compile(r"<body[^>]*>(.*)</body>", re.S)
+TOP_NAV = re.compile(r'\s*<nav class="chapter-nav">.*?</nav>', re.S)
+INCLUDES = re.compile(r'\n?[ \t]*<script src="[^"]*\b(?:script|chapter)\.js"[^>]*></script>')
+WRAPPER = '<div class="content-wrapper">'
+
+
+def load_chapters(path=CHAPTERS_DATA):
+    """Chapter data in reading order, with prev/next filled in"""
+    with open(path, "r", encoding="utf-8") as f:
+        chapters = json.load(f)["chapters"]
+    for i, chapter in enumerate(chapters):
+        chapter["prev"] = chapters[i - 1]["id"] if i > 0 else None
+        chapter["next"] = chapters[i + 1]["id"] if i + 1 < len(chapters) else None
+    return chapters
+
+
+def lesson_content(text):
+    """The lesson part of a chapter page, without the page chrome"""
+    match = BODY.search(text)
+    body = match.group(1) if match else text
+    body = body.split("<!-- Notes Panel -->")[0]
+    body = TOP_NAV.sub("", body, count=1)
+    body = INCLUDES.sub("", body).strip()
+    if body.startswith(WRAPPER) and body.endswith("</div>"):
+        body = body[len(WRAPPER):-len("</div>")].strip()
+    return "    " + body
+
+
+def nav_links(chapter):
+    links = []
+    if chapter["prev"]:
+        links.append(f'            <a href="{chapter["prev"]}.html" class="nav-btn">← ก่อนหน้า</a>')
+    links.append(f'            <span class="nav-title-mobile">{html.escape(chapter["nav_title"])}</span>')
+    if chapter["next"]:
+        links.append(f'            <a href="{chapter["next"]}.html" class="nav-btn">ถัดไป →</a>')
+    return "\n".join(links)
+
+
+def output_page(chapter):
+    """Site-relative path of a rendered chapter"""
+    return f"{OUTPUT_DIR}/{chapter['id']}.html"
+
+
+def source_page(chapter):
+    return chapter["source"]
+
+
+def page_links(text, page):
+    """Site-relative paths of a page's href/src links and of the clips it plays"""
+    base = posixpath.dirname(page)
+    links = [link for link in build_precache.LINK.findall(text)
+             if link.strip() and not link.startswith(build_precache.EXTERNAL)]
+    clips = [match.group(2) for match in audio_refs.AUDIO_CALL.finditer(text)]
+    return ([posixpath.normpath(posixpath.join(base, link)) for link in links],
+            [posixpath.normpath(posixpath.join(base, clip)) for clip in clips])
+
+
+def select_sources(chapters, root="."):
+    """Pick each chapter's source page; returns the divergence report lines
+
+    Links are resolved from where the chapter is published, against the
+    source files and the other chapters.
+    """
+    pages = {output_page(chapter) for chapter in chapters}
+    report = []
+    for chapter in chapters:
+        name = f"{chapter['id']}.html"
+        candidates = []
+        for rank, directory in enumerate(SOURCE_DIRS):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(os.path.join(root, path)):
+                continue
+            with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+                content = lesson_content(f.read())
+            links, clips = page_links(content, output_page(chapter))
+            broken = [link for link in links + clips
+                      if link not in pages and not os.path.isfile(os.path.join(root, link))]
+            candidates.append((len(broken), rank, path, content, broken))
+        if not candidates:
+            raise SystemExit(f"❌ No source page for {chapter['id']} in {', '.join(SOURCE_DIRS)}")
+        candidates.sort(key=lambda c: c[:2])
+        _, _, chapter["source"], chosen, broken = candidates[0]
+        others = []
+        diffs = []
+        for _, _, path, content, other_broken in candidates[1:]:
+            if content == chosen:
+                others.append(f"{path} (same)")
+                continue
+            others.append(f"{path} ({len(other_broken)} unresolved)")
+            diffs += difflib.unified_diff(chosen.splitlines(), content.splitlines(),
+                                          chapter["source"], path, lineterm="")
+        report.append(f"# {chapter['id']}: {chapter['source']} ({len(broken)} unresolved); "
+                      f"not used: {', '.join(others) or '-'}")
+        report += diffs
+    return report
+
+
+# The rendering code is an input too: this script and the modules render_chapter() runs
+RENDER_CODE = (__file__,) + tuple(module.__file__ for module in (
+    audio_dedup, audio_refs, build_audio_packs, build_precache, fingerprint_assets, minify_assets))
+
+
+def input_hash(chapter, template, aliases, renames, minify=True):
+    digest = hashlib.sha256()
+    digest.update(json.dumps([chapter, template, aliases, renames, minify], sort_keys=True).encode("utf-8"))
+    for path in (source_page(chapter),) + RENDER_CODE:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def render_chapter(task):
+    """Render one chapter into dist; returns its page and audio list"""
+    chapter, template, aliases, renames, dist, minify = task
+    with open(source_page(chapter), "r", encoding="utf-8") as f:
+        content = lesson_content(f.read())
+    page = output_page(chapter)
+    content, _ = audio_dedup.rewrite_text(content, page, aliases)
+    audio = sorted({
+        os.path.normpath(os.path.join(OUTPUT_DIR, match.group(2))).replace(os.sep, "/")
+        for match in audio_refs.AUDIO_CALL.finditer(content)
+    })
+    # Only pages with audio get a pack index (build_packs); script.js fetches none without it
+    audio_pack = f' data-audio-pack="{chapter["id"]}{build_audio_packs.PACK_SUFFIX}.json"' if audio else ""
+    text = Template(template).substitute(
+        id=chapter["id"], title=html.escape(chapter["title"]), nav_links=nav_links(chapter), content=content,
+        audio_pack=audio_pack)
+    path = os.path.join(dist, page)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    data = fingerprint_assets.rewrite(page, text.encode("utf-8"), renames)
+    with open(tmp, "wb") as f:
+        f.write(minify_assets.minify(path, data) if minify else data)
+    os.replace(tmp, path)
+    return {"page": page, "audio": audio}
+
+
+def page_audio(path, root):
+    """Site-relative audio files one page plays"""
+    full = os.path.join(root, path)
+    return {
+        os.path.relpath(resolved, root).replace(os.sep, "/")
+        for resolved, _ in audio_refs.index_page(full)
+    }
+
+
+def site_files(rendered, renames, dist=DIST, root="."):
+    """{source file: path in dist} of the files the site uses
+
+    Links of the rendered pages in dist are followed by their source names.
+    """
+    original = {hashed: path for path, hashed in renames.items()}
+    files = []
+    seen = set()
+    audio = set()
+    queue = list(build_precache.ENTRY_PAGES) + list(EXTRA_FILES)
+    while queue:
+        path = queue.pop(0)
+        if path in seen:
+            continue
+        seen.add(path)
+        base = dist if path in rendered else root
+        if not os.path.isfile(os.path.join(base, path)):
+            continue
+        if path not in rendered and path != build_precache.OUTPUT:  # regenerated for dist
+            files.append(path)
+        if path.endswith(".html"):
+            audio |= {original.get(p, p) for p in page_audio(path, base)}
+        if path.endswith((".html", "manifest.json")):
+            queue.extend(original.get(p, p) for p in build_precache._local_links(path, base))
+    audio = sorted(path for path in audio if os.path.isfile(os.path.join(root, path)))
+    variants_path = os.path.join(root, build_precache.VARIANTS_MANIFEST)
+    if os.path.isfile(variants_path):
+        with open(variants_path, "r", encoding="utf-8") as f:
+            variants = json.load(f)["clips"]
+        files.append(build_precache.VARIANTS_MANIFEST)
+        files += [
+            variant["url"]
+            for path in audio
+            for variant in variants.get(path, {}).get("variants", [])
+            if os.path.isfile(os.path.join(root, variant["url"]))
+        ]
+    return {path: renames.get(path, path) for path in files + audio}
+
+
+def sync_files(files, renames, dist=DIST, root=".", minify=True):
+    """Hardlink (or write rewritten and minified) files into dist unless already there; returns the count"""
+    updated = 0
+    for path, target in files.items():
+        src, dest = os.path.join(root, path), os.path.join(dist, target)
+        if (minify or renames) and path.lower().endswith(minify_assets.MINIFIED):
+            with open(src, "rb") as f:
+                data = fingerprint_assets.rewrite(path, f.read(), renames)
+            if minify:
+                data = minify_assets.minify(path, data)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            updated += build_audio_packs._write_if_changed(dest, data)
+            continue
+        if os.path.exists(dest) and (os.path.samefile(src, dest) or
+                                     build_precache.file_hash(src) == build_precache.file_hash(dest)):
+            continue
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        tts_cache._link_or_copy(src, dest)
+        updated += 1
+    return updated
+
+
+def build_packs(rendered, dist=DIST, minify=True, fingerprint=True):
+    """Pack each rendered page's audio next to it in dist; returns the files written there
+
+    The packs are built from the pages in dist, so their indexes are keyed
+    by the srcs the deployed pages play. With fingerprint, the pack files
+    get content-hashed names like the other audio; the index keeps its
+    name, script.js and sw.js derive it from the page. Every page that plays
+    audio gets an index, empty if none of its clips could be packed, since
+    render_chapter() points the page at it.
+    """
+    files = []
+    for page in sorted(rendered):
+        packs, index, skipped = build_audio_packs.build_page(os.path.join(dist, page))
+        if not index["clips"] and not skipped:
+            continue
+        if fingerprint:
+            index["packs"] = [fingerprint_assets.hashed_name(name, pack)
+                              for name, pack in zip(index["packs"], packs)]
+        base = posixpath.dirname(page)
+        index_path = posixpath.splitext(page)[0] + build_audio_packs.PACK_SUFFIX + ".json"
+        data = (json.dumps(index, ensure_ascii=False, indent=1) + "\n").encode("utf-8")
+        build_audio_packs._write_if_changed(os.path.join(dist, index_path),
+                                            minify_assets.minify(index_path, data) if minify else data)
+        for name, pack in zip(index["packs"], packs):
+            build_audio_packs._write_if_changed(os.path.join(dist, base, name), pack)
+        files += [index_path] + [posixpath.join(base, name) for name in index["packs"]]
+    return files
+
+
+def prune(dist, keep):
+    """Delete files in dist that are not part of this build"""
+    removed = 0
+    for directory, dirs, names in os.walk(dist, topdown=False):
+        for name in names:
+            path = os.path.relpath(os.path.join(directory, name), dist).replace(os.sep, "/")
+            if path not in keep:
+                os.remove(os.path.join(directory, name))
+                removed += 1
+        if directory != dist and not os.listdir(directory):
+            os.rmdir(directory)
+    return removed
+
+
+def _read_state(path=STATE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_state(dist=DIST):
+    """Input hashes of the chapters last rendered into dist"""
+    return _read_state().get(os.path.normpath(dist), {})
+
+
+def check_links(dist=DIST):
+    """(page, target) pairs of links and of audio calls in dist that don't resolve"""
+    broken, silent = [], []
+    for directory, _, names in os.walk(dist):
+        for name in sorted(names):
+            if not name.endswith(".html"):
+                continue
+            page = os.path.relpath(os.path.join(directory, name), dist).replace(os.sep, "/")
+            with open(os.path.join(dist, page), "r", encoding="utf-8") as f:
+                text = f.read()
+            links, clips = page_links(text, page)
+            broken += [(page, link) for link in links if not os.path.isfile(os.path.join(dist, link))]
+            silent += [(page, clip) for clip in clips if not os.path.isfile(os.path.join(dist, clip))]
+    return sorted(set(broken)), sorted(set(silent))
+
+
+def save_state(state, dist=DIST, path=STATE_FILE):
+    states = _read_state(path)
+    states[os.path.normpath(dist)] = state
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(states, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the deployable site into dist/")
+    parser.add_argument("--dist", default=DIST, help="output directory")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="render every chapter, ignoring the last build")
+    parser.add_argument("--no-minify", action="store_true", help="copy text assets as written")
+    parser.add_argument("--no-fingerprint", action="store_true", help="keep the assets' own file names")
+    parser.add_argument("--report", default=REPORT, help="where to write the chapter divergence report")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    os.makedirs(args.dist, exist_ok=True)
+    chapters = load_chapters()
+    report = select_sources(chapters)
+    diverged = len({line.split(" ", 2)[1] for line in report if line.startswith("--- ")})
+    print("🔀 Sources: " + ", ".join(
+        f"{sum(os.path.dirname(c['source']) == d for c in chapters)} from {d}/" for d in SOURCE_DIRS
+    ) + f"; {diverged} chapters diverge between trees ({args.report})")
+    with open(TEMPLATE, "r", encoding="utf-8") as f:
+        template = f.read()
+    aliases, stale = audio_dedup.checked_aliases()
+    if stale:
+        print(f"⚠️  {len(stale)} audio aliases no longer match their canonical clip and are ignored "
+              f"(rerun audio_dedup.py): {', '.join(sorted(stale))}")
+    state = {} if args.force else load_state(args.dist)
+
+    minify = not args.no_minify
+    renames = {} if args.no_fingerprint else fingerprint_assets.build_renames(".", minify)
+    hashes = {chapter["id"]: input_hash(chapter, template, aliases, renames, minify) for chapter in chapters}
+    tasks = [
+        (chapter, template, aliases, renames, args.dist, minify)
+        for chapter in chapters
+        if state.get(chapter["id"]) != hashes[chapter["id"]]
+        or not os.path.exists(os.path.join(args.dist, output_page(chapter)))
+    ]
+    print(f"📄 {len(chapters)} chapters: {len(tasks)} to render, {len(chapters) - len(tasks)} unchanged")
+    if tasks:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for result in pool.map(render_chapter, tasks):
+                print(f"  ✏️  {result['page']} ({len(result['audio'])} clips)")
+    save_state(hashes, args.dist)
+
+    rendered = {output_page(chapter) for chapter in chapters}
+    files = site_files(rendered, renames, args.dist)
+    updated = sync_files(files, renames, args.dist, minify=minify)
+    packs = build_packs(rendered, args.dist, minify, fingerprint=bool(renames))
+    keep = set(files.values()) | rendered | set(packs) | {build_precache.OUTPUT, HEADERS}
+    fingerprinted = {target for path, target in files.items() if target != path}
+    fingerprinted |= {path for path in packs if renames and path.endswith(".mp3")}
+    served = keep - fingerprinted - {HEADERS}
+    updated += build_audio_packs._write_if_changed(
+        os.path.join(args.dist, HEADERS), fingerprint_assets.headers(fingerprinted, served).encode("utf-8"))
+    removed = prune(args.dist, keep | minify_assets.sibling_paths(keep))
+
+    used = set(files) | {os.path.normpath(chapter["source"]) for chapter in chapters}
+    unused = [page for page in audio_refs.chapter_pages(SOURCE_DIRS) if os.path.normpath(page) not in used]
+    report.append(f"# not deployed: {', '.join(unused) or '-'}")
+    with open(args.report, "w", encoding="utf-8") as f:
+        f.write("\n".join(report) + "\n")
+
+    manifest = build_precache.build_manifest(args.dist)
+    output = os.path.join(args.dist, build_precache.OUTPUT)
+    build_precache.write_manifest(manifest, output + ".tmp")
+    with open(output + ".tmp", "rb") as f:
+        data = f.read()
+    os.remove(output + ".tmp")
+    build_audio_packs._write_if_changed(output, minify_assets.minify(output, data) if minify else data)
+    compressed = minify_assets.compress_tree(args.dist, args.workers)
+
+    size = sum(asset["size"] for asset in manifest["assets"])
+    elapsed = time.monotonic() - started
+    print(f"🔗 {len(files)} files linked ({updated} updated, {len(fingerprinted)} fingerprinted), "
+          f"📦 {len(packs)} pack files, 🗑️  {removed} removed; "
+          f"{len(unused)} source pages ({sum(map(os.path.getsize, unused)) / 1024:.0f} KB) not deployed")
+    original = {target: os.path.getsize(path) for path, target in files.items()}
+    original.update({output_page(chapter): os.path.getsize(chapter["source"]) for chapter in chapters})
+    print(f"🗜️  {compressed} files compressed" +
+          ("" if minify_assets.brotli else " (gzip only: pip install brotli for .br)"))
+    minify_assets.print_report(minify_assets.size_report(args.dist, original))
+    print(f"✅ Built {args.dist}/: {len(manifest['assets'])} assets, {size / 1024 / 1024:.1f} MB "
+          f"(precache version {manifest['version']}) in {elapsed:.1f}s")
+
+    broken, silent = check_links(args.dist)
+    for page, link in broken:
+        print(f"❌ {page}: {link} does not exist")
+    for page in sorted({page for page, _ in silent}):
+        print(f"⚠️  {page}: {sum(p == page for p, _ in silent)} clips not generated yet")
+    if broken:
+        sys.exit(1)
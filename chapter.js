@@ -0,0 +1,45 @@
+// Notes panel and progress for chapter pages. The chapter id comes from the
+// script tag, <script src="../chapter.js" data-chapter="chapter05">, falling
+// back to the page's file name, and keys notes_<id> / progress_<id> in
+// localStorage.
+const CHAPTER_ID = (document.currentScript && document.currentScript.dataset.chapter) ||
+  (location.pathname.match(/(chapter\d+)\.html?$/) || [])[1] || 'chapter';
+
+// Notes functionality
+function toggleNotes() {
+  const panel = document.getElementById('notes-panel');
+  panel.classList.toggle('open');
+  loadNotes();
+}
+
+function saveNotes() {
+  const content = document.getElementById('notes-content').value;
+  localStorage.setItem('notes_' + CHAPTER_ID, content);
+  alert('✅ บันทึกแล้ว!');
+}
+
+function loadNotes() {
+  const saved = localStorage.getItem('notes_' + CHAPTER_ID);
+  if (saved) {
+    document.getElementById('notes-content').value = saved;
+  }
+}
+
+function clearNotes() {
+  if (confirm('คุณต้องการลบบันทึกใช่หรือไม่?')) {
+    document.getElementById('notes-content').value = '';
+    localStorage.removeItem('notes_' + CHAPTER_ID);
+    alert('🗑️ ลบแล้ว!');
+  }
+}
+
+// Update progress
+function updateProgress() {
+  localStorage.setItem('progress_' + CHAPTER_ID, '100');
+}
+
+// Auto-load notes on page load
+document.addEventListener('DOMContentLoaded', loadNotes);
+
+// Mark as visited
+setTimeout(updateProgress, 5000);
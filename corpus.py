@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpus manifest loader
+
+audio_manifest.json is the single source of truth for every clip under
+audio/: its id (path below audio/ without .mp3), category, chapter, text
+and voice settings. Clips with "text": null were recorded before their
+source text was tracked; they are kept and served but cannot be
+regenerated. "groups" records the clip sets of the old generator scripts.
+"""
+import argparse
+import json
+import os
+
+import tts_engine
+
+MANIFEST_PATH = "audio_manifest.json"
+AUDIO_DIR = "audio"
+CATEGORIES = ("alphabet", "pronunciation", "vocab", "sentences", "dialogues")
+VOICE_FIELDS = ("voice", "rate", "pitch", "volume")
+
+
+def clip_path(clip, audio_dir=AUDIO_DIR):
+    """Output file of a clip"""
+    return f"{audio_dir}/{clip['id']}.mp3"
+
+
+class Corpus:
+    """In-memory index of the manifest: O(1) lookup by id and by chapter"""
+
+    def __init__(self, data):
+        self.defaults = data["defaults"]
+        self.groups = data.get("groups", {})
+        self.clips = []
+        self.by_id = {}
+        self.by_chapter = {}
+        for entry in data["clips"]:
+            clip = {**self.defaults, **entry}
+            if clip["id"] in self.by_id:
+                raise ValueError(f"Duplicate clip id in manifest: {clip['id']}")
+            if clip["category"] not in CATEGORIES:
+                raise ValueError(f"Unknown category for {clip['id']}: {clip['category']}")
+            self.clips.append(clip)
+            self.by_id[clip["id"]] = clip
+            self.by_chapter.setdefault(clip["chapter"], []).append(clip)
+
+    def get(self, clip_id):
+        return self.by_id[clip_id]
+
+    def chapter(self, number):
+        return self.by_chapter.get(number, [])
+
+    def select(self, chapters=None, categories=None, group=None):
+        """Clips matching all given filters, in manifest order"""
+        clips = self.clips
+        if group is not None:
+            clips = [self.by_id[clip_id] for clip_id in self.groups[group]]
+        if chapters is not None:
+            clips = [c for c in clips if c["chapter"] in chapters]
+        if categories is not None:
+            clips = [c for c in clips if c["category"] in categories]
+        return clips
+
+    def jobs(self, clips=None, audio_dir=AUDIO_DIR):
+        """TTS engine jobs for the given clips, skipping ones without text"""
+        if clips is None:
+            clips = self.clips
+        return [
+            tts_engine.make_job(clip["text"], clip_path(clip, audio_dir),
+                                *(clip[field] for field in VOICE_FIELDS))
+            for clip in clips
+            if clip["text"] is not None
+        ]
+
+    def group_jobs(self, group):
+        return self.jobs(self.select(group=group))
+
+
+def load(path=MANIFEST_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return Corpus(json.load(f))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize the audio corpus manifest")
+    parser.add_argument("--manifest", default=MANIFEST_PATH)
+    args = parser.parse_args()
+
+    corpus = load(args.manifest)
+    print(f"📚 {len(corpus.clips)} clips in {args.manifest}")
+    for number in sorted(corpus.by_chapter):
+        clips = corpus.chapter(number)
+        counts = ", ".join(
+            f"{category} {sum(1 for c in clips if c['category'] == category)}"
+            for category in CATEGORIES
+            if any(c["category"] == category for c in clips)
+        )
+        print(f"  Chapter {number:2}: {len(clips):3} clips ({counts})")
+    untracked = sum(1 for c in corpus.clips if c["text"] is None)
+    missing = [c["id"] for c in corpus.clips if not os.path.exists(clip_path(c))]
+    print(f"📝 {untracked} clips have no recorded source text")
+    print(f"❌ {len(missing)} clips missing from {AUDIO_DIR}/")
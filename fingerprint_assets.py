@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-hashed file names for the site's static assets
+
+Styles, scripts and audio are published as name.<hash>.ext, where the hash
+is taken from the bytes actually served (after minification), so a URL
+never changes meaning and every copy of it - browser HTTP cache, CDN,
+service worker - can be kept forever. build_site.py rewrites the
+href/src attributes, play()/playAudio() calls, CSS url()s and JSON path
+values that point at renamed files, and writes a _headers file marking the
+fingerprinted files immutable for hosts that read one (Netlify,
+Cloudflare Pages).
+
+Files fetched by a fixed URL keep their name: pages, sw.js and
+precache-manifest.js, JSON, and the icons the web app manifest and the
+push notifications use.
+
+Run directly to list the names the current tree would get.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import posixpath
+import re
+
+import build_precache
+import minify_assets
+
+HASH_LENGTH = 10
+AUDIO_EXTENSIONS = (".mp3", ".webm", ".ogg")
+CODE_EXTENSIONS = (".css", ".js")
+STABLE = ("sw.js", build_precache.OUTPUT)  # loaded by a fixed URL
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+ATTR = re.compile(r"""(\b(?:href|src)\s*=\s*["'])([^"'#?]+)""")
+AUDIO_CALL = re.compile(r"""(\bplay(?:Audio)?\(\s*['"])([^'"]+?\.mp3)(?=['"]\s*\))""")
+CSS_URL = re.compile(r"""(\burl\(\s*["']?)([^"')#?]+)""")
+
+
+def hashed_name(path, data):
+    """audio/vocab/brot.mp3 -> audio/vocab/brot.<hash>.mp3"""
+    stem, ext = posixpath.splitext(path)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def _swap(link, base, renames):
+    if link.startswith(build_precache.EXTERNAL):
+        return link
+    hashed = renames.get(posixpath.normpath(posixpath.join(base, link)))
+    return link if hashed is None else posixpath.relpath(hashed, base or ".")
+
+
+def rewrite_text(text, path, renames, patterns):
+    base = posixpath.dirname(path)
+    for pattern in patterns:
+        text = pattern.sub(lambda m: m.group(1) + _swap(m.group(2), base, renames), text)
+    return text
+
+
+def rewrite_json(text, path, renames):
+    """Point path strings (values and keys) in a JSON document at renamed files"""
+    base = posixpath.dirname(path)
+
+    def walk(value):
+        if isinstance(value, dict):
+            return {walk(key): walk(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        if isinstance(value, str) and "/" in value:
+            return _swap(value, base, renames)
+        return value
+
+    document = json.loads(text)
+    rewritten = walk(document)
+    if rewritten == document:
+        return text
+    return json.dumps(rewritten, ensure_ascii=False, indent=1) + "\n"
+
+
+def rewrite(path, data, renames):
+    """A text file's bytes with its references pointed at renamed files"""
+    if not renames:
+        return data
+    ext = posixpath.splitext(path)[1].lower()
+    text = data.decode("utf-8")
+    if ext == ".html":
+        text = rewrite_text(text, path, renames, (ATTR, AUDIO_CALL))
+    elif ext == ".css":
+        text = rewrite_text(text, path, renames, (CSS_URL,))
+    elif ext == ".json":
+        text = rewrite_json(text, path, renames)
+    else:
+        return data
+    return text.encode("utf-8")
+
+
+def build_renames(root=".", minify=True):
+    """{site path: fingerprinted site path} for every audio file, style and script"""
+    renames = {}
+    for full in sorted(glob.glob(os.path.join(root, "audio", "**", "*"), recursive=True)):
+        if full.lower().endswith(AUDIO_EXTENSIONS) and os.path.isfile(full):
+            path = os.path.relpath(full, root).replace(os.sep, "/")
+            with open(full, "rb") as f:
+                renames[path] = hashed_name(path, f.read())
+    # Styles and scripts after audio, so url()s in CSS already see the new names
+    for full in sorted(glob.glob(os.path.join(root, "*"))):
+        path = os.path.relpath(full, root).replace(os.sep, "/")
+        if not path.lower().endswith(CODE_EXTENSIONS) or path in STABLE:
+            continue
+        with open(full, "rb") as f:
+            data = rewrite(path, f.read(), renames)
+        renames[path] = hashed_name(path, minify_assets.minify(path, data) if minify else data)
+    return renames
+
+
+def headers(fingerprinted, other):
+    """_headers rules: fingerprinted files are immutable, everything else revalidates"""
+    lines = ["# Generated by build_site.py - do not edit"]
+    for path in sorted(fingerprinted):
+        lines += [f"/{path}", f"  Cache-Control: {IMMUTABLE}"]
+    for path in sorted(other):
+        if path.endswith("index.html"):  # also served as its directory
+            lines += ["/" + path[:-len("index.html")], "  Cache-Control: no-cache"]
+        lines += [f"/{path}", "  Cache-Control: no-cache"]
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the fingerprinted names of the site's assets")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--no-minify", action="store_true", help="hash the files as written")
+    args = parser.parse_args()
+
+    renames = build_renames(args.root, not args.no_minify)
+    for path, hashed in renames.items():
+        if not path.startswith("audio/"):
+            print(f"  {path} -> {hashed}")
+    audio = sum(path.startswith("audio/") for path in renames)
+    print(f"🔖 {len(renames)} assets fingerprinted ({audio} audio files)")
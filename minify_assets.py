@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Minify the site's text assets and precompress them
+
+build_site.py writes HTML, CSS, JS and JSON into dist/ through minify(),
+which strips comments and indentation without changing what the browser
+sees: whitespace is collapsed, never removed between words, and <pre>,
+<textarea> contents, string and template literals, regex literals and
+unquoted CSS url()s are left alone. JS keeps its line breaks, so automatic
+semicolon insertion is unaffected. compress_tree()
+then writes .gz (and, when the brotli module is installed, .br) siblings
+in a process pool for hosts that serve precompressed files, skipping
+files whose siblings are newer.
+
+Run directly to report the before/after bytes of a built tree per asset
+class.
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MINIFIED = (".html", ".css", ".js", ".json")
+COMPRESSED = MINIFIED + (".svg", ".txt", ".xml")
+MIN_COMPRESS_SIZE = 512  # smaller files gain nothing from a sibling
+SIBLINGS = (".gz", ".br")
+
+CSS_TOKENS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|url\((?!\s*["'])[^)]*\))|/\*.*?\*/""", re.S)
+CSS_SPACE = re.compile(r"\s*([{};,>])\s*|(:)\s+")
+JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")  # a / after these starts a regex literal
+JS_REGEX_KEYWORDS = ("return", "typeof", "case", "do", "else", "in", "of", "void",
+                     "yield", "await", "delete", "throw", "new")
+HTML_RAW = re.compile(r"(<(pre|textarea|script|style)\b[^>]*>)(.*?)(</\2\s*>)", re.S | re.I)
+HTML_COMMENT = re.compile(r"<!--(?!\[).*?-->", re.S)
+
+
+def minify_css(text):
+    parts = [""]
+    last = 0
+    for match in CSS_TOKENS.finditer(text):
+        parts[-1] += text[last:match.start()]
+        if match.group(1):
+            parts += [match.group(1), ""]
+        else:
+            parts[-1] += " "  # a comment separates like whitespace
+        last = match.end()
+    parts[-1] += text[last:]
+    for i in range(0, len(parts), 2):  # even parts are outside strings
+        code = re.sub(r"\s+", " ", parts[i])
+        code = CSS_SPACE.sub(lambda m: m.group(1) or m.group(2), code)
+        parts[i] = code.replace(";}", "}")
+    return "".join(parts).strip() + "\n"
+
+
+def _js_line_states(text):
+    """For every line, whether it starts and whether it ends in plain code
+
+    A line starts or ends elsewhere inside a string continued with a
+    backslash, a template literal or a block comment.
+    """
+    starts, ends = [True], []
+    state, prev, braces = "code", "", []  # braces: open { per ${ of enclosing templates
+    i = 0
+    while i < len(text):
+        c, following = text[i], text[i + 1:i + 2]
+        if c == "\n":
+            if state == "line":
+                state = "code"
+            ends.append(state == "code")
+            starts.append(state == "code")
+        elif state == "code":
+            if c in "'\"`":
+                state = c
+            elif c == "/" and following in "/*":
+                state = "line" if following == "/" else "block"
+                i += 1
+            elif c == "/" and (prev in JS_REGEX_AFTER or not prev or
+                               re.search(r"\b(?:%s)\s*$" % "|".join(JS_REGEX_KEYWORDS), text[max(0, i - 12):i])):
+                state = "regex"
+            elif c == "{" and braces:
+                braces[-1] += 1
+            elif c == "}" and braces:
+                if braces[-1]:
+                    braces[-1] -= 1
+                else:
+                    braces.pop()
+                    state = "`"
+            if not c.isspace():
+                prev = c
+        elif state in "'\"`":
+            if c == "\\" and following != "\n":
+                i += 1
+            elif c == state:
+                state, prev = "code", "a"
+            elif state == "`" and c == "$" and following == "{":
+                braces.append(0)
+                state, prev = "code", "{"
+                i += 1
+        elif state == "block":
+            if c == "*" and following == "/":
+                state = "code"
+                i += 1
+        elif state in ("regex", "class"):
+            if c == "\\":
+                i += 1
+            elif c == "[":
+                state = "class"
+            elif c == "]" and state == "class":
+                state = "regex"
+            elif c == "/" and state == "regex":
+                state, prev = "code", "a"  # a / right after a regex divides
+        i += 1
+    ends.append(state == "code")
+    return starts, ends
+
+
+def minify_js(text):
+    """Drop indentation, blank lines and whole-line // comments outside literals"""
+    lines = []
+    for line, start, end in zip(text.split("\n"), *_js_line_states(text)):
+        if start:
+            line = line.lstrip()
+            if line.startswith("//"):
+                continue
+        if end:
+            line = line.rstrip()
+        if start and end and not line:
+            continue
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def minify_html(text):
+    parts = []
+    last = 0
+    for match in HTML_RAW.finditer(text):
+        parts.append(_collapse_html(text[last:match.start()]))
+        tag, body = match.group(2).lower(), match.group(3)
+        if tag == "script" and body.strip():
+            body = "\n" + minify_js(body)
+        elif tag == "style":
+            body = minify_css(body)
+        parts.append(match.group(1) + body + match.group(4))
+        last = match.end()
+    parts.append(_collapse_html(text[last:]))
+    return "".join(parts).strip() + "\n"
+
+
+def _collapse_html(text):
+    text = HTML_COMMENT.sub("", text)
+    text = re.sub(r"[ \t]*\n\s*", "\n", text)
+    return re.sub(r"[ \t]{2,}", " ", text)
+
+
+def minify(path, data):
+    """Minified bytes of a file's data, or the data itself if not minifiable"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in MINIFIED:
+        return data
+    text = data.decode("utf-8")
+    if ext == ".html":
+        text = minify_html(text)
+    elif ext == ".css":
+        text = minify_css(text)
+    elif ext == ".js":
+        text = minify_js(text)
+    else:
+        text = json.dumps(json.loads(text), ensure_ascii=False, separators=(",", ":")) + "\n"
+    return text.encode("utf-8")
+
+
+def compress_file(path):
+    """Write path.gz (and path.br) if smaller than path; returns their sizes"""
+    with open(path, "rb") as f:
+        data = f.read()
+    sizes = {}
+    encoders = {".gz": lambda d: gzip.compress(d, 9, mtime=0)}
+    if brotli is not None:
+        encoders[".br"] = lambda d: brotli.compress(d, quality=11)
+    for ext, encode in encoders.items():
+        packed = encode(data)
+        if len(packed) >= len(data):
+            if os.path.exists(path + ext):
+                os.remove(path + ext)
+            continue
+        tmp = f"{path}{ext}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(packed)
+        os.replace(tmp, path + ext)
+        sizes[ext] = len(packed)
+    return path, sizes
+
+
+def compressible(root):
+    for directory, _, names in os.walk(root):
+        for name in sorted(names):
+            path = os.path.join(directory, name)
+            if (name.lower().endswith(COMPRESSED) and not name.startswith(".")
+                    and os.path.getsize(path) >= MIN_COMPRESS_SIZE):
+                yield path
+
+
+def compress_tree(root, workers=None):
+    """Compress every text asset whose siblings are missing or older; returns the count"""
+    todo = []
+    for path in compressible(root):
+        mtime = os.path.getmtime(path)
+        siblings = [path + ext for ext in SIBLINGS if ext == ".gz" or brotli is not None]
+        if any(not os.path.exists(s) or os.path.getmtime(s) < mtime for s in siblings):
+            todo.append(path)
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(compress_file, todo, chunksize=4))
+    return len(todo)
+
+
+def sibling_paths(paths):
+    """Compressed siblings that may belong to these site files"""
+    return {path + ext for path in paths if path.lower().endswith(COMPRESSED) for ext in SIBLINGS}
+
+
+def asset_class(path):
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return ext if ext in ("html", "css", "js", "json") else "other"
+
+
+def size_report(root, original=None):
+    """{class: {files, original, minified, gz, br}} for the text assets in root
+
+    original maps site-relative paths to the size of the file they were
+    built from; files missing from it count at their built size.
+    """
+    original = original or {}
+    report = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if not name.lower().endswith(MINIFIED) or name.startswith("."):
+                continue
+            path = os.path.join(directory, name)
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            size = os.path.getsize(path)
+            row = report.setdefault(asset_class(path), {"files": 0, "original": 0, "minified": 0, "gz": 0, "br": 0})
+            row["files"] += 1
+            row["original"] += original.get(relative, size)
+            row["minified"] += size
+            for ext in SIBLINGS:
+                sibling = path + ext
+                row[ext[1:]] += os.path.getsize(sibling) if os.path.exists(sibling) else size
+    return report
+
+
+def print_report(report):
+    print(f"  {'class':6} {'files':>5} {'original':>10} {'minified':>10} {'gzip':>10} {'brotli':>10}")
+    for name, row in sorted(report.items()):
+        br = f"{row['br'] / 1024:9.1f}K" if brotli else f"{'-':>10}"
+        print(f"  {name:6} {row['files']:5} {row['original'] / 1024:9.1f}K {row['minified'] / 1024:9.1f}K "
+              f"{row['gz'] / 1024:9.1f}K {br}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report minified and compressed sizes of a built site")
+    parser.add_argument("root", nargs="?", default="dist")
+    parser.add_argument("--compress", action="store_true", help="write missing .gz/.br siblings first")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.compress:
+        print(f"🗜️  {compress_tree(args.root, args.workers)} files compressed")
+    if brotli is None:
+        print("⚠️  brotli not installed: only .gz siblings (pip install brotli)")
+    print_report(size_report(args.root))
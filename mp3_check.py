@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Find corrupt or truncated MP3 clips under audio/ and regenerate them
+
+Walks MPEG frame headers without decoding, one process per CPU, and flags
+files that are empty, not MP3 at all, cut off mid-frame, have junk between
+frames, are implausibly short, or don't match the corpus format (MPEG-2
+Layer III, 24 kHz mono, 48 kbps). With --repair, flagged clips that have
+source text in the manifest are resynthesized.
+"""
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Bitrates (kbps) by version then bitrate index, Layer III only
+BITRATES = {
+    "1": (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    "2": (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+SAMPLE_RATES = {
+    "1": (44100, 48000, 32000),
+    "2": (22050, 24000, 16000),
+    "2.5": (11025, 12000, 8000),
+}
+VERSIONS = {0: "2.5", 2: "2", 3: "1"}
+
+EXPECTED_FORMAT = {"version": "2", "sample_rate": 24000, "bitrate": 48, "mono": True}
+MIN_FRAMES = 5  # 120 ms; anything shorter is not a spoken clip
+
+# Problems that mean the file is unusable, as opposed to merely unexpected
+FATAL = ("empty", "not mp3", "truncated", "junk between frames", "too short")
+
+
+def parse_header(data, pos):
+    """Decode the frame header at pos, or return None if there is none"""
+    if pos + 4 > len(data) or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = VERSIONS.get((b1 >> 3) & 0x03)
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version is None or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = BITRATES["1" if version == "1" else "2"][bitrate_index]
+    sample_rate = SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    coefficient = 144 if version == "1" else 72
+    return {
+        "version": version,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "mono": (b3 >> 6) == 3,
+        "length": coefficient * bitrate * 1000 // sample_rate + padding,
+        "samples": 1152 if version == "1" else 576,
+    }
+
+
+def _audio_bounds(data):
+    """Start and end of the frame data, skipping ID3v2 and ID3v1 tags"""
+    start, end = 0, len(data)
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return start, end
+
+
+def audio_frames(data):
+    """(offset, header) of every complete frame, without tags or a LAME/Xing info frame"""
+    pos, end = _audio_bounds(data)
+    frames = []
+    while pos < end:
+        header = parse_header(data, pos)
+        if header is None or pos + header["length"] > end:
+            break
+        frames.append((pos, header))
+        pos += header["length"]
+    if frames:
+        pos, header = frames[0]
+        side_info = (17 if header["mono"] else 32) if header["version"] == "1" else (9 if header["mono"] else 17)
+        tag = data[pos + 4 + side_info:pos + 8 + side_info]
+        if tag in (b"Xing", b"Info"):
+            frames.pop(0)
+    return frames
+
+
+def scan_file(path):
+    """Walk every frame header of one file and list what is wrong with it"""
+    with open(path, "rb") as f:
+        data = f.read()
+    result = {"path": path, "size": len(data), "frames": 0, "duration": 0.0, "problems": []}
+    problems = result["problems"]
+    if not data:
+        problems.append("empty")
+        return result
+
+    pos, end = _audio_bounds(data)
+    first = parse_header(data, pos)
+    if first is None:
+        problems.append("not mp3")
+        return result
+
+    samples = 0
+    while pos < end:
+        header = parse_header(data, pos)
+        if header is None:
+            problems.append("junk between frames")
+            break
+        if pos + header["length"] > end:
+            problems.append("truncated")
+            break
+        result["frames"] += 1
+        samples += header["samples"]
+        pos += header["length"]
+
+    result["duration"] = samples / first["sample_rate"]
+    if result["frames"] < MIN_FRAMES and "truncated" not in problems:
+        problems.append("too short")
+    if any(first[field] != value for field, value in EXPECTED_FORMAT.items()):
+        problems.append(
+            f"unexpected format (MPEG-{first['version']} {first['sample_rate']} Hz "
+            f"{first['bitrate']} kbps {'mono' if first['mono'] else 'stereo'})"
+        )
+    return result
+
+
+def is_broken(result):
+    return any(problem in FATAL for problem in result["problems"])
+
+
+def scan_tree(audio_dir="audio", workers=None):
+    """Scan every clip under audio_dir in a process pool"""
+    paths = sorted(glob.glob(os.path.join(audio_dir, "*", "*.mp3")))
+    if not paths:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        return list(pool.map(scan_file, paths, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    import corpus
+    import tts_engine
+
+    parser = argparse.ArgumentParser(description="Check audio/ for corrupt or truncated MP3 files")
+    parser.add_argument("--audio-dir", default="audio")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repair", action="store_true",
+                        help="resynthesize broken clips that have source text in the manifest")
+    tts_engine.add_arguments(parser)
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    results = scan_tree(args.audio_dir, args.workers)
+    elapsed = time.monotonic() - started
+
+    flagged = [r for r in results if r["problems"]]
+    for result in flagged:
+        icon = "❌" if is_broken(result) else "⚠️ "
+        print(f"{icon} {result['path']}: {', '.join(result['problems'])}")
+    total_duration = sum(r["duration"] for r in results)
+    print(f"\n🔍 Scanned {len(results)} files ({total_duration / 60:.1f} min of audio) "
+          f"in {elapsed * 1000:.0f} ms")
+    broken = [r for r in results if is_broken(r)]
+    print(f"❌ {len(broken)} broken, ⚠️  {len(flagged) - len(broken)} unexpected format")
+
+    if args.repair and broken:
+        manifest = corpus.load()
+        prefix = args.audio_dir.rstrip("/") + "/"
+        ids = [r["path"][len(prefix):-len(".mp3")].replace(os.sep, "/") for r in broken]
+        clips = [manifest.by_id[i] for i in ids if i in manifest.by_id]
+        jobs = manifest.jobs(clips, args.audio_dir)
+        unrepairable = sorted(set(ids) - {c["id"] for c in clips if c["text"] is not None})
+        for clip_id in unrepairable:
+            print(f"❓ No source text to regenerate {clip_id}")
+
+        args.overwrite = True  # the cached object may be the broken one
+        print(f"\n🔧 Regenerating {len(jobs)} broken clips...")
+        tts_engine.run_from_args(jobs, args)
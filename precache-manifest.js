@@ -0,0 +1,575 @@
+// Generated by build_precache.py - do not edit
+self.PRECACHE_MANIFEST = {
+  "version": "7b8ba25bcdc5",
+  "assets": [
+    {"url": "./index.html", "hash": "8987b4eb6355", "size": 9665, "group": "shell"},
+    {"url": "./manifest.json", "hash": "1b3c0f9a13e4", "size": 1772, "group": "shell"},
+    {"url": "./icons/icon-32x32.png", "hash": "4191a4dacff7", "size": 55, "group": "shell"},
+    {"url": "./icons/icon-16x16.png", "hash": "cee80a6f0691", "size": 55, "group": "shell"},
+    {"url": "./icons/icon-152x152.png", "hash": "f5ced8a2c84f", "size": 57, "group": "shell"},
+    {"url": "./style.css", "hash": "8aecbb23038e", "size": 14093, "group": "shell"},
+    {"url": "./content/table_of_contents.html", "hash": "df1d12e62b30", "size": 21082, "group": "shell"},
+    {"url": "./content/chapter00.html", "hash": "0728d6d4f05c", "size": 32508, "group": "shell"},
+    {"url": "./content/chapter01.html", "hash": "7f2ef87726ce", "size": 41369, "group": "shell"},
+    {"url": "./content/chapter02.html", "hash": "7c3549ccc2d9", "size": 50024, "group": "shell"},
+    {"url": "./content/chapter03.html", "hash": "5db3ce586416", "size": 49763, "group": "shell"},
+    {"url": "./content/chapter04.html", "hash": "6eaafa0b993c", "size": 34556, "group": "shell"},
+    {"url": "./content/chapter05.html", "hash": "94d77e43ab74", "size": 41289, "group": "shell"},
+    {"url": "./content/chapter06.html", "hash": "23388413da35", "size": 41870, "group": "shell"},
+    {"url": "./content/chapter07.html", "hash": "b3134beb1547", "size": 41598, "group": "shell"},
+    {"url": "./content/chapter08.html", "hash": "284a23cec84e", "size": 39855, "group": "shell"},
+    {"url": "./content/chapter09.html", "hash": "6d8a1d21d2f1", "size": 52445, "group": "shell"},
+    {"url": "./content/chapter10.html", "hash": "7f31348790ed", "size": 53527, "group": "shell"},
+    {"url": "./content/chapter11.html", "hash": "fa1e6c0ed772", "size": 27697, "group": "shell"},
+    {"url": "./content/chapter12.html", "hash": "f6f577b360f0", "size": 27538, "group": "shell"},
+    {"url": "./content/chapter13.html", "hash": "d724b067a4fb", "size": 27469, "group": "shell"},
+    {"url": "./content/chapter14.html", "hash": "3f602f0b1f8c", "size": 23894, "group": "shell"},
+    {"url": "./script.js", "hash": "5486ab67f278", "size": 11029, "group": "shell"},
+    {"url": "./icons/icon-72x72.png", "hash": "0ae6aef8fc63", "size": 55, "group": "shell"},
+    {"url": "./icons/icon-96x96.png", "hash": "a6740656a555", "size": 55, "group": "shell"},
+    {"url": "./icons/icon-128x128.png", "hash": "17a8a8675be0", "size": 57, "group": "shell"},
+    {"url": "./icons/icon-144x144.png", "hash": "651060b044e4", "size": 57, "group": "shell"},
+    {"url": "./icons/icon-192x192.png", "hash": "05fc2f9e200d", "size": 57, "group": "shell"},
+    {"url": "./icons/icon-384x384.png", "hash": "65920dbd3836", "size": 57, "group": "shell"},
+    {"url": "./icons/icon-512x512.png", "hash": "517680b45138", "size": 57, "group": "shell"},
+    {"url": "./audio/alphabet/a.mp3", "hash": "b5fee25df98f", "size": 9216, "group": "audio"},
+    {"url": "./audio/alphabet/ae.mp3", "hash": "9a6f08c83533", "size": 9072, "group": "audio"},
+    {"url": "./audio/alphabet/b.mp3", "hash": "2113f7f079dc", "size": 9504, "group": "audio"},
+    {"url": "./audio/alphabet/c.mp3", "hash": "f56920af1089", "size": 9792, "group": "audio"},
+    {"url": "./audio/alphabet/d.mp3", "hash": "8897983907d5", "size": 8784, "group": "audio"},
+    {"url": "./audio/alphabet/e.mp3", "hash": "435ab373b640", "size": 9072, "group": "audio"},
+    {"url": "./audio/alphabet/f.mp3", "hash": "f95c10863483", "size": 9360, "group": "audio"},
+    {"url": "./audio/alphabet/g.mp3", "hash": "ee69453ba086", "size": 9648, "group": "audio"},
+    {"url": "./audio/alphabet/h.mp3", "hash": "4fa03a624831", "size": 8928, "group": "audio"},
+    {"url": "./audio/alphabet/i.mp3", "hash": "44e3cad48250", "size": 8640, "group": "audio"},
+    {"url": "./audio/alphabet/j.mp3", "hash": "55bf1ebe57ad", "size": 10368, "group": "audio"},
+    {"url": "./audio/alphabet/k.mp3", "hash": "9fe167c62b63", "size": 10080, "group": "audio"},
+    {"url": "./audio/alphabet/l.mp3", "hash": "b0ad38831e19", "size": 9216, "group": "audio"},
+    {"url": "./audio/alphabet/m.mp3", "hash": "656b82f468bc", "size": 9072, "group": "audio"},
+    {"url": "./audio/alphabet/n.mp3", "hash": "12c158d759c9", "size": 9360, "group": "audio"},
+    {"url": "./audio/alphabet/o.mp3", "hash": "81574ff18af0", "size": 9360, "group": "audio"},
+    {"url": "./audio/alphabet/oe.mp3", "hash": "506e8fb068aa", "size": 9216, "group": "audio"},
+    {"url": "./audio/alphabet/p.mp3", "hash": "23f6d36f8d34", "size": 9936, "group": "audio"},
+    {"url": "./audio/alphabet/q.mp3", "hash": "0a02a6cba631", "size": 9504, "group": "audio"},
+    {"url": "./audio/alphabet/r.mp3", "hash": "79452eb716d4", "size": 9360, "group": "audio"},
+    {"url": "./audio/alphabet/s.mp3", "hash": "d4e7e84bbd5d", "size": 9360, "group": "audio"},
+    {"url": "./audio/alphabet/ss.mp3", "hash": "32ffcfeb0d93", "size": 11376, "group": "audio"},
+    {"url": "./audio/alphabet/t.mp3", "hash": "81691ac99cc8", "size": 8640, "group": "audio"},
+    {"url": "./audio/alphabet/u.mp3", "hash": "5f152682b479", "size": 8928, "group": "audio"},
+    {"url": "./audio/alphabet/ue.mp3", "hash": "83993a825aa5", "size": 9072, "group": "audio"},
+    {"url": "./audio/alphabet/v.mp3", "hash": "181e02b317f5", "size": 9648, "group": "audio"},
+    {"url": "./audio/alphabet/w.mp3", "hash": "9f63a5098912", "size": 9504, "group": "audio"},
+    {"url": "./audio/alphabet/x.mp3", "hash": "64fbac855993", "size": 9936, "group": "audio"},
+    {"url": "./audio/alphabet/y.mp3", "hash": "e5e2dd305004", "size": 12384, "group": "audio"},
+    {"url": "./audio/alphabet/z.mp3", "hash": "2eeb0336cb84", "size": 9792, "group": "audio"},
+    {"url": "./audio/dialogues/d1_line1.mp3", "hash": "4f92dbdd81ef", "size": 24480, "group": "audio"},
+    {"url": "./audio/dialogues/d1_line2.mp3", "hash": "da514faac91a", "size": 26208, "group": "audio"},
+    {"url": "./audio/dialogues/d1_line3.mp3", "hash": "beae71f335a1", "size": 14688, "group": "audio"},
+    {"url": "./audio/dialogues/d1_line4.mp3", "hash": "34a068ffdc17", "size": 28080, "group": "audio"},
+    {"url": "./audio/dialogues/d1_line5.mp3", "hash": "76d8f728f64a", "size": 16272, "group": "audio"},
+    {"url": "./audio/dialogues/d2_01.mp3", "hash": "ff0c7a21e9a5", "size": 29088, "group": "audio"},
+    {"url": "./audio/dialogues/d2_02.mp3", "hash": "e69491856a65", "size": 37440, "group": "audio"},
+    {"url": "./audio/dialogues/d2_03.mp3", "hash": "0c875e9fd85a", "size": 40608, "group": "audio"},
+    {"url": "./audio/dialogues/d2_04.mp3", "hash": "937b2329a6bb", "size": 33264, "group": "audio"},
+    {"url": "./audio/dialogues/d2_05.mp3", "hash": "419bf0228a85", "size": 40032, "group": "audio"},
+    {"url": "./audio/dialogues/d2_06.mp3", "hash": "0d16b0c54c49", "size": 19152, "group": "audio"},
+    {"url": "./audio/dialogues/d2_07.mp3", "hash": "39465f341740", "size": 33408, "group": "audio"},
+    {"url": "./audio/dialogues/d2_08.mp3", "hash": "87fd530b4331", "size": 15120, "group": "audio"},
+    {"url": "./audio/dialogues/d2_09.mp3", "hash": "0b38c982b29d", "size": 36144, "group": "audio"},
+    {"url": "./audio/dialogues/d2_10.mp3", "hash": "c0a09838c2f9", "size": 28656, "group": "audio"},
+    {"url": "./audio/dialogues/d2_11.mp3", "hash": "6d54b13a078d", "size": 37152, "group": "audio"},
+    {"url": "./audio/dialogues/d2_12.mp3", "hash": "f9ec0992d317", "size": 21024, "group": "audio"},
+    {"url": "./audio/dialogues/d2_13.mp3", "hash": "b131fad90b12", "size": 36720, "group": "audio"},
+    {"url": "./audio/dialogues/d2_14.mp3", "hash": "369b417be4ff", "size": 13680, "group": "audio"},
+    {"url": "./audio/dialogues/d2_15.mp3", "hash": "f4823407a2d2", "size": 40464, "group": "audio"},
+    {"url": "./audio/dialogues/d2_16.mp3", "hash": "66ca279fca05", "size": 18720, "group": "audio"},
+    {"url": "./audio/dialogues/d2_17.mp3", "hash": "794bbf937573", "size": 32832, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line1.mp3", "hash": "1c8bf89f5855", "size": 12960, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line2.mp3", "hash": "373afb89aa2a", "size": 28080, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line3.mp3", "hash": "35223b646277", "size": 13824, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line4.mp3", "hash": "c8d2083b120a", "size": 29376, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line5.mp3", "hash": "e4d8fba60cf0", "size": 15696, "group": "audio"},
+    {"url": "./audio/dialogues/d2_line6.mp3", "hash": "d929ea845e06", "size": 18720, "group": "audio"},
+    {"url": "./audio/dialogues/d3_01.mp3", "hash": "f631bd08a93c", "size": 40896, "group": "audio"},
+    {"url": "./audio/dialogues/d3_02.mp3", "hash": "0c6bc5883e63", "size": 33408, "group": "audio"},
+    {"url": "./audio/dialogues/d3_03.mp3", "hash": "f523874dfbaa", "size": 32400, "group": "audio"},
+    {"url": "./audio/dialogues/d3_04.mp3", "hash": "b89df0f07120", "size": 29520, "group": "audio"},
+    {"url": "./audio/dialogues/d3_05.mp3", "hash": "0206a5604e3e", "size": 31536, "group": "audio"},
+    {"url": "./audio/dialogues/d3_06.mp3", "hash": "0e95c3cbae29", "size": 28224, "group": "audio"},
+    {"url": "./audio/dialogues/d3_07.mp3", "hash": "bd29c5ff5314", "size": 33120, "group": "audio"},
+    {"url": "./audio/dialogues/d3_08.mp3", "hash": "50ffa2951eec", "size": 14400, "group": "audio"},
+    {"url": "./audio/dialogues/d3_09.mp3", "hash": "f6a8c6d42677", "size": 27936, "group": "audio"},
+    {"url": "./audio/dialogues/d3_10.mp3", "hash": "c3207621875d", "size": 29520, "group": "audio"},
+    {"url": "./audio/dialogues/d3_11.mp3", "hash": "3a63b6eb8bf6", "size": 26928, "group": "audio"},
+    {"url": "./audio/dialogues/d3_12.mp3", "hash": "fceca94173cf", "size": 33696, "group": "audio"},
+    {"url": "./audio/dialogues/d3_13.mp3", "hash": "0b5262e88c0e", "size": 24336, "group": "audio"},
+    {"url": "./audio/dialogues/d3_14.mp3", "hash": "daaefe9122f7", "size": 32400, "group": "audio"},
+    {"url": "./audio/dialogues/d3_15.mp3", "hash": "d43f608b9ee6", "size": 17856, "group": "audio"},
+    {"url": "./audio/dialogues/d3_16.mp3", "hash": "08c8b4ecac1d", "size": 27936, "group": "audio"},
+    {"url": "./audio/dialogues/d3_line1.mp3", "hash": "f0191ddabe08", "size": 16416, "group": "audio"},
+    {"url": "./audio/dialogues/d3_line2.mp3", "hash": "624308c61340", "size": 20736, "group": "audio"},
+    {"url": "./audio/dialogues/d3_line3.mp3", "hash": "80e1746d5092", "size": 25632, "group": "audio"},
+    {"url": "./audio/dialogues/d3_line4.mp3", "hash": "5b40d2d0035e", "size": 17568, "group": "audio"},
+    {"url": "./audio/dialogues/d4_01.mp3", "hash": "70dc7549af98", "size": 29952, "group": "audio"},
+    {"url": "./audio/dialogues/d4_02.mp3", "hash": "f71fdb2d11b4", "size": 19584, "group": "audio"},
+    {"url": "./audio/dialogues/d4_03.mp3", "hash": "e5e6ffac11d9", "size": 26064, "group": "audio"},
+    {"url": "./audio/dialogues/d4_04.mp3", "hash": "1e32e44bdfc4", "size": 17712, "group": "audio"},
+    {"url": "./audio/dialogues/d4_05.mp3", "hash": "8a0fa61fa58b", "size": 33552, "group": "audio"},
+    {"url": "./audio/dialogues/d4_06.mp3", "hash": "f4a58bc88ab0", "size": 25776, "group": "audio"},
+    {"url": "./audio/dialogues/d4_07.mp3", "hash": "7d5c9c9d152d", "size": 19296, "group": "audio"},
+    {"url": "./audio/dialogues/d4_08.mp3", "hash": "61fad3bb83ff", "size": 28512, "group": "audio"},
+    {"url": "./audio/dialogues/d4_09.mp3", "hash": "4f5b6a191eb6", "size": 17568, "group": "audio"},
+    {"url": "./audio/dialogues/d4_10.mp3", "hash": "410b189e774d", "size": 39312, "group": "audio"},
+    {"url": "./audio/dialogues/d4_11.mp3", "hash": "90d0d17adce1", "size": 25632, "group": "audio"},
+    {"url": "./audio/dialogues/d4_12.mp3", "hash": "e650b824e280", "size": 13968, "group": "audio"},
+    {"url": "./audio/dialogues/d5_01.mp3", "hash": "5ab848ac0053", "size": 30240, "group": "audio"},
+    {"url": "./audio/dialogues/d5_02.mp3", "hash": "ad9654b55aaa", "size": 20016, "group": "audio"},
+    {"url": "./audio/dialogues/d5_03.mp3", "hash": "cfe1a923a9fd", "size": 19152, "group": "audio"},
+    {"url": "./audio/dialogues/d5_04.mp3", "hash": "bc9cd7df3162", "size": 16992, "group": "audio"},
+    {"url": "./audio/dialogues/d5_05.mp3", "hash": "e5c890035e33", "size": 26352, "group": "audio"},
+    {"url": "./audio/dialogues/d5_06.mp3", "hash": "b5fb9b0158cb", "size": 17856, "group": "audio"},
+    {"url": "./audio/dialogues/d5_07.mp3", "hash": "3e1ff00d3f93", "size": 22896, "group": "audio"},
+    {"url": "./audio/dialogues/d5_08.mp3", "hash": "8c0c8979bfcb", "size": 18000, "group": "audio"},
+    {"url": "./audio/dialogues/d5_09.mp3", "hash": "c4455cf67d85", "size": 18720, "group": "audio"},
+    {"url": "./audio/dialogues/d5_10.mp3", "hash": "e4225d039716", "size": 15552, "group": "audio"},
+    {"url": "./audio/dialogues/d5_11.mp3", "hash": "86d78db4de8f", "size": 25632, "group": "audio"},
+    {"url": "./audio/dialogues/d5_12.mp3", "hash": "a1d76f77aa1f", "size": 19296, "group": "audio"},
+    {"url": "./audio/dialogues/d5_13.mp3", "hash": "fbd2324d00b9", "size": 30816, "group": "audio"},
+    {"url": "./audio/dialogues/d5_14.mp3", "hash": "558cc8eb6cc5", "size": 32832, "group": "audio"},
+    {"url": "./audio/dialogues/d5_15.mp3", "hash": "a1e58e46b4c2", "size": 31248, "group": "audio"},
+    {"url": "./audio/dialogues/d5_16.mp3", "hash": "d1ebedc349a0", "size": 26208, "group": "audio"},
+    {"url": "./audio/dialogues/d6_01.mp3", "hash": "601cf88fe9d2", "size": 24624, "group": "audio"},
+    {"url": "./audio/dialogues/d6_02.mp3", "hash": "6f952605d7f1", "size": 21888, "group": "audio"},
+    {"url": "./audio/dialogues/d6_03.mp3", "hash": "128261a09bf4", "size": 29520, "group": "audio"},
+    {"url": "./audio/dialogues/d6_04.mp3", "hash": "aadca6954219", "size": 18288, "group": "audio"},
+    {"url": "./audio/dialogues/d6_05.mp3", "hash": "2b7d43d39754", "size": 29232, "group": "audio"},
+    {"url": "./audio/dialogues/d6_06.mp3", "hash": "66da0b87a81c", "size": 21024, "group": "audio"},
+    {"url": "./audio/dialogues/d6_07.mp3", "hash": "685f66272af4", "size": 19728, "group": "audio"},
+    {"url": "./audio/dialogues/d6_08.mp3", "hash": "a18f8ebc83f1", "size": 23616, "group": "audio"},
+    {"url": "./audio/dialogues/d6_09.mp3", "hash": "aa1d2bc3427c", "size": 40032, "group": "audio"},
+    {"url": "./audio/dialogues/d6_10.mp3", "hash": "c481f211ea75", "size": 18576, "group": "audio"},
+    {"url": "./audio/dialogues/d6_11.mp3", "hash": "068617bbbdaa", "size": 34560, "group": "audio"},
+    {"url": "./audio/dialogues/d6_12.mp3", "hash": "787e84c8ee5d", "size": 36288, "group": "audio"},
+    {"url": "./audio/dialogues/d6_13.mp3", "hash": "cdb83933a7f9", "size": 16704, "group": "audio"},
+    {"url": "./audio/dialogues/d6_14.mp3", "hash": "3302103c9848", "size": 18144, "group": "audio"},
+    {"url": "./audio/dialogues/d6_15.mp3", "hash": "ff1880ecfcd5", "size": 21888, "group": "audio"},
+    {"url": "./audio/dialogues/d6_16.mp3", "hash": "b65bdd524c34", "size": 32112, "group": "audio"},
+    {"url": "./audio/dialogues/d6_17.mp3", "hash": "07d27d196eaf", "size": 14400, "group": "audio"},
+    {"url": "./audio/dialogues/d6_18.mp3", "hash": "cca8903a2d52", "size": 30384, "group": "audio"},
+    {"url": "./audio/dialogues/d7_01.mp3", "hash": "60709c218aeb", "size": 21312, "group": "audio"},
+    {"url": "./audio/dialogues/d7_02.mp3", "hash": "4c8bf4672f3a", "size": 21600, "group": "audio"},
+    {"url": "./audio/dialogues/d7_03.mp3", "hash": "2ed91c433e7a", "size": 17568, "group": "audio"},
+    {"url": "./audio/dialogues/d7_04.mp3", "hash": "559e7374d526", "size": 20880, "group": "audio"},
+    {"url": "./audio/dialogues/d7_05.mp3", "hash": "781f07b47c65", "size": 20448, "group": "audio"},
+    {"url": "./audio/dialogues/d7_06.mp3", "hash": "be88b30d9740", "size": 27504, "group": "audio"},
+    {"url": "./audio/dialogues/d7_07.mp3", "hash": "b812e3b8ff9d", "size": 17280, "group": "audio"},
+    {"url": "./audio/dialogues/d7_08.mp3", "hash": "63d6d40d6fe9", "size": 24048, "group": "audio"},
+    {"url": "./audio/dialogues/d7_09.mp3", "hash": "ea3bd0c5d54d", "size": 16992, "group": "audio"},
+    {"url": "./audio/dialogues/d7_10.mp3", "hash": "c189ac170761", "size": 22032, "group": "audio"},
+    {"url": "./audio/dialogues/d7_11.mp3", "hash": "005006daa926", "size": 16272, "group": "audio"},
+    {"url": "./audio/dialogues/d7_12.mp3", "hash": "2975b0937b43", "size": 25200, "group": "audio"},
+    {"url": "./audio/dialogues/d7_13.mp3", "hash": "e4f85a106fcf", "size": 20016, "group": "audio"},
+    {"url": "./audio/dialogues/d7_14.mp3", "hash": "23a7958b7f3a", "size": 27792, "group": "audio"},
+    {"url": "./audio/dialogues/d7_15.mp3", "hash": "a00be88b77e6", "size": 23184, "group": "audio"},
+    {"url": "./audio/dialogues/d7_16.mp3", "hash": "d305f9a85364", "size": 34128, "group": "audio"},
+    {"url": "./audio/dialogues/d8_01.mp3", "hash": "229f47c26a16", "size": 28656, "group": "audio"},
+    {"url": "./audio/dialogues/d8_02.mp3", "hash": "63eb768ecfa9", "size": 21456, "group": "audio"},
+    {"url": "./audio/dialogues/d8_03.mp3", "hash": "0a099112f702", "size": 21024, "group": "audio"},
+    {"url": "./audio/dialogues/d8_04.mp3", "hash": "b21dccce29e9", "size": 17280, "group": "audio"},
+    {"url": "./audio/dialogues/d8_05.mp3", "hash": "cb0b083dfae0", "size": 18144, "group": "audio"},
+    {"url": "./audio/dialogues/d8_06.mp3", "hash": "bcb3c9376799", "size": 16848, "group": "audio"},
+    {"url": "./audio/dialogues/d8_07.mp3", "hash": "7811c7fc29f8", "size": 26928, "group": "audio"},
+    {"url": "./audio/dialogues/d8_08.mp3", "hash": "696b59f4f9f9", "size": 15840, "group": "audio"},
+    {"url": "./audio/dialogues/d8_09.mp3", "hash": "9ac1de666a49", "size": 14832, "group": "audio"},
+    {"url": "./audio/dialogues/d8_10.mp3", "hash": "ece88357fdfb", "size": 19152, "group": "audio"},
+    {"url": "./audio/dialogues/d8_11.mp3", "hash": "84c39341678e", "size": 13968, "group": "audio"},
+    {"url": "./audio/dialogues/d8_12.mp3", "hash": "f79ba96dbcfa", "size": 25344, "group": "audio"},
+    {"url": "./audio/dialogues/d8_13.mp3", "hash": "b7dd3ed1665c", "size": 23472, "group": "audio"},
+    {"url": "./audio/dialogues/d8_14.mp3", "hash": "931e5ef03098", "size": 20736, "group": "audio"},
+    {"url": "./audio/dialogues/d8_15.mp3", "hash": "7cbe89009754", "size": 26496, "group": "audio"},
+    {"url": "./audio/dialogues/unit09_dialog01.mp3", "hash": "1ae0db22c5f0", "size": 172800, "group": "audio"},
+    {"url": "./audio/dialogues/unit09_dialog02.mp3", "hash": "4154de02ba8e", "size": 168480, "group": "audio"},
+    {"url": "./audio/dialogues/unit09_dialog03.mp3", "hash": "da0ab80514fa", "size": 149040, "group": "audio"},
+    {"url": "./audio/dialogues/unit10_dialog01.mp3", "hash": "5f45d1c00cfa", "size": 27936, "group": "audio"},
+    {"url": "./audio/dialogues/unit10_dialog02.mp3", "hash": "19b1f58ce5d4", "size": 22608, "group": "audio"},
+    {"url": "./audio/dialogues/unit10_dialog03.mp3", "hash": "8a1ab0ede386", "size": 16416, "group": "audio"},
+    {"url": "./audio/dialogues/unit11_dialog01.mp3", "hash": "ba02dab80fbb", "size": 27648, "group": "audio"},
+    {"url": "./audio/dialogues/unit11_dialog02.mp3", "hash": "63740e454b2c", "size": 36144, "group": "audio"},
+    {"url": "./audio/dialogues/unit11_dialog03.mp3", "hash": "bcab38c74fc6", "size": 21600, "group": "audio"},
+    {"url": "./audio/dialogues/unit12_dialog01.mp3", "hash": "f976cf34a550", "size": 19584, "group": "audio"},
+    {"url": "./audio/dialogues/unit12_dialog02.mp3", "hash": "f1eeadf10ca8", "size": 26352, "group": "audio"},
+    {"url": "./audio/dialogues/unit12_dialog03.mp3", "hash": "8ca2d22715ad", "size": 26352, "group": "audio"},
+    {"url": "./audio/pronunciation/ch_sound.mp3", "hash": "edee13d61dd4", "size": 18432, "group": "audio"},
+    {"url": "./audio/pronunciation/ex1_1.mp3", "hash": "40abcd6e18f9", "size": 27360, "group": "audio"},
+    {"url": "./audio/pronunciation/ex1_2.mp3", "hash": "af34f5abfe14", "size": 32256, "group": "audio"},
+    {"url": "./audio/pronunciation/ex1_3.mp3", "hash": "03b65aff196b", "size": 15984, "group": "audio"},
+    {"url": "./audio/pronunciation/ex2_1.mp3", "hash": "ef136524a8a6", "size": 10656, "group": "audio"},
+    {"url": "./audio/pronunciation/ex2_2.mp3", "hash": "4ac0ff5a1749", "size": 10656, "group": "audio"},
+    {"url": "./audio/pronunciation/ex2_3.mp3", "hash": "9a234f648e0e", "size": 10512, "group": "audio"},
+    {"url": "./audio/pronunciation/r_sound.mp3", "hash": "2890ff24bedd", "size": 21024, "group": "audio"},
+    {"url": "./audio/pronunciation/spell_anna.mp3", "hash": "071ee30d8dc8", "size": 20160, "group": "audio"},
+    {"url": "./audio/pronunciation/umlaut_practice.mp3", "hash": "5fe51cf79686", "size": 25488, "group": "audio"},
+    {"url": "./audio/pronunciation/v_w_sound.mp3", "hash": "22d1977ba136", "size": 26928, "group": "audio"},
+    {"url": "./audio/pronunciation/vowel_length.mp3", "hash": "333cfb5a5e53", "size": 32832, "group": "audio"},
+    {"url": "./audio/pronunciation/z_s_sound.mp3", "hash": "2043b4c05b8c", "size": 20592, "group": "audio"},
+    {"url": "./audio/sentences/apotheke_wo.mp3", "hash": "55e7420ce050", "size": 16848, "group": "audio"},
+    {"url": "./audio/sentences/ausruhen.mp3", "hash": "e0411bbe6247", "size": 18864, "group": "audio"},
+    {"url": "./audio/sentences/bauch_weh.mp3", "hash": "d4508d172ebc", "size": 16848, "group": "audio"},
+    {"url": "./audio/sentences/bin_krank.mp3", "hash": "b38f80170527", "size": 14112, "group": "audio"},
+    {"url": "./audio/sentences/brauche_neue_schuhe.mp3", "hash": "dc66d65b1ecb", "size": 17136, "group": "audio"},
+    {"url": "./audio/sentences/das_ist_meine_familie.mp3", "hash": "5b61f371277d", "size": 18000, "group": "audio"},
+    {"url": "./audio/sentences/dein_vater_nett.mp3", "hash": "654aa04d1df5", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/du_bist_freund.mp3", "hash": "b328b9050ebe", "size": 15696, "group": "audio"},
+    {"url": "./audio/sentences/er_ist_student.mp3", "hash": "24f1ea1e8899", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/er_studiert_medizin.mp3", "hash": "baa1f1af1b0e", "size": 17136, "group": "audio"},
+    {"url": "./audio/sentences/erkaeltung.mp3", "hash": "a3c493cb2af7", "size": 17856, "group": "audio"},
+    {"url": "./audio/sentences/es_ist_buch.mp3", "hash": "49f45cef9a82", "size": 14256, "group": "audio"},
+    {"url": "./audio/sentences/esse_gern_schokolade.mp3", "hash": "94106f95bafd", "size": 17856, "group": "audio"},
+    {"url": "./audio/sentences/freundin_anna.mp3", "hash": "5e783c89a2d6", "size": 18720, "group": "audio"},
+    {"url": "./audio/sentences/fussball_spass.mp3", "hash": "9d19689578aa", "size": 21600, "group": "audio"},
+    {"url": "./audio/sentences/groesse_m.mp3", "hash": "8304590d7f40", "size": 17712, "group": "audio"},
+    {"url": "./audio/sentences/grosseltern_hamburg.mp3", "hash": "c9a1e7360ddd", "size": 24192, "group": "audio"},
+    {"url": "./audio/sentences/gute_besserung.mp3", "hash": "e30b5049abe1", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/haben_balkon.mp3", "hash": "83ad18d6be01", "size": 17280, "group": "audio"},
+    {"url": "./audio/sentences/hat_fieber.mp3", "hash": "726c7e236d7d", "size": 14112, "group": "audio"},
+    {"url": "./audio/sentences/haus_garten.mp3", "hash": "a8c9e986a94a", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/hoert_musik.mp3", "hash": "8f20c6d3467e", "size": 21456, "group": "audio"},
+    {"url": "./audio/sentences/ich_arbeite_firma.mp3", "hash": "c0d40c67f179", "size": 19008, "group": "audio"},
+    {"url": "./audio/sentences/ich_bin_lehrer.mp3", "hash": "1e6f6fe41af7", "size": 18144, "group": "audio"},
+    {"url": "./audio/sentences/ich_bin_lehrerin.mp3", "hash": "4083e92ae40a", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/ich_bin_soldat.mp3", "hash": "ac6a43b1e3cb", "size": 14256, "group": "audio"},
+    {"url": "./audio/sentences/ich_bin_student.mp3", "hash": "df6bf3306d4d", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/ich_esse_brot_fruehstueck.mp3", "hash": "558d84c451d0", "size": 19728, "group": "audio"},
+    {"url": "./audio/sentences/ich_habe_bruder_schwester.mp3", "hash": "9c17e32723a2", "size": 23184, "group": "audio"},
+    {"url": "./audio/sentences/ihr_seid_lehrer.mp3", "hash": "d00e1ad47d05", "size": 14256, "group": "audio"},
+    {"url": "./audio/sentences/ihre_schwester_lehrerin.mp3", "hash": "af837ae70ba5", "size": 19152, "group": "audio"},
+    {"url": "./audio/sentences/isst_du_fleisch_fisch.mp3", "hash": "7b1ca86ffb79", "size": 17568, "group": "audio"},
+    {"url": "./audio/sentences/kann_schwimmen.mp3", "hash": "68b3756cf851", "size": 18432, "group": "audio"},
+    {"url": "./audio/sentences/kaufe_zwei_aepfel.mp3", "hash": "cd7715146ed7", "size": 16704, "group": "audio"},
+    {"url": "./audio/sentences/kopfschmerzen.mp3", "hash": "b596ec35de26", "size": 17280, "group": "audio"},
+    {"url": "./audio/sentences/kostet_15_euro.mp3", "hash": "acca1c598eb6", "size": 21024, "group": "audio"},
+    {"url": "./audio/sentences/krankenschwester.mp3", "hash": "1613911d2534", "size": 22608, "group": "audio"},
+    {"url": "./audio/sentences/kueche_klein_modern.mp3", "hash": "91d11987407e", "size": 22608, "group": "audio"},
+    {"url": "./audio/sentences/ledig_keine_kinder.mp3", "hash": "8ff8fc6a657e", "size": 22896, "group": "audio"},
+    {"url": "./audio/sentences/lerne_deutsch.mp3", "hash": "d18724138e75", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/lese_buch.mp3", "hash": "dc70dca99786", "size": 20736, "group": "audio"},
+    {"url": "./audio/sentences/magst_du_pizza.mp3", "hash": "38f3c3584449", "size": 13824, "group": "audio"},
+    {"url": "./audio/sentences/medikamente_nehmen.mp3", "hash": "f559c90e4996", "size": 20160, "group": "audio"},
+    {"url": "./audio/sentences/mein_vater_heisst_thomas.mp3", "hash": "cb093a7a8d64", "size": 18144, "group": "audio"},
+    {"url": "./audio/sentences/meine_mutter_ist_45.mp3", "hash": "6c4d6cc6b97a", "size": 26640, "group": "audio"},
+    {"url": "./audio/sentences/miete_800_euro.mp3", "hash": "831ac45e53f8", "size": 23472, "group": "audio"},
+    {"url": "./audio/sentences/mittagessen_reis_huhn.mp3", "hash": "d0ea99cb4e98", "size": 23472, "group": "audio"},
+    {"url": "./audio/sentences/moechten_speisekarte.mp3", "hash": "6cc64a34b57e", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/museum_interessant.mp3", "hash": "5b76dbf333c7", "size": 23472, "group": "audio"},
+    {"url": "./audio/sentences/nehme_hemd.mp3", "hash": "08f88ae08712", "size": 15408, "group": "audio"},
+    {"url": "./audio/sentences/oft_joggen.mp3", "hash": "ef4684bb3368", "size": 16992, "group": "audio"},
+    {"url": "./audio/sentences/rechnung_bitte.mp3", "hash": "88b6b8eda86a", "size": 17568, "group": "audio"},
+    {"url": "./audio/sentences/schlafzimmer_bett.mp3", "hash": "ab456598a850", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/sein_bruder_wohnt_berlin.mp3", "hash": "05dd4b2a5535", "size": 19296, "group": "audio"},
+    {"url": "./audio/sentences/sie_ist_aerztin.mp3", "hash": "0af504d6e704", "size": 15552, "group": "audio"},
+    {"url": "./audio/sentences/sie_sind_aerzte.mp3", "hash": "9cc37777c959", "size": 15120, "group": "audio"},
+    {"url": "./audio/sentences/sie_sind_arzt.mp3", "hash": "3cf2bffeff44", "size": 15120, "group": "audio"},
+    {"url": "./audio/sentences/sie_trinkt_kaffee.mp3", "hash": "d8cfe016fe2d", "size": 16704, "group": "audio"},
+    {"url": "./audio/sentences/spielt_gitarre.mp3", "hash": "861acb967da4", "size": 22032, "group": "audio"},
+    {"url": "./audio/sentences/studiere_informatik.mp3", "hash": "e32b24fd6e4f", "size": 26784, "group": "audio"},
+    {"url": "./audio/sentences/suche_tasche.mp3", "hash": "c32246e48f01", "size": 17424, "group": "audio"},
+    {"url": "./audio/sentences/supermarkt_geoeffnet.mp3", "hash": "6b690178ab02", "size": 21888, "group": "audio"},
+    {"url": "./audio/sentences/tennis_spielen.mp3", "hash": "94e2675eca59", "size": 18000, "group": "audio"},
+    {"url": "./audio/sentences/trinke_wasser_kein_saft.mp3", "hash": "b86af2578977", "size": 23328, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent01.mp3", "hash": "596275126e56", "size": 18576, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent02.mp3", "hash": "0a9565192a58", "size": 18576, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent03.mp3", "hash": "181942ab29f3", "size": 13968, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent04.mp3", "hash": "1c29c05250eb", "size": 16992, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent05.mp3", "hash": "9621dceb3cb3", "size": 15408, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent06.mp3", "hash": "0155696be7fe", "size": 16560, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent07.mp3", "hash": "a986a0f155d3", "size": 17568, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent08.mp3", "hash": "a21ba43df619", "size": 19584, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent09.mp3", "hash": "cee94a2ba41d", "size": 16560, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent10.mp3", "hash": "0b00c98ce516", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent11.mp3", "hash": "d07058867508", "size": 17424, "group": "audio"},
+    {"url": "./audio/sentences/unit09_sent12.mp3", "hash": "8943655d6d76", "size": 20304, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent01.mp3", "hash": "708ec428985d", "size": 21312, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent02.mp3", "hash": "fbd6a39d36b0", "size": 20304, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent03.mp3", "hash": "45b9c7756378", "size": 20736, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent04.mp3", "hash": "3716639de32b", "size": 19152, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent05.mp3", "hash": "35013c1f5c77", "size": 19584, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent06.mp3", "hash": "9be2221362f3", "size": 19728, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent07.mp3", "hash": "90d2ecca7933", "size": 23904, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent08.mp3", "hash": "01d9b451b482", "size": 23904, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent09.mp3", "hash": "cab21d8ff7f7", "size": 25344, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent10.mp3", "hash": "652d25eb67e5", "size": 24480, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent11.mp3", "hash": "33e1d8215498", "size": 18288, "group": "audio"},
+    {"url": "./audio/sentences/unit10_sent12.mp3", "hash": "3e26f53f71fe", "size": 20304, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent01.mp3", "hash": "d18724138e75", "size": 14832, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent02.mp3", "hash": "8cbe7ddfe917", "size": 21888, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent03.mp3", "hash": "8685c487c428", "size": 21888, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent04.mp3", "hash": "62552569f56e", "size": 20016, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent05.mp3", "hash": "a158bbf85731", "size": 16992, "group": "audio"},
+    {"url": "./audio/sentences/unit11_sent06.mp3", "hash": "774db0fd69b0", "size": 19008, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent01.mp3", "hash": "ecc457d9ae9a", "size": 17856, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent02.mp3", "hash": "76da9d4258bd", "size": 15696, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent03.mp3", "hash": "46269f22c9d8", "size": 19152, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent04.mp3", "hash": "b8773d1df4c1", "size": 27504, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent05.mp3", "hash": "597895cee3de", "size": 25632, "group": "audio"},
+    {"url": "./audio/sentences/unit12_sent06.mp3", "hash": "01a63bbc95dd", "size": 25632, "group": "audio"},
+    {"url": "./audio/sentences/unsere_kinder_5_8.mp3", "hash": "353328107a35", "size": 26928, "group": "audio"},
+    {"url": "./audio/sentences/vater_ingenieur.mp3", "hash": "34e2737bd276", "size": 19440, "group": "audio"},
+    {"url": "./audio/sentences/verdient_geld.mp3", "hash": "745c1aa05682", "size": 17568, "group": "audio"},
+    {"url": "./audio/sentences/verheiratet_zwei_kinder.mp3", "hash": "323f8ea40732", "size": 25920, "group": "audio"},
+    {"url": "./audio/sentences/was_bist_du_beruf.mp3", "hash": "00b819d961b0", "size": 16848, "group": "audio"},
+    {"url": "./audio/sentences/was_hobbys.mp3", "hash": "e81b9f4afe14", "size": 16560, "group": "audio"},
+    {"url": "./audio/sentences/was_machst_beruflich.mp3", "hash": "cf7e996c985c", "size": 17136, "group": "audio"},
+    {"url": "./audio/sentences/wie_viel_kostet_buch.mp3", "hash": "eabf2f439e1e", "size": 18288, "group": "audio"},
+    {"url": "./audio/sentences/wir_arbeiten_buero.mp3", "hash": "0ecefbff2b13", "size": 17712, "group": "audio"},
+    {"url": "./audio/sentences/wir_moegen_obst_gemuese.mp3", "hash": "8343d5d4605b", "size": 21024, "group": "audio"},
+    {"url": "./audio/sentences/wir_sind_studenten.mp3", "hash": "2287e276a592", "size": 16416, "group": "audio"},
+    {"url": "./audio/sentences/wo_bezahlen.mp3", "hash": "32bd7b20fd7b", "size": 16992, "group": "audio"},
+    {"url": "./audio/sentences/wo_wohnst_du.mp3", "hash": "a0266d78ae98", "size": 12240, "group": "audio"},
+    {"url": "./audio/sentences/wochenende_kino.mp3", "hash": "7920084c14d0", "size": 21312, "group": "audio"},
+    {"url": "./audio/sentences/wohne_wohnung.mp3", "hash": "9d23523fc27f", "size": 18576, "group": "audio"},
+    {"url": "./audio/sentences/wohnung_drei_zimmer.mp3", "hash": "d4038deefcc9", "size": 18432, "group": "audio"},
+    {"url": "./audio/sentences/wohnzimmer_gross.mp3", "hash": "070e4e7bef0d", "size": 18432, "group": "audio"},
+    {"url": "./audio/sentences/wohnzimmer_sofa.mp3", "hash": "120e717f3e73", "size": 20448, "group": "audio"},
+    {"url": "./audio/sentences/zu_teuer.mp3", "hash": "078a584adcf8", "size": 15696, "group": "audio"},
+    {"url": "./audio/sentences/zum_arzt.mp3", "hash": "61180edd2f7c", "size": 18144, "group": "audio"},
+    {"url": "./audio/vocab/abendessen.mp3", "hash": "ec8ddc5b10b9", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/aerztin.mp3", "hash": "305aa726efa3", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/alt.mp3", "hash": "e7656cc2648d", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/anwalt.mp3", "hash": "daff5aa61d47", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/apfel.mp3", "hash": "ca8fb2761f6b", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/apotheke.mp3", "hash": "8f10647a723b", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/arbeiten.mp3", "hash": "cd6a5d4aa55f", "size": 12816, "group": "audio"},
+    {"url": "./audio/vocab/arm.mp3", "hash": "96f70ace8fd7", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/arzt.mp3", "hash": "98f6b140dfda", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/auge.mp3", "hash": "e314af96bcf4", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/ausruhen.mp3", "hash": "f8383b8cb1b6", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/badezimmer.mp3", "hash": "752df18d7d31", "size": 15264, "group": "audio"},
+    {"url": "./audio/vocab/baeckerei.mp3", "hash": "61b5b4283d06", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/balkon.mp3", "hash": "18fce8a324a4", "size": 14112, "group": "audio"},
+    {"url": "./audio/vocab/banane.mp3", "hash": "504c8be06009", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/basketball.mp3", "hash": "2653bf6e7dc2", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/bauch.mp3", "hash": "362d3c1d553b", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/bauchschmerzen.mp3", "hash": "43392a059697", "size": 13968, "group": "audio"},
+    {"url": "./audio/vocab/bein.mp3", "hash": "1c2f0dcd3194", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/beruf.mp3", "hash": "56c5aeb77a6b", "size": 13392, "group": "audio"},
+    {"url": "./audio/vocab/bett.mp3", "hash": "9906345b7228", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/bezahlen.mp3", "hash": "d7b8152d1a4c", "size": 13392, "group": "audio"},
+    {"url": "./audio/vocab/bier.mp3", "hash": "d8c5a0bb2ea2", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/billig.mp3", "hash": "a41f8b86d97a", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/bin.mp3", "hash": "caa9a311113b", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/bist.mp3", "hash": "6a0453e91103", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/brauchen.mp3", "hash": "e112f36270c6", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/brot.mp3", "hash": "3eeda76ae886", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/bruder.mp3", "hash": "6236c83df1b8", "size": 12960, "group": "audio"},
+    {"url": "./audio/vocab/buch.mp3", "hash": "ef136524a8a6", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/buchhandlung.mp3", "hash": "b81ef919dc84", "size": 14112, "group": "audio"},
+    {"url": "./audio/vocab/buero.mp3", "hash": "26e552aa0ba1", "size": 12816, "group": "audio"},
+    {"url": "./audio/vocab/butter.mp3", "hash": "e0eb7a5c5573", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/cent.mp3", "hash": "c44618138be5", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/computerspiel.mp3", "hash": "65369bc2aa71", "size": 15552, "group": "audio"},
+    {"url": "./audio/vocab/du.mp3", "hash": "323909197d3d", "size": 8928, "group": "audio"},
+    {"url": "./audio/vocab/ei.mp3", "hash": "73b74c3ec603", "size": 9216, "group": "audio"},
+    {"url": "./audio/vocab/eltern.mp3", "hash": "0173ec88e1ca", "size": 13536, "group": "audio"},
+    {"url": "./audio/vocab/er.mp3", "hash": "79452eb716d4", "size": 9360, "group": "audio"},
+    {"url": "./audio/vocab/erkaeltung.mp3", "hash": "5db1df22bfa5", "size": 13392, "group": "audio"},
+    {"url": "./audio/vocab/es.mp3", "hash": "d4e7e84bbd5d", "size": 9360, "group": "audio"},
+    {"url": "./audio/vocab/euro.mp3", "hash": "517fe7aa0cfd", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/familie.mp3", "hash": "160a91f26329", "size": 13680, "group": "audio"},
+    {"url": "./audio/vocab/fenster.mp3", "hash": "d48c59208345", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/fernsehen.mp3", "hash": "2ec46510ae67", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/fieber.mp3", "hash": "367cafdd0cfa", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/firma.mp3", "hash": "aa40db09ac11", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/fisch.mp3", "hash": "613ca824bf24", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/fleisch.mp3", "hash": "4fecbce33998", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/fotografieren.mp3", "hash": "212a96853f4f", "size": 15120, "group": "audio"},
+    {"url": "./audio/vocab/frau.mp3", "hash": "c0c66513a9f6", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/freizeit.mp3", "hash": "b6880ee2b0a7", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/freund.mp3", "hash": "d6791ea9eee0", "size": 13536, "group": "audio"},
+    {"url": "./audio/vocab/freundin.mp3", "hash": "399cb6ca99a1", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/friseur.mp3", "hash": "3668ebfe6258", "size": 13536, "group": "audio"},
+    {"url": "./audio/vocab/fruehstueck.mp3", "hash": "a6deb008308e", "size": 12816, "group": "audio"},
+    {"url": "./audio/vocab/fuss.mp3", "hash": "dae1c1fd5077", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/fussball.mp3", "hash": "3db1befd9b3c", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/garten.mp3", "hash": "c68312fe6042", "size": 13680, "group": "audio"},
+    {"url": "./audio/vocab/geben.mp3", "hash": "650df7d4442e", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/geld.mp3", "hash": "22cd0a4287b2", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/gemuese.mp3", "hash": "0df6283a60c4", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/geschaeft.mp3", "hash": "524b3865e569", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/geschieden.mp3", "hash": "071357f808e9", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/geschwister.mp3", "hash": "231c12baa5cd", "size": 14112, "group": "audio"},
+    {"url": "./audio/vocab/gesund_sein.mp3", "hash": "81817664b1d0", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/gitarre.mp3", "hash": "7918cbbdeab0", "size": 12096, "group": "audio"},
+    {"url": "./audio/vocab/grippe.mp3", "hash": "5c477a1233c3", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/gross.mp3", "hash": "2fff78d06213", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/grossmutter.mp3", "hash": "89671fea863e", "size": 14688, "group": "audio"},
+    {"url": "./audio/vocab/grossvater.mp3", "hash": "99361fbbab7e", "size": 14688, "group": "audio"},
+    {"url": "./audio/vocab/halsschmerzen.mp3", "hash": "1e304d735f24", "size": 13968, "group": "audio"},
+    {"url": "./audio/vocab/hand.mp3", "hash": "04e65331065b", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/haus.mp3", "hash": "7726ae216c58", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/helfen.mp3", "hash": "39bfd75c1c0e", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/hemd.mp3", "hash": "aa46fc94b92b", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/herd.mp3", "hash": "20a4c5486b71", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/hobby.mp3", "hash": "e25b2e416f02", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/hoeren.mp3", "hash": "095ff1a575b2", "size": 11232, "group": "audio"},
+    {"url": "./audio/vocab/hose.mp3", "hash": "af1484808b60", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/huhn.mp3", "hash": "66f87dd06330", "size": 10080, "group": "audio"},
+    {"url": "./audio/vocab/husten.mp3", "hash": "d3c94c5f80e4", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/ich.mp3", "hash": "311646386f8a", "size": 8928, "group": "audio"},
+    {"url": "./audio/vocab/ihr.mp3", "hash": "a7061d8a5b83", "size": 9216, "group": "audio"},
+    {"url": "./audio/vocab/ingenieur.mp3", "hash": "50128dbb94f9", "size": 14400, "group": "audio"},
+    {"url": "./audio/vocab/interessant.mp3", "hash": "66f27e605778", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/ist.mp3", "hash": "114bcd72f842", "size": 9792, "group": "audio"},
+    {"url": "./audio/vocab/joggen.mp3", "hash": "b37b81894603", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/kaese.mp3", "hash": "89069d1b9b6f", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/kaffee.mp3", "hash": "b27c0524ac4a", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/kartoffel.mp3", "hash": "7651ba121b0b", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/kaufen.mp3", "hash": "b2e2a407bc35", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/kellner.mp3", "hash": "daf38816ff1b", "size": 13536, "group": "audio"},
+    {"url": "./audio/vocab/kind.mp3", "hash": "e33397879ecd", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/kinder.mp3", "hash": "b4e1363aa875", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/kino.mp3", "hash": "baf103f7f8b3", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/klavier.mp3", "hash": "281e85ed0c16", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/kleidung.mp3", "hash": "b087e42d4e5f", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/klein.mp3", "hash": "ce32e924aff3", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/koch.mp3", "hash": "eb3408a33b2e", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/kochen.mp3", "hash": "26def661e9ee", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/konzert.mp3", "hash": "8cb78f3c4137", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/kopf.mp3", "hash": "6f6051d882c4", "size": 9648, "group": "audio"},
+    {"url": "./audio/vocab/kopfschmerzen.mp3", "hash": "1cadedad9a04", "size": 14256, "group": "audio"},
+    {"url": "./audio/vocab/kosten.mp3", "hash": "cbc3a3794153", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/krank_sein.mp3", "hash": "adae7f381d12", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/krankenhaus.mp3", "hash": "93245c0cd01b", "size": 13968, "group": "audio"},
+    {"url": "./audio/vocab/krankenschwester.mp3", "hash": "ffba50e61b56", "size": 16128, "group": "audio"},
+    {"url": "./audio/vocab/kueche.mp3", "hash": "e35f1f4b7b60", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/kuehlschrank.mp3", "hash": "12392de1982c", "size": 14832, "group": "audio"},
+    {"url": "./audio/vocab/lampe.mp3", "hash": "f57bfb1d5b0e", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/ledig.mp3", "hash": "ddc627454cc4", "size": 11520, "group": "audio"},
+    {"url": "./audio/vocab/lehrer.mp3", "hash": "21347ca824e5", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/lehrerin.mp3", "hash": "ee7fc6e0bb27", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/lernen.mp3", "hash": "65a906ed2806", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/lesen.mp3", "hash": "9ffb376c9269", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/malen.mp3", "hash": "6cc89849187b", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/mann.mp3", "hash": "e7178bf77ac6", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/markt.mp3", "hash": "e7ea0a2c64dd", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/mechaniker.mp3", "hash": "8f089a871886", "size": 14832, "group": "audio"},
+    {"url": "./audio/vocab/medikament.mp3", "hash": "c0c51bb82405", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/miete.mp3", "hash": "39819c71e402", "size": 12528, "group": "audio"},
+    {"url": "./audio/vocab/milch.mp3", "hash": "fbeb0ca27318", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/mittagessen.mp3", "hash": "53c0e218bc6d", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/mund.mp3", "hash": "9360f6a47560", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/museum.mp3", "hash": "4b208ab1d5f8", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/musik.mp3", "hash": "760ed4234bfc", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/mutter.mp3", "hash": "8c636817ea44", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/nase.mp3", "hash": "79afc944a962", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/nehmen.mp3", "hash": "9de1d7a82995", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/neu.mp3", "hash": "8ee73afbf387", "size": 9792, "group": "audio"},
+    {"url": "./audio/vocab/nudeln.mp3", "hash": "53d3e6db3f5f", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/obst.mp3", "hash": "6b4ee753f4af", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/ohr.mp3", "hash": "89aed20e6a2b", "size": 9504, "group": "audio"},
+    {"url": "./audio/vocab/orange.mp3", "hash": "291fde2a3407", "size": 11520, "group": "audio"},
+    {"url": "./audio/vocab/pizza.mp3", "hash": "46f83964c063", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/polizist.mp3", "hash": "fea6691458b9", "size": 14544, "group": "audio"},
+    {"url": "./audio/vocab/preis.mp3", "hash": "d98015dba885", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/programmierer.mp3", "hash": "52f4f8ecfe2e", "size": 15408, "group": "audio"},
+    {"url": "./audio/vocab/radfahren.mp3", "hash": "986b5b21ac07", "size": 13392, "group": "audio"},
+    {"url": "./audio/vocab/rechnung.mp3", "hash": "ba15df165d7e", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/reis.mp3", "hash": "723db5f2c9a7", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/restaurant.mp3", "hash": "97f4f4d4cf75", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/ruecken.mp3", "hash": "14a62db7d554", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/saft.mp3", "hash": "35ee4c6b3ece", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/salat.mp3", "hash": "e268b3f512de", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/schlafzimmer.mp3", "hash": "8ec0395db205", "size": 14688, "group": "audio"},
+    {"url": "./audio/vocab/schnupfen.mp3", "hash": "e86635e743bc", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/schrank.mp3", "hash": "474c6b024b67", "size": 12528, "group": "audio"},
+    {"url": "./audio/vocab/schuhe.mp3", "hash": "13bbb4aa1cd7", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/schwester.mp3", "hash": "4a6df2e480a9", "size": 13392, "group": "audio"},
+    {"url": "./audio/vocab/schwimmen.mp3", "hash": "1e30d5b74a85", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/seid.mp3", "hash": "cc4abf97364a", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/sie.mp3", "hash": "b22beab2b50d", "size": 8928, "group": "audio"},
+    {"url": "./audio/vocab/sie_plural.mp3", "hash": "b22beab2b50d", "size": 8928, "group": "audio"},
+    {"url": "./audio/vocab/sind.mp3", "hash": "7a11ca5f025a", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/singen.mp3", "hash": "8d826fcad034", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/sofa.mp3", "hash": "6700b30e51e7", "size": 12960, "group": "audio"},
+    {"url": "./audio/vocab/sohn.mp3", "hash": "0988ab76b0d8", "size": 12528, "group": "audio"},
+    {"url": "./audio/vocab/spass.mp3", "hash": "74f3201111b4", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/spazieren_gehen.mp3", "hash": "1033f730aec1", "size": 15840, "group": "audio"},
+    {"url": "./audio/vocab/speisekarte.mp3", "hash": "e3b0c44298fc", "size": 0, "group": "audio"},
+    {"url": "./audio/vocab/spiel.mp3", "hash": "a2eb1eee0681", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/spielen.mp3", "hash": "64a65472a80c", "size": 12960, "group": "audio"},
+    {"url": "./audio/vocab/student.mp3", "hash": "31e7dcdef7f2", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/studentin.mp3", "hash": "0f2f552e499d", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/studieren.mp3", "hash": "221f04fdb1d1", "size": 14256, "group": "audio"},
+    {"url": "./audio/vocab/stuhl.mp3", "hash": "fb4158bbf967", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/suchen.mp3", "hash": "c4789c8fe47c", "size": 12096, "group": "audio"},
+    {"url": "./audio/vocab/supermarkt.mp3", "hash": "2712874b3ca8", "size": 13824, "group": "audio"},
+    {"url": "./audio/vocab/suppe.mp3", "hash": "0732b4cb9d76", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/tablette.mp3", "hash": "249a96aaf9c3", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/tanzen.mp3", "hash": "a14da8fc9182", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/tasche.mp3", "hash": "ba3fd5bc0bce", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/tee.mp3", "hash": "c7d062bb5c64", "size": 9216, "group": "audio"},
+    {"url": "./audio/vocab/tennis.mp3", "hash": "5e7604282694", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/teuer.mp3", "hash": "f0eaf4eb8027", "size": 10368, "group": "audio"},
+    {"url": "./audio/vocab/theater.mp3", "hash": "719c3d55845a", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/tisch.mp3", "hash": "60458bd7580e", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/tochter.mp3", "hash": "9d84ae427393", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/tomate.mp3", "hash": "33aaceb74899", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/treffen.mp3", "hash": "33b01fe739d5", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/tuer.mp3", "hash": "27b4c9f76d5a", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/unit09_april.mp3", "hash": "3242c2a03e21", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/unit09_august.mp3", "hash": "204441cbe9a1", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/unit09_dezember.mp3", "hash": "f73ff80ca897", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/unit09_februar.mp3", "hash": "d9c7e3771623", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/unit09_fruehling.mp3", "hash": "c54f041f3f5a", "size": 13680, "group": "audio"},
+    {"url": "./audio/vocab/unit09_heiss.mp3", "hash": "acdfa7a8dabd", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/unit09_herbst.mp3", "hash": "22070cc2ccb4", "size": 13104, "group": "audio"},
+    {"url": "./audio/vocab/unit09_januar.mp3", "hash": "d123839f7874", "size": 11664, "group": "audio"},
+    {"url": "./audio/vocab/unit09_juli.mp3", "hash": "3df508a792db", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/unit09_juni.mp3", "hash": "d7872f34ca98", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/unit09_kalt.mp3", "hash": "3c652a1a8359", "size": 11376, "group": "audio"},
+    {"url": "./audio/vocab/unit09_kuehl.mp3", "hash": "cbd07dff7f89", "size": 10224, "group": "audio"},
+    {"url": "./audio/vocab/unit09_maerz.mp3", "hash": "b226c5e85415", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/unit09_mai.mp3", "hash": "1c25ce7a5986", "size": 9216, "group": "audio"},
+    {"url": "./audio/vocab/unit09_november.mp3", "hash": "e9a918a3fc00", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/unit09_oktober.mp3", "hash": "e09f3cae4254", "size": 12240, "group": "audio"},
+    {"url": "./audio/vocab/unit09_regen.mp3", "hash": "d5d9b9c5b693", "size": 12816, "group": "audio"},
+    {"url": "./audio/vocab/unit09_regnerisch.mp3", "hash": "4d376091c932", "size": 13536, "group": "audio"},
+    {"url": "./audio/vocab/unit09_schnee.mp3", "hash": "a4b4433a06c5", "size": 11952, "group": "audio"},
+    {"url": "./audio/vocab/unit09_september.mp3", "hash": "8535b7b437be", "size": 12816, "group": "audio"},
+    {"url": "./audio/vocab/unit09_sommer.mp3", "hash": "3e9a367968ef", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/unit09_sonne.mp3", "hash": "591561828e2c", "size": 11808, "group": "audio"},
+    {"url": "./audio/vocab/unit09_sonnig.mp3", "hash": "f6c9e8019fb5", "size": 11088, "group": "audio"},
+    {"url": "./audio/vocab/unit09_warm.mp3", "hash": "b983db956d9e", "size": 10800, "group": "audio"},
+    {"url": "./audio/vocab/unit09_wind.mp3", "hash": "b1e5e764191b", "size": 12384, "group": "audio"},
+    {"url": "./audio/vocab/unit09_winter.mp3", "hash": "ce682a525f89", "size": 12672, "group": "audio"},
+    {"url": "./audio/vocab/unit09_wolke.mp3", "hash": "5d0078bceea5", "size": 12960, "group": "audio"},
+    {"url": "./audio/vocab/untersuchen.mp3", "hash": "7e2b904ed2be", "size": 14256, "group": "audio"},
+    {"url": "./audio/vocab/vater.mp3", "hash": "788a23ab05b4", "size": 12960, "group": "audio"},
+    {"url": "./audio/vocab/verdienen.mp3", "hash": "167ee38f18d4", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/verheiratet.mp3", "hash": "61599a4a6833", "size": 14544, "group": "audio"},
+    {"url": "./audio/vocab/verkaeufer.mp3", "hash": "cc05d83292de", "size": 14544, "group": "audio"},
+    {"url": "./audio/vocab/verkaufen.mp3", "hash": "ab1e931d2d49", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/wasser.mp3", "hash": "d180f7953f2a", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/wehtun.mp3", "hash": "2dcbd05747ad", "size": 12096, "group": "audio"},
+    {"url": "./audio/vocab/wein.mp3", "hash": "dd3a847c7e73", "size": 10512, "group": "audio"},
+    {"url": "./audio/vocab/wir.mp3", "hash": "e675f5f272d4", "size": 10656, "group": "audio"},
+    {"url": "./audio/vocab/wohnung.mp3", "hash": "c45c9d44a363", "size": 13248, "group": "audio"},
+    {"url": "./audio/vocab/wohnzimmer.mp3", "hash": "77e6e1187397", "size": 14256, "group": "audio"},
+    {"url": "./audio/vocab/zahn.mp3", "hash": "f47a4089c565", "size": 10944, "group": "audio"},
+    {"url": "./audio/vocab/zimmer.mp3", "hash": "9e0b5a65b5a2", "size": 13392, "group": "audio"}
+  ],
+  "chapters": [
+    {"page": "./content/chapter00.html", "audio": ["./audio/alphabet/a.mp3", "./audio/alphabet/b.mp3", "./audio/alphabet/c.mp3", "./audio/alphabet/d.mp3", "./audio/alphabet/e.mp3", "./audio/alphabet/f.mp3", "./audio/alphabet/g.mp3", "./audio/alphabet/h.mp3", "./audio/alphabet/i.mp3", "./audio/alphabet/j.mp3", "./audio/alphabet/k.mp3", "./audio/alphabet/l.mp3", "./audio/alphabet/m.mp3", "./audio/alphabet/n.mp3", "./audio/alphabet/o.mp3", "./audio/alphabet/p.mp3", "./audio/alphabet/q.mp3", "./audio/alphabet/r.mp3", "./audio/alphabet/s.mp3", "./audio/alphabet/t.mp3", "./audio/alphabet/u.mp3", "./audio/alphabet/v.mp3", "./audio/alphabet/w.mp3", "./audio/alphabet/x.mp3", "./audio/alphabet/y.mp3", "./audio/alphabet/z.mp3", "./audio/alphabet/ae.mp3", "./audio/alphabet/oe.mp3", "./audio/alphabet/ue.mp3", "./audio/alphabet/ss.mp3", "./audio/pronunciation/r_sound.mp3", "./audio/pronunciation/ch_sound.mp3", "./audio/pronunciation/umlaut_practice.mp3", "./audio/pronunciation/z_s_sound.mp3", "./audio/pronunciation/v_w_sound.mp3", "./audio/pronunciation/vowel_length.mp3", "./audio/pronunciation/ex1_1.mp3", "./audio/pronunciation/ex1_2.mp3", "./audio/pronunciation/ex1_3.mp3", "./audio/pronunciation/ex2_1.mp3", "./audio/pronunciation/ex2_2.mp3", "./audio/pronunciation/ex2_3.mp3", "./audio/pronunciation/spell_anna.mp3"]},
+    {"page": "./content/chapter01.html", "audio": ["./audio/vocab/ich.mp3", "./audio/vocab/du.mp3", "./audio/vocab/er.mp3", "./audio/vocab/sie.mp3", "./audio/vocab/es.mp3", "./audio/vocab/wir.mp3", "./audio/vocab/ihr.mp3", "./audio/vocab/sie_plural.mp3", "./audio/vocab/bin.mp3", "./audio/vocab/bist.mp3", "./audio/vocab/ist.mp3", "./audio/vocab/sind.mp3", "./audio/vocab/seid.mp3", "./audio/vocab/student.mp3", "./audio/vocab/studentin.mp3", "./audio/vocab/lehrer.mp3", "./audio/vocab/lehrerin.mp3", "./audio/vocab/arzt.mp3", "./audio/vocab/aerztin.mp3", "./audio/vocab/freund.mp3", "./audio/vocab/freundin.mp3", "./audio/vocab/buch.mp3", "./audio/sentences/ich_bin_student.mp3", "./audio/sentences/ich_bin_lehrerin.mp3", "./audio/sentences/ich_bin_soldat.mp3", "./audio/sentences/du_bist_freund.mp3", "./audio/sentences/sie_sind_arzt.mp3", "./audio/sentences/er_ist_student.mp3", "./audio/sentences/sie_ist_aerztin.mp3", "./audio/sentences/es_ist_buch.mp3", "./audio/sentences/wir_sind_studenten.mp3", "./audio/sentences/ihr_seid_lehrer.mp3", "./audio/sentences/sie_sind_aerzte.mp3", "./audio/dialogues/d1_line1.mp3", "./audio/dialogues/d1_line2.mp3", "./audio/dialogues/d1_line3.mp3", "./audio/dialogues/d1_line4.mp3", "./audio/dialogues/d1_line5.mp3", "./audio/dialogues/d2_line1.mp3", "./audio/dialogues/d2_line2.mp3", "./audio/dialogues/d2_line3.mp3", "./audio/dialogues/d2_line4.mp3", "./audio/dialogues/d2_line5.mp3", "./audio/dialogues/d2_line6.mp3", "./audio/dialogues/d3_line1.mp3", "./audio/dialogues/d3_line2.mp3", "./audio/dialogues/d3_line3.mp3", "./audio/dialogues/d3_line4.mp3"]},
+    {"page": "./content/chapter02.html", "audio": ["./audio/vocab/familie.mp3", "./audio/vocab/eltern.mp3", "./audio/vocab/vater.mp3", "./audio/vocab/mutter.mp3", "./audio/vocab/bruder.mp3", "./audio/vocab/schwester.mp3", "./audio/vocab/geschwister.mp3", "./audio/vocab/sohn.mp3", "./audio/vocab/tochter.mp3", "./audio/vocab/kind.mp3", "./audio/vocab/kinder.mp3", "./audio/vocab/grossvater.mp3", "./audio/vocab/grossmutter.mp3", "./audio/vocab/freund.mp3", "./audio/vocab/freundin.mp3", "./audio/vocab/mann.mp3", "./audio/vocab/frau.mp3", "./audio/vocab/verheiratet.mp3", "./audio/vocab/ledig.mp3", "./audio/vocab/geschieden.mp3", "./audio/sentences/das_ist_meine_familie.mp3", "./audio/sentences/mein_vater_heisst_thomas.mp3", "./audio/sentences/meine_mutter_ist_45.mp3", "./audio/sentences/ich_habe_bruder_schwester.mp3", "./audio/sentences/sein_bruder_wohnt_berlin.mp3", "./audio/sentences/ihre_schwester_lehrerin.mp3", "./audio/sentences/unsere_kinder_5_8.mp3", "./audio/sentences/dein_vater_nett.mp3", "./audio/sentences/grosseltern_hamburg.mp3", "./audio/sentences/verheiratet_zwei_kinder.mp3", "./audio/sentences/ledig_keine_kinder.mp3", "./audio/sentences/freundin_anna.mp3", "./audio/dialogues/d2_01.mp3", "./audio/dialogues/d2_02.mp3", "./audio/dialogues/d2_03.mp3", "./audio/dialogues/d2_04.mp3", "./audio/dialogues/d2_05.mp3", "./audio/dialogues/d2_06.mp3", "./audio/dialogues/d2_07.mp3", "./audio/dialogues/d2_08.mp3", "./audio/dialogues/d2_09.mp3", "./audio/dialogues/d2_10.mp3", "./audio/dialogues/d2_11.mp3", "./audio/dialogues/d2_12.mp3", "./audio/dialogues/d2_13.mp3", "./audio/dialogues/d2_14.mp3", "./audio/dialogues/d2_15.mp3", "./audio/dialogues/d2_16.mp3", "./audio/dialogues/d2_17.mp3"]},
+    {"page": "./content/chapter03.html", "audio": ["./audio/vocab/beruf.mp3", "./audio/vocab/arzt.mp3", "./audio/vocab/lehrer.mp3", "./audio/vocab/ingenieur.mp3", "./audio/vocab/krankenschwester.mp3", "./audio/vocab/koch.mp3", "./audio/vocab/verkaeufer.mp3", "./audio/vocab/kellner.mp3", "./audio/vocab/mechaniker.mp3", "./audio/vocab/polizist.mp3", "./audio/vocab/friseur.mp3", "./audio/vocab/student.mp3", "./audio/vocab/anwalt.mp3", "./audio/vocab/programmierer.mp3", "./audio/vocab/arbeiten.mp3", "./audio/vocab/studieren.mp3", "./audio/vocab/lernen.mp3", "./audio/vocab/verdienen.mp3", "./audio/vocab/firma.mp3", "./audio/vocab/buero.mp3", "./audio/sentences/was_bist_du_beruf.mp3", "./audio/sentences/ich_bin_lehrer.mp3", "./audio/sentences/sie_ist_aerztin.mp3", "./audio/sentences/ich_arbeite_firma.mp3", "./audio/sentences/er_studiert_medizin.mp3", "./audio/sentences/wir_arbeiten_buero.mp3", "./audio/sentences/vater_ingenieur.mp3", "./audio/sentences/krankenschwester.mp3", "./audio/sentences/studiere_informatik.mp3", "./audio/sentences/was_machst_beruflich.mp3", "./audio/sentences/lerne_deutsch.mp3", "./audio/sentences/verdient_geld.mp3", "./audio/dialogues/d3_01.mp3", "./audio/dialogues/d3_02.mp3", "./audio/dialogues/d3_03.mp3", "./audio/dialogues/d3_04.mp3", "./audio/dialogues/d3_05.mp3", "./audio/dialogues/d3_06.mp3", "./audio/dialogues/d3_07.mp3", "./audio/dialogues/d3_08.mp3", "./audio/dialogues/d3_09.mp3", "./audio/dialogues/d3_10.mp3", "./audio/dialogues/d3_11.mp3", "./audio/dialogues/d3_12.mp3", "./audio/dialogues/d3_13.mp3", "./audio/dialogues/d3_14.mp3", "./audio/dialogues/d3_15.mp3", "./audio/dialogues/d3_16.mp3"]},
+    {"page": "./content/chapter04.html", "audio": ["./audio/vocab/wohnung.mp3", "./audio/vocab/haus.mp3", "./audio/vocab/zimmer.mp3", "./audio/vocab/wohnzimmer.mp3", "./audio/vocab/schlafzimmer.mp3", "./audio/vocab/kueche.mp3", "./audio/vocab/badezimmer.mp3", "./audio/vocab/balkon.mp3", "./audio/vocab/garten.mp3", "./audio/vocab/sofa.mp3", "./audio/vocab/tisch.mp3", "./audio/vocab/stuhl.mp3", "./audio/vocab/bett.mp3", "./audio/vocab/schrank.mp3", "./audio/vocab/lampe.mp3", "./audio/vocab/kuehlschrank.mp3", "./audio/vocab/herd.mp3", "./audio/vocab/fenster.mp3", "./audio/vocab/tuer.mp3", "./audio/vocab/miete.mp3", "./audio/sentences/wohne_wohnung.mp3", "./audio/sentences/wohnung_drei_zimmer.mp3", "./audio/sentences/wohnzimmer_gross.mp3", "./audio/sentences/schlafzimmer_bett.mp3", "./audio/sentences/kueche_klein_modern.mp3", "./audio/sentences/haben_balkon.mp3", "./audio/sentences/haus_garten.mp3", "./audio/sentences/wohnzimmer_sofa.mp3", "./audio/sentences/miete_800_euro.mp3", "./audio/sentences/wo_wohnst_du.mp3", "./audio/dialogues/d4_01.mp3", "./audio/dialogues/d4_02.mp3", "./audio/dialogues/d4_03.mp3", "./audio/dialogues/d4_04.mp3", "./audio/dialogues/d4_05.mp3", "./audio/dialogues/d4_06.mp3", "./audio/dialogues/d4_07.mp3", "./audio/dialogues/d4_08.mp3", "./audio/dialogues/d4_09.mp3", "./audio/dialogues/d4_10.mp3", "./audio/dialogues/d4_11.mp3", "./audio/dialogues/d4_12.mp3"]},
+    {"page": "./content/chapter05.html", "audio": ["./audio/vocab/brot.mp3", "./audio/vocab/pizza.mp3", "./audio/vocab/kaese.mp3", "./audio/vocab/butter.mp3", "./audio/vocab/ei.mp3", "./audio/vocab/milch.mp3", "./audio/vocab/fleisch.mp3", "./audio/vocab/fisch.mp3", "./audio/vocab/huhn.mp3", "./audio/vocab/reis.mp3", "./audio/vocab/nudeln.mp3", "./audio/vocab/kartoffel.mp3", "./audio/vocab/salat.mp3", "./audio/vocab/suppe.mp3", "./audio/vocab/obst.mp3", "./audio/vocab/gemuese.mp3", "./audio/vocab/apfel.mp3", "./audio/vocab/banane.mp3", "./audio/vocab/orange.mp3", "./audio/vocab/tomate.mp3", "./audio/vocab/wasser.mp3", "./audio/vocab/kaffee.mp3", "./audio/vocab/tee.mp3", "./audio/vocab/saft.mp3", "./audio/vocab/bier.mp3", "./audio/vocab/wein.mp3", "./audio/vocab/fruehstueck.mp3", "./audio/vocab/mittagessen.mp3", "./audio/vocab/abendessen.mp3", "./audio/vocab/restaurant.mp3", "./audio/vocab/speisekarte.mp3", "./audio/vocab/rechnung.mp3", "./audio/sentences/ich_esse_brot_fruehstueck.mp3", "./audio/sentences/magst_du_pizza.mp3", "./audio/sentences/sie_trinkt_kaffee.mp3", "./audio/sentences/wir_moegen_obst_gemuese.mp3", "./audio/sentences/isst_du_fleisch_fisch.mp3", "./audio/sentences/mittagessen_reis_huhn.mp3", "./audio/sentences/trinke_wasser_kein_saft.mp3", "./audio/sentences/moechten_speisekarte.mp3", "./audio/sentences/rechnung_bitte.mp3", "./audio/sentences/esse_gern_schokolade.mp3", "./audio/dialogues/d5_01.mp3", "./audio/dialogues/d5_02.mp3", "./audio/dialogues/d5_03.mp3", "./audio/dialogues/d5_04.mp3", "./audio/dialogues/d5_05.mp3", "./audio/dialogues/d5_06.mp3", "./audio/dialogues/d5_07.mp3", "./audio/dialogues/d5_08.mp3", "./audio/dialogues/d5_09.mp3", "./audio/dialogues/d5_10.mp3", "./audio/dialogues/d5_11.mp3", "./audio/dialogues/d5_12.mp3", "./audio/dialogues/d5_13.mp3", "./audio/dialogues/d5_14.mp3", "./audio/dialogues/d5_15.mp3", "./audio/dialogues/d5_16.mp3"]},
+    {"page": "./content/chapter06.html", "audio": ["./audio/vocab/supermarkt.mp3", "./audio/vocab/geschaeft.mp3", "./audio/vocab/markt.mp3", "./audio/vocab/baeckerei.mp3", "./audio/vocab/apotheke.mp3", "./audio/vocab/buchhandlung.mp3", "./audio/vocab/preis.mp3", "./audio/vocab/geld.mp3", "./audio/vocab/euro.mp3", "./audio/vocab/cent.mp3", "./audio/vocab/bezahlen.mp3", "./audio/vocab/kosten.mp3", "./audio/vocab/kaufen.mp3", "./audio/vocab/verkaufen.mp3", "./audio/vocab/brauchen.mp3", "./audio/vocab/suchen.mp3", "./audio/vocab/nehmen.mp3", "./audio/vocab/geben.mp3", "./audio/vocab/kleidung.mp3", "./audio/vocab/hemd.mp3", "./audio/vocab/hose.mp3", "./audio/vocab/schuhe.mp3", "./audio/vocab/buch.mp3", "./audio/vocab/tasche.mp3", "./audio/vocab/teuer.mp3", "./audio/vocab/billig.mp3", "./audio/vocab/gross.mp3", "./audio/vocab/klein.mp3", "./audio/vocab/neu.mp3", "./audio/vocab/alt.mp3", "./audio/sentences/wie_viel_kostet_buch.mp3", "./audio/sentences/kostet_15_euro.mp3", "./audio/sentences/kaufe_zwei_aepfel.mp3", "./audio/sentences/brauche_neue_schuhe.mp3", "./audio/sentences/zu_teuer.mp3", "./audio/sentences/wo_bezahlen.mp3", "./audio/sentences/nehme_hemd.mp3", "./audio/sentences/groesse_m.mp3", "./audio/sentences/supermarkt_geoeffnet.mp3", "./audio/sentences/suche_tasche.mp3", "./audio/dialogues/d6_01.mp3", "./audio/dialogues/d6_02.mp3", "./audio/dialogues/d6_03.mp3", "./audio/dialogues/d6_04.mp3", "./audio/dialogues/d6_05.mp3", "./audio/dialogues/d6_06.mp3", "./audio/dialogues/d6_07.mp3", "./audio/dialogues/d6_08.mp3", "./audio/dialogues/d6_09.mp3", "./audio/dialogues/d6_10.mp3", "./audio/dialogues/d6_11.mp3", "./audio/dialogues/d6_12.mp3", "./audio/dialogues/d6_13.mp3", "./audio/dialogues/d6_14.mp3", "./audio/dialogues/d6_15.mp3", "./audio/dialogues/d6_16.mp3", "./audio/dialogues/d6_17.mp3", "./audio/dialogues/d6_18.mp3"]},
+    {"page": "./content/chapter07.html", "audio": ["./audio/vocab/fussball.mp3", "./audio/vocab/tennis.mp3", "./audio/vocab/schwimmen.mp3", "./audio/vocab/joggen.mp3", "./audio/vocab/radfahren.mp3", "./audio/vocab/basketball.mp3", "./audio/vocab/lesen.mp3", "./audio/vocab/malen.mp3", "./audio/vocab/kochen.mp3", "./audio/vocab/tanzen.mp3", "./audio/vocab/singen.mp3", "./audio/vocab/fotografieren.mp3", "./audio/vocab/gitarre.mp3", "./audio/vocab/klavier.mp3", "./audio/vocab/musik.mp3", "./audio/vocab/hoeren.mp3", "./audio/vocab/spielen.mp3", "./audio/vocab/konzert.mp3", "./audio/vocab/fernsehen.mp3", "./audio/vocab/kino.mp3", "./audio/vocab/theater.mp3", "./audio/vocab/museum.mp3", "./audio/vocab/spazieren_gehen.mp3", "./audio/vocab/treffen.mp3", "./audio/vocab/spiel.mp3", "./audio/vocab/computerspiel.mp3", "./audio/vocab/freizeit.mp3", "./audio/vocab/hobby.mp3", "./audio/vocab/spass.mp3", "./audio/vocab/interessant.mp3", "./audio/sentences/kann_schwimmen.mp3", "./audio/sentences/spielt_gitarre.mp3", "./audio/sentences/was_hobbys.mp3", "./audio/sentences/wochenende_kino.mp3", "./audio/sentences/lese_buch.mp3", "./audio/sentences/tennis_spielen.mp3", "./audio/sentences/oft_joggen.mp3", "./audio/sentences/fussball_spass.mp3", "./audio/sentences/hoert_musik.mp3", "./audio/sentences/museum_interessant.mp3", "./audio/dialogues/d7_01.mp3", "./audio/dialogues/d7_02.mp3", "./audio/dialogues/d7_03.mp3", "./audio/dialogues/d7_04.mp3", "./audio/dialogues/d7_05.mp3", "./audio/dialogues/d7_06.mp3", "./audio/dialogues/d7_07.mp3", "./audio/dialogues/d7_08.mp3", "./audio/dialogues/d7_09.mp3", "./audio/dialogues/d7_10.mp3", "./audio/dialogues/d7_11.mp3", "./audio/dialogues/d7_12.mp3", "./audio/dialogues/d7_13.mp3", "./audio/dialogues/d7_14.mp3", "./audio/dialogues/d7_15.mp3", "./audio/dialogues/d7_16.mp3"]},
+    {"page": "./content/chapter08.html", "audio": ["./audio/vocab/kopf.mp3", "./audio/vocab/bauch.mp3", "./audio/vocab/ruecken.mp3", "./audio/vocab/bein.mp3", "./audio/vocab/arm.mp3", "./audio/vocab/hand.mp3", "./audio/vocab/fuss.mp3", "./audio/vocab/auge.mp3", "./audio/vocab/ohr.mp3", "./audio/vocab/nase.mp3", "./audio/vocab/mund.mp3", "./audio/vocab/zahn.mp3", "./audio/vocab/fieber.mp3", "./audio/vocab/husten.mp3", "./audio/vocab/schnupfen.mp3", "./audio/vocab/grippe.mp3", "./audio/vocab/erkaeltung.mp3", "./audio/vocab/kopfschmerzen.mp3", "./audio/vocab/bauchschmerzen.mp3", "./audio/vocab/halsschmerzen.mp3", "./audio/vocab/arzt.mp3", "./audio/vocab/aerztin.mp3", "./audio/vocab/krankenhaus.mp3", "./audio/vocab/apotheke.mp3", "./audio/vocab/medikament.mp3", "./audio/vocab/tablette.mp3", "./audio/vocab/wehtun.mp3", "./audio/vocab/krank_sein.mp3", "./audio/vocab/gesund_sein.mp3", "./audio/vocab/ausruhen.mp3", "./audio/vocab/untersuchen.mp3", "./audio/vocab/helfen.mp3", "./audio/sentences/kopfschmerzen.mp3", "./audio/sentences/bauch_weh.mp3", "./audio/sentences/bin_krank.mp3", "./audio/sentences/zum_arzt.mp3", "./audio/sentences/hat_fieber.mp3", "./audio/sentences/medikamente_nehmen.mp3", "./audio/sentences/erkaeltung.mp3", "./audio/sentences/ausruhen.mp3", "./audio/sentences/gute_besserung.mp3", "./audio/sentences/apotheke_wo.mp3", "./audio/dialogues/d8_01.mp3", "./audio/dialogues/d8_02.mp3", "./audio/dialogues/d8_03.mp3", "./audio/dialogues/d8_04.mp3", "./audio/dialogues/d8_05.mp3", "./audio/dialogues/d8_06.mp3", "./audio/dialogues/d8_07.mp3", "./audio/dialogues/d8_08.mp3", "./audio/dialogues/d8_09.mp3", "./audio/dialogues/d8_10.mp3", "./audio/dialogues/d8_11.mp3", "./audio/dialogues/d8_12.mp3", "./audio/dialogues/d8_13.mp3", "./audio/dialogues/d8_14.mp3", "./audio/dialogues/d8_15.mp3"]},
+    {"page": "./content/chapter09.html", "audio": ["./audio/vocab/unit09_fruehling.mp3", "./audio/vocab/unit09_sommer.mp3", "./audio/vocab/unit09_herbst.mp3", "./audio/vocab/unit09_winter.mp3", "./audio/vocab/unit09_sonne.mp3", "./audio/vocab/unit09_regen.mp3", "./audio/vocab/unit09_schnee.mp3", "./audio/vocab/unit09_wind.mp3", "./audio/vocab/unit09_wolke.mp3", "./audio/vocab/unit09_sonnig.mp3", "./audio/vocab/unit09_warm.mp3", "./audio/vocab/unit09_heiss.mp3", "./audio/vocab/unit09_kalt.mp3", "./audio/vocab/unit09_kuehl.mp3", "./audio/vocab/unit09_regnerisch.mp3", "./audio/vocab/unit09_januar.mp3", "./audio/vocab/unit09_februar.mp3", "./audio/vocab/unit09_maerz.mp3", "./audio/vocab/unit09_april.mp3", "./audio/vocab/unit09_mai.mp3", "./audio/vocab/unit09_juni.mp3", "./audio/vocab/unit09_juli.mp3", "./audio/vocab/unit09_august.mp3", "./audio/vocab/unit09_september.mp3", "./audio/vocab/unit09_oktober.mp3", "./audio/vocab/unit09_november.mp3", "./audio/vocab/unit09_dezember.mp3", "./audio/sentences/unit09_sent01.mp3", "./audio/sentences/unit09_sent02.mp3", "./audio/sentences/unit09_sent03.mp3", "./audio/sentences/unit09_sent04.mp3", "./audio/sentences/unit09_sent05.mp3", "./audio/sentences/unit09_sent06.mp3", "./audio/sentences/unit09_sent07.mp3", "./audio/sentences/unit09_sent08.mp3", "./audio/sentences/unit09_sent09.mp3", "./audio/sentences/unit09_sent10.mp3", "./audio/sentences/unit09_sent11.mp3", "./audio/sentences/unit09_sent12.mp3", "./audio/dialogues/unit09_dialog01.mp3", "./audio/dialogues/unit09_dialog02.mp3", "./audio/dialogues/unit09_dialog03.mp3"]},
+    {"page": "./content/chapter10.html", "audio": ["./audio/sentences/unit10_sent01.mp3", "./audio/sentences/unit10_sent02.mp3", "./audio/sentences/unit10_sent03.mp3", "./audio/sentences/unit10_sent04.mp3", "./audio/sentences/unit10_sent05.mp3", "./audio/sentences/unit10_sent06.mp3", "./audio/sentences/unit10_sent07.mp3", "./audio/sentences/unit10_sent08.mp3", "./audio/sentences/unit10_sent09.mp3", "./audio/sentences/unit10_sent10.mp3", "./audio/sentences/unit10_sent11.mp3", "./audio/sentences/unit10_sent12.mp3", "./audio/dialogues/unit10_dialog01.mp3", "./audio/dialogues/unit10_dialog02.mp3", "./audio/dialogues/unit10_dialog03.mp3"]},
+    {"page": "./content/chapter11.html", "audio": ["./audio/sentences/unit11_sent01.mp3", "./audio/sentences/unit11_sent02.mp3", "./audio/sentences/unit11_sent03.mp3", "./audio/sentences/unit11_sent04.mp3", "./audio/sentences/unit11_sent05.mp3", "./audio/sentences/unit11_sent06.mp3", "./audio/dialogues/unit11_dialog01.mp3", "./audio/dialogues/unit11_dialog02.mp3", "./audio/dialogues/unit11_dialog03.mp3"]},
+    {"page": "./content/chapter12.html", "audio": ["./audio/sentences/unit12_sent01.mp3", "./audio/sentences/unit12_sent02.mp3", "./audio/sentences/unit12_sent03.mp3", "./audio/sentences/unit12_sent04.mp3", "./audio/sentences/unit12_sent05.mp3", "./audio/sentences/unit12_sent06.mp3", "./audio/dialogues/unit12_dialog01.mp3", "./audio/dialogues/unit12_dialog02.mp3", "./audio/dialogues/unit12_dialog03.mp3"]}
+  ]
+};
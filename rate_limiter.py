@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate limiting and retry helpers for the TTS client
+
+TokenBucket caps the request rate, AdaptiveConcurrency grows the number of
+requests in flight while they succeed and halves it on errors or timeouts
+(AIMD), and backoff_delay() gives exponential backoff with full jitter for
+retries.
+"""
+import asyncio
+import random
+import time
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average, bursts up to `burst`
+
+    A rate of None or 0 disables the limit.
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate or 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self.lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on requests in flight
+
+    Every success adds increase/limit (about +increase per round of
+    requests), every failure multiplies the limit by `decrease`.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=32, increase=1.0, decrease=0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self.peak = self.limit
+        self.condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, success):
+        async with self.condition:
+            self.in_flight -= 1
+            if success:
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            else:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            self.peak = max(self.peak, self.limit)
+            self.condition.notify_all()
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0):
+    """Full-jitter exponential backoff before retry number `attempt` (0-based)"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class Throughput:
+    """Counts finished requests to report achieved requests per second"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.failures = 0
+
+    def record(self, success):
+        self.requests += 1
+        if not success:
+            self.failures += 1
+
+    def per_second(self):
+        elapsed = time.monotonic() - self.started
+        return self.requests / elapsed if elapsed > 0 else 0.0
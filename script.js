@@ -1,24 +1,386 @@
-// Audio playback function with error handling
-function play(src) {
-  const audio = new Audio(src);
-  
+// Audio variants: build_audio_variants.py lists smaller encodings of each
+// clip (Opus, low-bitrate MP3) in audio-variants.json, smallest first.
+// Single clips play from the smallest one this browser supports. Without
+// ffmpeg none are built: a 404 is remembered for the rest of the session so
+// later pages don't ask again.
+const SITE_ROOT = new URL('.', document.currentScript ? document.currentScript.src : location.href);
+const VARIANTS_URL = new URL('audio-variants.json', SITE_ROOT).href;
+const VARIANTS_MISSING = 'audio-variants-missing:' + VARIANTS_URL;
+const audioVariants = {
+  clips: null,
+  supported: {}
+};
+
+function sessionFlag(key, value) {
+  try {
+    if (value) {
+      sessionStorage.setItem(key, '1');
+    }
+    return sessionStorage.getItem(key) === '1';
+  } catch (error) {
+    return false; // storage disabled: ask every time
+  }
+}
+
+function loadAudioVariants() {
+  if (!window.fetch || sessionFlag(VARIANTS_MISSING)) {
+    return Promise.resolve();
+  }
+  return fetch(VARIANTS_URL).then(function(response) {
+    if (response.status === 404) {
+      sessionFlag(VARIANTS_MISSING, true);
+    }
+    return response.ok ? response.json() : null;
+  }).then(function(manifest) {
+    if (manifest && manifest.clips) {
+      audioVariants.clips = manifest.clips;
+    }
+  }).catch(function() {
+    // No variants built: clips play as MP3
+  });
+}
+
+function canPlayType(type) {
+  if (!(type in audioVariants.supported)) {
+    audioVariants.supported[type] = document.createElement('audio').canPlayType(type) !== '';
+  }
+  return audioVariants.supported[type];
+}
+
+function bestSource(src) {
+  const url = new URL(src, location.href).href;
+  const entry = audioVariants.clips && url.indexOf(SITE_ROOT.href) === 0 &&
+    audioVariants.clips[url.slice(SITE_ROOT.href.length)];
+  if (!entry) {
+    return src;
+  }
+  for (let i = 0; i < entry.variants.length; i++) {
+    if (canPlayType(entry.variants[i].type)) {
+      return new URL(entry.variants[i].url, SITE_ROOT).href;
+    }
+  }
+  return src;
+}
+
+// Audio packs: build_audio_packs.py concatenates a page's clips into
+// <page>.audio.mp3 with an offset index in <page>.audio.json. When the index
+// loads, clips are cut out of the pack the browser already has instead of
+// fetched one by one; anything not in a pack comes from its own file. Only
+// pages whose script tag names their index in data-audio-pack (build_site.py
+// sets it on pages with audio) have one, so other pages request nothing.
+const PACK_INDEX = document.currentScript && document.currentScript.getAttribute('data-audio-pack');
+const audioPacks = {
+  index: null,
+  url: null,
+  bytes: []
+};
+
+function packIndexUrl() {
+  return PACK_INDEX ? new URL(PACK_INDEX, location.href).href : null;
+}
+
+function loadAudioPacks() {
+  const url = packIndexUrl();
+  if (!url || !window.fetch) {
+    return Promise.resolve();
+  }
+  return fetch(url).then(function(response) {
+    return response.ok ? response.json() : null;
+  }).then(function(index) {
+    if (!index || !index.packs || !index.packs.length) {
+      return;
+    }
+    audioPacks.index = index;
+    audioPacks.url = new URL(url, location.href);
+    console.log('Audio packs loaded:', index.packs.join(', '));
+  }).catch(function() {
+    // No packs for this page: every clip plays from its own file
+  });
+}
+
+// Encoded bytes of one pack, fetched once per page
+function packBytes(number) {
+  if (!audioPacks.bytes[number]) {
+    const url = new URL(audioPacks.index.packs[number], audioPacks.url).href;
+    audioPacks.bytes[number] = fetchBytes(url).catch(function(error) {
+      audioPacks.bytes[number] = null;
+      throw error;
+    });
+  }
+  return audioPacks.bytes[number];
+}
+
+// Web Audio engine: one shared AudioContext and an LRU of decoded buffers,
+// so a repeated tap starts the clip synchronously without fetching or
+// decoding again. Only one clip sounds at a time.
+const AUDIO_BUFFER_BUDGET = 32 * 1024 * 1024; // bytes of decoded samples kept
+const audioEngine = {
+  context: null,
+  buffers: new Map(), // src -> { buffer, promise, bytes }, least recently used first
+  bytes: 0,
+  source: null,
+  requested: null
+};
+
+function audioContext() {
+  if (!audioEngine.context) {
+    const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+    if (!AudioContextClass) {
+      return null;
+    }
+    audioEngine.context = new AudioContextClass();
+  }
+  return audioEngine.context;
+}
+
+function fetchBytes(url) {
+  return fetch(url).then(function(response) {
+    if (!response.ok) {
+      throw new Error('HTTP ' + response.status + ' for ' + url);
+    }
+    return response.arrayBuffer();
+  });
+}
+
+function decodeBytes(bytes) {
+  const context = audioContext();
+  // Older Safari only has the callback form of decodeAudioData
+  return new Promise(function(resolve, reject) {
+    const result = context.decodeAudioData(bytes, resolve, reject);
+    if (result && result.then) {
+      result.then(resolve, reject);
+    }
+  });
+}
+
+// Encoded bytes of one clip: its slice of the pack, or its own file in the
+// best supported format, falling back to the original MP3
+function decodeClip(src) {
+  const clip = audioPacks.index && audioPacks.index.clips[src];
+  if (clip) {
+    return packBytes(clip.pack).then(function(bytes) {
+      return decodeBytes(bytes.slice(clip.byteOffset, clip.byteOffset + clip.byteLength));
+    });
+  }
+  const url = bestSource(src);
+  const decoded = fetchBytes(url).then(decodeBytes);
+  if (url === src) {
+    return decoded;
+  }
+  return decoded.catch(function() {
+    console.warn('Audio variant failed, decoding original:', url);
+    return fetchBytes(src).then(decodeBytes);
+  });
+}
+
+function rememberBuffer(src, entry) {
+  audioEngine.buffers.delete(src);
+  audioEngine.buffers.set(src, entry);
+  audioEngine.bytes += entry.bytes;
+  const iterator = audioEngine.buffers.keys();
+  while (audioEngine.bytes > AUDIO_BUFFER_BUDGET && audioEngine.buffers.size > 1) {
+    const oldest = iterator.next().value;
+    audioEngine.bytes -= audioEngine.buffers.get(oldest).bytes;
+    audioEngine.buffers.delete(oldest);
+  }
+}
+
+function loadBuffer(src) {
+  const cached = audioEngine.buffers.get(src);
+  if (cached) {
+    // Move to the most recently used end
+    audioEngine.buffers.delete(src);
+    audioEngine.buffers.set(src, cached);
+    return cached;
+  }
+  const entry = { buffer: null, promise: null, bytes: 0 };
+  entry.promise = decodeClip(src).then(function(buffer) {
+    entry.buffer = buffer;
+    entry.bytes = buffer.length * buffer.numberOfChannels * 4;
+    if (audioEngine.buffers.get(src) === entry) {
+      rememberBuffer(src, entry);
+    }
+    return buffer;
+  }, function(error) {
+    audioEngine.buffers.delete(src);
+    throw error;
+  });
+  audioEngine.buffers.set(src, entry);
+  return entry;
+}
+
+function startBuffer(buffer) {
+  const context = audioEngine.context;
+  if (audioEngine.source) {
+    audioEngine.source.onended = null;
+    audioEngine.source.stop();
+  }
+  const source = context.createBufferSource();
+  source.buffer = buffer;
+  source.connect(context.destination);
+  source.onended = function() {
+    if (audioEngine.source === source) {
+      audioEngine.source = null;
+    }
+  };
+  source.start(0);
+  audioEngine.source = source;
+}
+
+// Fallback for browsers without Web Audio, and for files it can't decode
+function playFile(src) {
+  const url = bestSource(src);
+  const audio = new Audio(url);
+  let variant = url !== src;
+
   audio.addEventListener('error', function(e) {
+    if (variant) {
+      console.warn('Audio variant failed, playing original:', url);
+      variant = false;
+      audio.src = src;
+      audio.play().catch(function() {});
+      return;
+    }
     console.error('Error loading audio file:', src);
     console.error('Error details:', e);
     // Show user-friendly message
     alert('ไฟล์เสียงยังไม่พร้อมใช้งาน\nAudio file not available yet: ' + src);
   });
-  
+
   audio.addEventListener('canplay', function() {
     console.log('Audio file loaded successfully:', src);
   });
-  
+
   audio.play().catch(function(error) {
     console.error('Playback error:', error);
   });
 }
 
-// Preload audio when page loads (optional)
+// Audio playback function with error handling
+function play(src) {
+  const context = audioContext();
+  if (!context || !window.fetch) {
+    playFile(src);
+    return;
+  }
+  if (context.state === 'suspended') {
+    context.resume();
+  }
+  const entry = loadBuffer(src);
+  audioEngine.requested = src;
+  if (entry.buffer) {
+    startBuffer(entry.buffer);
+    return;
+  }
+  entry.promise.then(function(buffer) {
+    // A later tap wins over a clip that was still decoding
+    if (audioEngine.requested === src) {
+      startBuffer(buffer);
+    }
+  }).catch(function(error) {
+    console.error('Web Audio playback failed, using <audio>:', src, error);
+    playFile(src);
+  });
+}
+
+// Chapters 09-14 call playAudio()
+function playAudio(src) {
+  play(src);
+}
+
+// Decode the clips of buttons as they scroll into view, two at a time, so
+// even the first tap on a button starts without waiting
+const AUDIO_CALL = /play(?:Audio)?\(\s*['"]([^'"]+\.mp3)['"]\s*\)/;
+const preloadQueue = [];
+let preloading = 0;
+
+function preloadNext() {
+  while (preloading < 2 && preloadQueue.length) {
+    const src = preloadQueue.shift();
+    if (audioEngine.buffers.has(src)) {
+      continue;
+    }
+    preloading++;
+    loadBuffer(src).promise.catch(function() {}).then(function() {
+      preloading--;
+      preloadNext();
+    });
+  }
+}
+
+function preloadVisibleButtons() {
+  if (!window.IntersectionObserver || !audioContext() || !window.fetch) {
+    return;
+  }
+  const observer = new IntersectionObserver(function(entries) {
+    entries.forEach(function(entry) {
+      if (!entry.isIntersecting) {
+        return;
+      }
+      observer.unobserve(entry.target);
+      preloadQueue.push(entry.target.dataset.audioSrc);
+    });
+    preloadNext();
+  }, { rootMargin: '200px 0px' });
+  document.querySelectorAll('[onclick*="play"]').forEach(function(element) {
+    const match = AUDIO_CALL.exec(element.getAttribute('onclick'));
+    if (match) {
+      element.dataset.audioSrc = match[1];
+      observer.observe(element);
+    }
+  });
+}
+
+// Ask the service worker to prefetch this chapter's audio, and the next
+// chapter's, in the formats this browser will pick
+function requestPrefetch() {
+  const worker = navigator.serviceWorker && navigator.serviceWorker.controller;
+  if (!worker) {
+    return;
+  }
+  const types = {};
+  Object.keys(audioVariants.clips || {}).forEach(function(path) {
+    audioVariants.clips[path].variants.forEach(function(variant) {
+      types[variant.type] = true;
+    });
+  });
+  worker.postMessage({
+    type: 'chapter-open',
+    page: location.href,
+    types: Object.keys(types).filter(canPlayType)
+  });
+}
+
+// Storage used by the app and its audio cache, as reported by the service
+// worker from navigator.storage.estimate()
+function audioStorageReport() {
+  const worker = navigator.serviceWorker && navigator.serviceWorker.controller;
+  if (!worker) {
+    return Promise.resolve(null);
+  }
+  return new Promise(function(resolve) {
+    const channel = new MessageChannel();
+    channel.port1.onmessage = function(event) {
+      resolve(event.data);
+    };
+    worker.postMessage({ type: 'storage-report' }, [channel.port2]);
+  });
+}
+
+function whenIdle(callback) {
+  if (window.requestIdleCallback) {
+    window.requestIdleCallback(callback, { timeout: 3000 });
+  } else {
+    setTimeout(callback, 1000);
+  }
+}
+
+// Load this page's audio packs and the variant list when the page loads,
+// then start preloading and prefetching
 document.addEventListener('DOMContentLoaded', function() {
+  Promise.all([loadAudioPacks(), loadAudioVariants()]).then(function() {
+    preloadVisibleButtons();
+    whenIdle(requestPrefetch);
+  });
   console.log('Page loaded. Audio system ready.');
-});
\ No newline at end of file
+});
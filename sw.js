@@ -1,36 +1,70 @@
-const CACHE_NAME = 'vimapp-german-v1.0.0';
-const urlsToCache = [
-  './',
-  './index.html',
-  './style.css',
-  './script.js',
-  './chapters/chapter00.html',
-  './chapters/chapter01.html',
-  './chapters/chapter02.html',
-  './chapters/chapter03.html',
-  './chapters/chapter04.html',
-  './chapters/chapter05.html',
-  './chapters/chapter06.html',
-  './chapters/chapter07.html',
-  './chapters/chapter08.html',
-  './chapters/chapter09.html',
-  './chapters/chapter10.html',
-  './chapters/chapter11.html',
-  './chapters/chapter12.html',
-  './chapters/chapter13.html',
-  './chapters/chapter14.html',
-  './manifest.json'
-];
-
-// Install event - cache files
+importScripts('./precache-manifest.js');
+
+// Generated by build_precache.py: every asset with its content hash
+const MANIFEST = self.PRECACHE_MANIFEST;
+const CACHE_NAME = 'vimapp-german';
+const SCOPE = self.registration.scope;
+
+const assetsByUrl = new Map(
+  MANIFEST.assets.map(asset => [new URL(asset.url, SCOPE).href, asset])
+);
+
+// Cache entries are keyed by URL plus content hash: a changed file gets a new
+// key, unchanged files keep theirs across versions and are never refetched.
+function cacheKey(asset) {
+  return new URL(asset.url, SCOPE).href + '?v=' + asset.hash;
+}
+
+function findAsset(request) {
+  const url = new URL(request.url);
+  url.search = '';
+  url.hash = '';
+  if (url.href === SCOPE) {
+    return assetsByUrl.get(new URL('./index.html', SCOPE).href);
+  }
+  return assetsByUrl.get(url.href);
+}
+
+// Audio lives in its own cache, held to a byte budget: access times are
+// kept in IndexedDB and the least recently played files are evicted first,
+// except those of the chapters the learner opened most recently.
+const AUDIO_CACHE = CACHE_NAME + '-audio';
+const AUDIO_BUDGET = 40 * 1024 * 1024;
+const AUDIO_QUOTA_SHARE = 0.5; // never plan on more than half the origin's quota
+const PINNED_CHAPTERS = 2;
+const AUDIO_DB = 'vimapp-audio-cache';
+
+function isAudio(url) {
+  return /\.(mp3|webm|ogg)$/.test(new URL(url).pathname);
+}
+
+function cacheFor(url) {
+  return caches.open(isAudio(url) ? AUDIO_CACHE : CACHE_NAME);
+}
+
+function withoutVersion(key) {
+  return String(key).split('?')[0];
+}
+
+// Install event - cache the app shell, downloading only changed files
 self.addEventListener('install', event => {
-  console.log('Service Worker: Installing...');
+  console.log('Service Worker: Installing version', MANIFEST.version);
+  const shell = MANIFEST.assets.filter(asset => asset.group === 'shell');
   event.waitUntil(
     caches.open(CACHE_NAME)
-      .then(cache => {
-        console.log('Service Worker: Caching files');
-        return cache.addAll(urlsToCache);
-      })
+      .then(cache => Promise.all(shell.map(asset =>
+        cache.match(cacheKey(asset)).then(cached => {
+          if (cached) {
+            return;
+          }
+          return fetch(new Request(asset.url, { cache: 'no-cache' })).then(response => {
+            if (!response.ok) {
+              throw new Error('Failed to fetch ' + asset.url);
+            }
+            return cache.put(cacheKey(asset), response);
+          });
+        })
+      )))
       .then(() => {
         console.log('Service Worker: Installation complete');
         self.skipWaiting();
@@ -38,27 +72,34 @@ self.addEventListener('install', event => {
   );
 });
 
-// Activate event - clean up old caches
+// Activate event - drop old caches and entries for outdated file versions
 self.addEventListener('activate', event => {
   console.log('Service Worker: Activating...');
+  const currentKeys = new Set(MANIFEST.assets.map(cacheKey));
   event.waitUntil(
     caches.keys().then(cacheNames => {
       return Promise.all(
         cacheNames.map(cacheName => {
-          if (cacheName !== CACHE_NAME) {
+          if (cacheName !== CACHE_NAME && cacheName !== AUDIO_CACHE) {
             console.log('Service Worker: Deleting old cache:', cacheName);
             return caches.delete(cacheName);
           }
         })
       );
-    }).then(() => {
+    }).then(() => Promise.all([CACHE_NAME, AUDIO_CACHE].map(name => caches.open(name).then(cache =>
+      cache.keys().then(requests => Promise.all(
+        requests
+          .filter(request => new URL(request.url).searchParams.has('v') && !currentKeys.has(request.url))
+          .map(request => cache.delete(request).then(() => forgetAudio(request.url)))
+      ))
+    )))).then(() => {
       console.log('Service Worker: Activation complete');
       self.clients.claim();
     })
   );
 });
 
-// Fetch event - serve from cache, fallback to network
+// Fetch event - the only fetch path: serve from cache, fallback to network
 self.addEventListener('fetch', event => {
   // Skip non-GET requests
   if (event.request.method !== 'GET') {
@@ -70,8 +111,15 @@ self.addEventListener('fetch', event => {
     return;
   }
 
+  const asset = findAsset(event.request);
+  if (isAudio(event.request.url)) {
+    event.respondWith(audioResponse(event, asset).then(response => rangeResponse(event.request, response)));
+    return;
+  }
+  const key = asset ? cacheKey(asset) : event.request;
+
   event.respondWith(
-    caches.match(event.request)
+    caches.open(CACHE_NAME).then(cache => cache.match(key)
       .then(response => {
         // Return cached version if available
         if (response) {
@@ -87,53 +135,378 @@ self.addEventListener('fetch', event => {
             return response;
           }
 
-          // Clone the response for caching
-          const responseToCache = response.clone();
-
-          // Cache audio files and other assets
-          if (event.request.url.includes('.mp3') || 
-              event.request.url.includes('.css') || 
-              event.request.url.includes('.js') ||
-              event.request.url.includes('.html')) {
-            caches.open(CACHE_NAME)
-              .then(cache => {
-                cache.put(event.request, responseToCache);
-              });
+          // Cache pages, styles, scripts and other assets
+          const url = event.request.url;
+          if (asset || url.includes('.css') || url.includes('.js') || url.includes('.html') ||
+              url.includes('.audio.json')) {
+            cache.put(key, response.clone());
+            notePackIndex(url, response.clone());
           }
 
           return response;
         });
-      })
+      }))
       .catch(() => {
         // Offline fallback
         if (event.request.destination === 'document') {
-          return caches.match('./index.html');
+          const index = new URL('./index.html', SCOPE).href;
+          const asset = assetsByUrl.get(index);
+          return caches.match(asset ? cacheKey(asset) : index);
         }
       })
   );
 });
 
-// Handle audio file requests specially
-self.addEventListener('fetch', event => {
-  if (event.request.url.includes('/audio/')) {
-    event.respondWith(
-      caches.match(event.request)
-        .then(response => {
-          if (response) {
-            return response;
-          }
-          // Try to fetch and cache audio file
-          return fetch(event.request).then(response => {
-            if (response.status === 200) {
-              const responseClone = response.clone();
-              caches.open(CACHE_NAME).then(cache => {
-                cache.put(event.request, responseClone);
-              });
-            }
-            return response;
-          });
-        })
-    );
+// Audio comes from the audio cache, else out of a cached chapter pack, else
+// from the network. The network request is always for the whole file (no
+// Range header) so it can be cached; rangeResponse() cuts the range after.
+function audioResponse(event, asset) {
+  const key = asset ? cacheKey(asset) : withoutVersion(event.request.url);
+  return caches.open(AUDIO_CACHE).then(cache => cache.match(key).then(cached => {
+    if (cached) {
+      console.log('Service Worker: Serving from cache:', event.request.url);
+      event.waitUntil(touchAudio(key));
+      return cached;
+    }
+    return fromPack(event.request.url).then(sliced => {
+      if (sliced) {
+        console.log('Service Worker: Serving from pack:', event.request.url);
+        return sliced;
+      }
+      console.log('Service Worker: Fetching from network:', event.request.url);
+      return fetch(new Request(event.request.url, { credentials: 'same-origin' })).then(response => {
+        if (response && response.status === 200 && response.type === 'basic') {
+          event.waitUntil(storeAudio(cache, key, response.clone(), asset).then(enforceAudioBudget));
+        }
+        return response;
+      });
+    });
+  }));
+}
+
+// Answer a Range request (Safari probes with bytes=0-1 before playing) with
+// 206 Partial Content cut from the full response, or 416 if out of bounds
+function rangeResponse(request, response) {
+  const range = request.headers.get('range');
+  if (!range || !response || response.status !== 200) {
+    return response;
+  }
+  return response.blob().then(blob => {
+    const type = response.headers.get('Content-Type') || blob.type || 'audio/mpeg';
+    const match = /^bytes=(\d*)-(\d*)$/.exec(range.trim());
+    if (!match || (!match[1] && !match[2])) {
+      // Not a single byte range we understand: ignore it, like a server would
+      return new Response(blob, { headers: { 'Content-Type': type, 'Accept-Ranges': 'bytes' } });
+    }
+    let start = NaN;
+    let end = blob.size - 1;
+    if (match[1]) {
+      start = Number(match[1]);
+      if (match[2]) {
+        end = Math.min(Number(match[2]), blob.size - 1);
+      }
+    } else {
+      start = Math.max(0, blob.size - Number(match[2]));
+    }
+    if (!(start <= end)) {
+      return new Response(null, {
+        status: 416,
+        statusText: 'Range Not Satisfiable',
+        headers: { 'Content-Range': 'bytes */' + blob.size }
+      });
+    }
+    return new Response(blob.slice(start, end + 1), {
+      status: 206,
+      statusText: 'Partial Content',
+      headers: {
+        'Content-Type': type,
+        'Content-Length': String(end - start + 1),
+        'Content-Range': 'bytes ' + start + '-' + end + '/' + blob.size,
+        'Accept-Ranges': 'bytes'
+      }
+    });
+  });
+}
+
+// Clips inside chapter packs (build_audio_packs.py), by absolute URL, read
+// from the pack indexes in the cache
+const packedClips = new Map();
+let packIndexes = null;
+
+function indexPack(indexUrl, index) {
+  Object.keys(index.clips || {}).forEach(src => {
+    const clip = index.clips[src];
+    packedClips.set(new URL(src, indexUrl).href, {
+      pack: new URL(index.packs[clip.pack], indexUrl).href,
+      byteOffset: clip.byteOffset,
+      byteLength: clip.byteLength
+    });
+  });
+}
+
+function notePackIndex(url, response) {
+  if (withoutVersion(url).endsWith('.audio.json')) {
+    response.json().then(index => indexPack(withoutVersion(url), index)).catch(() => {});
+  }
+}
+
+function loadPackIndexes() {
+  if (!packIndexes) {
+    packIndexes = caches.open(CACHE_NAME).then(cache => Promise.all(chapters.map(chapter => {
+      const url = chapter.audio.find(u => u.endsWith('.audio.json'));
+      if (!url) {
+        return;
+      }
+      const absolute = new URL(url, SCOPE).href;
+      const asset = assetsByUrl.get(absolute);
+      return cache.match(asset ? cacheKey(asset) : absolute)
+        .then(response => response && response.json())
+        .then(index => index && indexPack(absolute, index));
+    }))).catch(() => {}).then(() => packedClips);
+  }
+  return packIndexes;
+}
+
+function fromPack(url) {
+  return loadPackIndexes().then(clips => {
+    const clip = clips.get(withoutVersion(url));
+    if (!clip) {
+      return null;
+    }
+    const asset = assetsByUrl.get(clip.pack);
+    return caches.open(AUDIO_CACHE)
+      .then(cache => cache.match(asset ? cacheKey(asset) : clip.pack))
+      .then(response => response && response.blob())
+      .then(blob => blob && new Response(blob.slice(clip.byteOffset, clip.byteOffset + clip.byteLength), {
+        headers: { 'Content-Type': 'audio/mpeg' }
+      }));
+  });
+}
+
+// Audio bookkeeping in IndexedDB: one record per cached audio file with its
+// size and last access time, plus the recently opened chapters
+let audioDb = null;
+
+function openAudioDb() {
+  if (!audioDb) {
+    audioDb = new Promise((resolve, reject) => {
+      const request = indexedDB.open(AUDIO_DB, 1);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore('entries', { keyPath: 'key' });
+        request.result.createObjectStore('meta');
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => {
+        audioDb = null;
+        reject(request.error);
+      };
+    });
+  }
+  return audioDb;
+}
+
+function dbTransaction(storeName, mode, operation) {
+  return openAudioDb().then(db => new Promise((resolve, reject) => {
+    const tx = db.transaction(storeName, mode);
+    const request = operation(tx.objectStore(storeName));
+    tx.oncomplete = () => resolve(request ? request.result : undefined);
+    tx.onerror = () => reject(tx.error);
+  }));
+}
+
+function touchAudio(key, size) {
+  return dbTransaction('entries', 'readwrite', store => {
+    const get = store.get(String(key));
+    get.onsuccess = () => {
+      const entry = get.result || { key: String(key), size: 0 };
+      entry.lastAccess = Date.now();
+      if (size !== undefined) {
+        entry.size = size;
+      }
+      store.put(entry);
+    };
+  }).catch(() => {});
+}
+
+function forgetAudio(key) {
+  return dbTransaction('entries', 'readwrite', store => { store.delete(String(key)); }).catch(() => {});
+}
+
+function storeAudio(cache, key, response, asset) {
+  const size = asset ? asset.size : Number(response.headers.get('content-length'));
+  return cache.put(key, response).then(() => touchAudio(key, size || 0));
+}
+
+function pinChapter(index) {
+  const page = chapters[index].page;
+  return dbTransaction('meta', 'readwrite', store => {
+    const get = store.get('pinned');
+    get.onsuccess = () => {
+      const pinned = [page].concat((get.result || []).filter(p => p !== page));
+      store.put(pinned.slice(0, PINNED_CHAPTERS), 'pinned');
+    };
+  }).catch(() => {});
+}
+
+// Every URL a pinned chapter may play, in any variant
+function pinnedUrls() {
+  return Promise.all([dbTransaction('meta', 'readonly', store => store.get('pinned')), loadAudioVariants()])
+    .then(([pinned, variants]) => {
+      const urls = new Set();
+      chapters.filter(chapter => (pinned || []).includes(chapter.page)).forEach(chapter => {
+        chapter.audio.forEach(url => {
+          urls.add(new URL(url, SCOPE).href);
+          const entry = variants[url.replace(/^\.\//, '')];
+          (entry ? entry.variants : []).forEach(v => urls.add(new URL(v.url, SCOPE).href));
+        });
+      });
+      return urls;
+    });
+}
+
+function storageEstimate() {
+  const storage = self.navigator && self.navigator.storage;
+  return storage && storage.estimate ? storage.estimate().catch(() => ({})) : Promise.resolve({});
+}
+
+function audioBudget(estimate) {
+  return estimate.quota ? Math.min(AUDIO_BUDGET, estimate.quota * AUDIO_QUOTA_SHARE) : AUDIO_BUDGET;
+}
+
+let evicting = null;
+
+function enforceAudioBudget() {
+  if (evicting) {
+    return evicting;
+  }
+  evicting = Promise.all([storageEstimate(), pinnedUrls(), dbTransaction('entries', 'readonly', store => store.getAll())])
+    .then(([estimate, pinned, entries]) => {
+      const budget = audioBudget(estimate);
+      let total = entries.reduce((sum, entry) => sum + entry.size, 0);
+      if (total <= budget) {
+        return;
+      }
+      const victims = [];
+      entries
+        .filter(entry => !pinned.has(withoutVersion(entry.key)))
+        .sort((a, b) => a.lastAccess - b.lastAccess)
+        .some(entry => {
+          victims.push(entry.key);
+          total -= entry.size;
+          return total <= budget;
+        });
+      return caches.open(AUDIO_CACHE)
+        .then(cache => Promise.all(victims.map(key => cache.delete(key))))
+        .then(() => dbTransaction('entries', 'readwrite', store => { victims.forEach(key => store.delete(key)); }))
+        .then(() => console.log('Service Worker: Evicted', victims.length, 'audio files,',
+                                Math.round(total / 1024), 'KB of audio cached'));
+    })
+    .catch(error => console.warn('Service Worker: Audio eviction failed', error))
+    .then(() => { evicting = null; });
+  return evicting;
+}
+
+function storageReport() {
+  return Promise.all([storageEstimate(), dbTransaction('entries', 'readonly', store => store.getAll()).catch(() => [])])
+    .then(([estimate, entries]) => ({
+      usage: estimate.usage,
+      quota: estimate.quota,
+      audioBytes: entries.reduce((sum, entry) => sum + entry.size, 0),
+      audioFiles: entries.length,
+      audioBudget: audioBudget(estimate)
+    }));
+}
+
+// Audio prefetch - when a chapter page opens it posts 'chapter-open'; its
+// audio (packs first) and then the next chapter's are fetched in the
+// background, a few at a time, so the first tap on a button is a cache hit.
+// Opening another chapter replaces whatever is still queued.
+const PREFETCH_CONCURRENCY = 3;
+const chapters = MANIFEST.chapters || [];
+let prefetchQueue = [];
+let prefetchRunning = 0;
+let audioVariants = null;
+
+function loadAudioVariants() {
+  if (!audioVariants) {
+    const asset = assetsByUrl.get(new URL('./audio-variants.json', SCOPE).href);
+    audioVariants = (asset ? caches.match(cacheKey(asset)) : Promise.resolve())
+      .then(response => response || fetch('./audio-variants.json'))
+      .then(response => response.ok ? response.json() : {})
+      .then(manifest => manifest.clips || {})
+      .catch(() => {
+        audioVariants = null;
+        return {};
+      });
+  }
+  return audioVariants;
+}
+
+// The page reports which MIME types it can play; pick the same variant it will
+function chapterAudio(index, types, variants) {
+  return chapters[index].audio.map(url => {
+    const entry = variants[url.replace(/^\.\//, '')];
+    const variant = entry && entry.variants.find(v => types.includes(v.type));
+    return variant ? './' + variant.url : url;
+  });
+}
+
+function prefetchNext() {
+  const url = prefetchQueue.shift();
+  if (!url) {
+    return Promise.resolve();
+  }
+  const absolute = new URL(url, SCOPE).href;
+  const asset = assetsByUrl.get(absolute);
+  const key = asset ? cacheKey(asset) : absolute;
+  return cacheFor(absolute).then(cache => cache.match(key)
+    .then(cached => cached || fetch(url, { priority: 'low' }).then(response => {
+      if (!response.ok) {
+        return;
+      }
+      if (isAudio(absolute)) {
+        return storeAudio(cache, key, response, asset);
+      }
+      notePackIndex(absolute, response.clone());
+      return cache.put(key, response);
+    })))
+    .catch(() => {})
+    .then(prefetchNext);
+}
+
+function schedulePrefetch(pageUrl, types) {
+  const page = new URL(pageUrl);
+  page.search = '';
+  page.hash = '';
+  const index = chapters.findIndex(chapter => new URL(chapter.page, SCOPE).href === page.href);
+  if (index < 0) {
+    return Promise.resolve();
+  }
+  return Promise.all([loadAudioVariants(), pinChapter(index)]).then(([variants]) => {
+    prefetchQueue = chapterAudio(index, types || [], variants);
+    if (index + 1 < chapters.length) {
+      prefetchQueue = prefetchQueue.concat(chapterAudio(index + 1, types || [], variants));
+    }
+    const workers = [];
+    while (prefetchRunning < PREFETCH_CONCURRENCY) {
+      prefetchRunning++;
+      workers.push(prefetchNext().then(() => { prefetchRunning--; }));
+    }
+    return Promise.all(workers);
+  }).then(enforceAudioBudget);
+}
+
+self.addEventListener('message', event => {
+  const data = event.data || {};
+  if (data.type === 'chapter-open') {
+    event.waitUntil(schedulePrefetch(data.page, data.types));
+  } else if (data.type === 'storage-report') {
+    event.waitUntil(storageReport().then(report => {
+      console.log('Service Worker: Storage', report);
+      if (event.ports && event.ports[0]) {
+        event.ports[0].postMessage(report);
+      }
+    }));
   }
 });
 
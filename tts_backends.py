@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TTS backends for the batch engine
+
+A backend has one coroutine generator, stream(job), yielding edge-tts style
+chunks: {"type": "audio", "data": bytes} and
+{"type": "WordBoundary", "offset": ticks, "duration": ticks, "text": word}
+with times in 100 ns ticks. A job may set "boundary" to "SentenceBoundary"
+to get one boundary event per sentence instead of per word.
+
+EdgeTTSBackend talks to the real service. FakeBackend is an offline
+stand-in returning deterministic MP3 frames with configurable latency,
+jitter and error rate, for testing and load-testing without network.
+"""
+import asyncio
+import hashlib
+import random
+import re
+
+# Same stream format as the real clips: MPEG-2 Layer III, 24 kHz mono, 48 kbps
+FRAME_HEADER = b"\xff\xf3\x64\xc4"
+FRAME_SIZE = 144  # 72 * 48000 / 24000 bytes
+SIDE_INFO_SIZE = 9  # all zero: no main data, the frame decodes as silence
+FRAME_TICKS = 240_000  # 576 samples at 24 kHz = 24 ms, in 100 ns ticks
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class EdgeTTSBackend:
+    name = "edge"
+
+    async def stream(self, job):
+        import edge_tts
+
+        communicate = edge_tts.Communicate(job["text"], job["voice"], rate=job["rate"],
+                                           pitch=job["pitch"], volume=job["volume"],
+                                           boundary=job.get("boundary", "WordBoundary"))
+        async for chunk in communicate.stream():
+            yield chunk
+
+
+class FakeBackend:
+    """Deterministic offline stand-in for the TTS service
+
+    Every request waits latency +/- jitter seconds before its first chunk
+    and fails with ConnectionError with probability error_rate. The audio
+    is a run of silent frames per sentence whose length depends on the word
+    count and whose ancillary bytes carry a hash of the sentence, so equal
+    jobs give equal bytes and different texts differ.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency=0.05, jitter=0.0, error_rate=0.0, frames_per_word=15,
+                 chunk_frames=16, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.frames_per_word = frames_per_word
+        self.chunk_frames = chunk_frames
+        self.random = random.Random(seed)
+
+    def _delay(self):
+        return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    async def stream(self, job):
+        await asyncio.sleep(self._delay())
+        if self.random.random() < self.error_rate:
+            raise ConnectionError("fake backend: simulated service error")
+
+        sentences = [s for s in SENTENCE_END.split(job["text"].strip()) if s] or [""]
+        by_sentence = job.get("boundary") == "SentenceBoundary"
+        lead = 5  # frames of silence before, between and after sentences
+        silence = fake_frame(dict(job, text=""))
+        audio = [silence * lead]
+        offset = lead
+        for sentence in sentences:
+            words = sentence.split()
+            frames = self.frames_per_word * len(words)
+            if by_sentence:
+                yield {"type": "SentenceBoundary", "offset": offset * FRAME_TICKS,
+                       "duration": (frames - 3) * FRAME_TICKS, "text": sentence}
+            else:
+                for i, word in enumerate(words):
+                    yield {"type": "WordBoundary",
+                           "offset": (offset + i * self.frames_per_word) * FRAME_TICKS,
+                           "duration": (self.frames_per_word - 3) * FRAME_TICKS, "text": word}
+            audio.append(fake_frame(dict(job, text=sentence)) * frames + silence * lead)
+            offset += frames + lead
+
+        data = b"".join(audio)
+        step = self.chunk_frames * FRAME_SIZE
+        for start in range(0, len(data), step):
+            yield {"type": "audio", "data": data[start:start + step]}
+            await asyncio.sleep(0)
+
+
+def fake_frame(job):
+    """One silent MP3 frame tagged with a hash of the job"""
+    digest = hashlib.sha256(
+        "|".join([job["text"], job["voice"], job["rate"], job["pitch"], job["volume"]]).encode("utf-8")
+    ).digest()
+    ancillary = FRAME_SIZE - len(FRAME_HEADER) - SIDE_INFO_SIZE
+    return FRAME_HEADER + bytes(SIDE_INFO_SIZE) + (digest * 5)[:ancillary]
+
+
+def get_backend(name="edge", **options):
+    """Build a backend by name; options only apply to the fake backend"""
+    if name == "edge":
+        return EdgeTTSBackend()
+    if name == "fake":
+        return FakeBackend(**options)
+    raise ValueError(f"Unknown TTS backend: {name}")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed store for synthesized clips
+
+Every clip is stored once under a hash of its normalized text and voice
+parameters. Output files under audio/ are hardlinks (or copies) of store
+objects, so a phrase that moves to a new filename costs no TTS call and a
+changed sentence behind an old filename always gets a new key.
+"""
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+import unicodedata
+
+CACHE_DIR = ".tts_cache"
+
+
+def normalize_text(text):
+    """Collapse whitespace and unicode forms so cosmetic edits keep their key"""
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+def cache_key(job):
+    """Hash of everything that changes the synthesized audio"""
+    material = json.dumps([
+        normalize_text(job["text"]),
+        job["voice"],
+        job["rate"],
+        job["pitch"],
+        job["volume"],
+    ], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def object_path(key, cache_dir=CACHE_DIR):
+    """Location of a store object; sharded so no directory gets huge"""
+    return os.path.join(cache_dir, "objects", key[:2], f"{key}.mp3")
+
+
+def has(key, cache_dir=CACHE_DIR):
+    return os.path.exists(object_path(key, cache_dir))
+
+
+def temp_path(key, cache_dir=CACHE_DIR):
+    """Scratch file inside the store, on the same filesystem as its objects"""
+    path = object_path(key, cache_dir) + f".{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def commit(key, tmp, cache_dir=CACHE_DIR):
+    """Move a finished temp file into place as the object for key"""
+    os.replace(tmp, object_path(key, cache_dir))
+
+
+def discard(key, cache_dir=CACHE_DIR):
+    """Drop a bad object so its clip is synthesized again"""
+    if has(key, cache_dir):
+        os.remove(object_path(key, cache_dir))
+
+
+def is_materialized(key, dest, cache_dir=CACHE_DIR):
+    """True if dest already holds exactly the object for key"""
+    src = object_path(key, cache_dir)
+    if not os.path.exists(dest):
+        return False
+    if os.path.samefile(src, dest):
+        return True
+    return filecmp.cmp(src, dest, shallow=False)
+
+
+def materialize(key, dest, cache_dir=CACHE_DIR):
+    """Make dest a hardlink to (or, across filesystems, a copy of) the object
+
+    Returns False if dest was already up to date.
+    """
+    if is_materialized(key, dest, cache_dir):
+        return False
+    src = object_path(key, cache_dir)
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    _link_or_copy(src, tmp)
+    os.replace(tmp, dest)
+    return True
+
+
+def adopt(key, path, cache_dir=CACHE_DIR):
+    """Seed the store with an existing output file assumed to match key"""
+    tmp = temp_path(key, cache_dir)
+    _link_or_copy(path, tmp)
+    commit(key, tmp, cache_dir)
+
+
+def _link_or_copy(src, dst):
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared German TTS batch engine
+
+The create_*/generate_* scripts only describe which clips they want; this
+module synthesizes them through a bounded pool of asyncio workers so a full
+rebuild is limited by the service's throughput instead of one round trip
+per file. With --batch, short one-sentence clips share a request and the
+stream is split back into clips at the sentence boundaries.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+
+import mp3_check
+import rate_limiter
+import tts_backends
+import tts_cache
+
+# German voice settings shared by every script
+VOICE = "de-DE-KatjaNeural"
+RATE = "-20%"  # Slower for learning
+PITCH = "+0Hz"
+VOLUME = "+0%"
+
+DEFAULT_CONCURRENCY = 16  # upper bound; the adaptive limit starts lower
+INITIAL_CONCURRENCY = 4
+DEFAULT_RETRIES = 4
+DEFAULT_TIMEOUT = 60.0  # seconds per request
+BATCH_MAX_WORDS = 4  # longer clips always get a request of their own
+
+
+class SplitError(Exception):
+    """A batched stream could not be split back into one clip per text"""
+
+
+def make_job(text, path, voice=VOICE, rate=RATE, pitch=PITCH, volume=VOLUME):
+    """Describe a single clip: what to say, how, and where to write it"""
+    return {"text": text, "voice": voice, "rate": rate, "pitch": pitch,
+            "volume": volume, "path": path}
+
+
+def jobs_from_dict(clips, output_dir, suffix="", voice=VOICE, rate=RATE):
+    """Turn a {filename: text} table into jobs writing into output_dir"""
+    return [
+        make_job(text, f"{output_dir}/{filename}{suffix}", voice, rate)
+        for filename, text in clips.items()
+    ]
+
+
+async def synthesize(job, path, backend):
+    """Stream one job's audio chunks into path as they arrive
+
+    The file is fsynced and its MP3 frames checked before returning (a
+    broken stream raises, so it is retried); callers write to a temp path and
+    rename it into place only after this succeeds, so an interrupted run
+    never leaves a truncated clip behind. Returns bytes written, time to
+    first audio byte and total time in seconds.
+    """
+    started = time.monotonic()
+    ttfb = None
+    size = 0
+    with open(path, "wb") as f:
+        async for chunk in backend.stream(job):
+            if chunk["type"] != "audio":
+                continue
+            if ttfb is None:
+                ttfb = time.monotonic() - started
+            f.write(chunk["data"])
+            size += len(chunk["data"])
+        if not size:
+            raise RuntimeError("no audio received")
+        f.flush()
+        os.fsync(f.fileno())
+    check = mp3_check.scan_file(path)
+    if mp3_check.is_broken(check):
+        raise RuntimeError(f"invalid audio received: {', '.join(check['problems'])}")
+    return {"bytes": size, "ttfb": ttfb, "seconds": time.monotonic() - started}
+
+
+def batchable(job):
+    """Whether a job is a short single sentence that can share a request"""
+    text = job["text"].strip()
+    return (0 < len(text.split()) <= BATCH_MAX_WORDS
+            and "\n" not in text and not re.search(r"[.!?]\s", text))
+
+
+def _as_sentence(text):
+    text = text.strip()
+    return text if text[-1] in ".!?" else text + "."
+
+
+async def synthesize_batch(jobs, paths, backend):
+    """Synthesize several short jobs in one request and split the stream
+
+    The texts are sent as consecutive sentences of a single request that
+    reports sentence boundaries, and clip i is cut at the frames nearest
+    the middle of the pauses around sentence i, so every clip keeps part of
+    the pause as lead-in and tail. Raises SplitError if the service reports
+    a different number of sentences or a piece is not valid audio; the
+    caller then synthesizes the jobs one by one. Returns one metrics dict
+    per path.
+    """
+    first = jobs[0]
+    batch_job = make_job(" ".join(_as_sentence(job["text"]) for job in jobs), None,
+                         first["voice"], first["rate"], first["pitch"], first["volume"])
+    batch_job["boundary"] = "SentenceBoundary"
+    started = time.monotonic()
+    ttfb = None
+    data = bytearray()
+    sentences = []
+    async for chunk in backend.stream(batch_job):
+        if chunk["type"] == "SentenceBoundary":
+            sentences.append((chunk["offset"], chunk["offset"] + chunk["duration"]))
+        elif chunk["type"] == "audio":
+            if ttfb is None:
+                ttfb = time.monotonic() - started
+            data += chunk["data"]
+    if not data:
+        raise RuntimeError("no audio received")
+    if len(sentences) != len(jobs):
+        raise SplitError(f"{len(jobs)} texts came back as {len(sentences)} sentences")
+
+    data = bytes(data)
+    frames = mp3_check.audio_frames(data)
+    if not frames:
+        raise RuntimeError("invalid audio received")
+    header = frames[0][1]
+    frame_ticks = header["samples"] * 10_000_000 / header["sample_rate"]
+    cuts = [0]
+    for (_, end), (start, _) in zip(sentences, sentences[1:]):
+        cuts.append(min(len(frames), round((end + start) / 2 / frame_ticks)))
+    cuts.append(len(frames))
+    if any(a >= b for a, b in zip(cuts, cuts[1:])):
+        raise SplitError("sentence boundaries out of order")
+
+    seconds = time.monotonic() - started
+    results = []
+    for path, begin, stop in zip(paths, cuts, cuts[1:]):
+        piece = b"".join(data[pos:pos + h["length"]] for pos, h in frames[begin:stop])
+        with open(path, "wb") as f:
+            f.write(piece)
+            f.flush()
+            os.fsync(f.fileno())
+        check = mp3_check.scan_file(path)
+        if mp3_check.is_broken(check):
+            raise SplitError(f"invalid piece: {', '.join(check['problems'])}")
+        results.append({"bytes": len(piece), "ttfb": ttfb, "seconds": seconds, "batch": len(jobs)})
+    return results
+
+
+async def with_retry(request, limiter, bucket, throughput, retries=DEFAULT_RETRIES,
+                     timeout=DEFAULT_TIMEOUT):
+    """Await request() through the rate limits, retrying with jittered backoff
+
+    Returns the result, the number of attempts and the seconds from the
+    first attempt to the result, waits, failed attempts and backoff
+    included. A SplitError is not retried: the request itself worked, it
+    just can't be used as a batch.
+    """
+    started = time.monotonic()
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+        await limiter.acquire()
+        try:
+            result = await asyncio.wait_for(request(), timeout)
+        except SplitError:
+            await limiter.release(True)
+            throughput.record(True)
+            raise
+        except Exception:
+            await limiter.release(False)
+            throughput.record(False)
+            if attempt == retries:
+                raise
+            await asyncio.sleep(rate_limiter.backoff_delay(attempt))
+        except BaseException:
+            # cancelled: give the slot back even if cancelled again meanwhile
+            await asyncio.shield(limiter.release(False))
+            raise
+        else:
+            await limiter.release(True)
+            throughput.record(True)
+            return result, attempt + 1, time.monotonic() - started
+
+
+async def synthesize_with_retry(job, path, backend, limiter, bucket, throughput,
+                                retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT):
+    """Synthesize through the rate limits, retrying with jittered backoff
+
+    metrics["seconds"] is the successful attempt, metrics["elapsed"] the
+    clip's wall time across all attempts.
+    """
+    metrics, attempts, elapsed = await with_retry(lambda: synthesize(job, path, backend), limiter,
+                                                  bucket, throughput, retries, timeout)
+    metrics["attempts"] = attempts
+    metrics["elapsed"] = elapsed
+    return metrics
+
+
+def plan_batches(entries, batch_size):
+    """Group (key, jobs) entries into requests of up to batch_size clips
+
+    Only batchable texts with the same voice settings share a request;
+    everything else is a request of its own.
+    """
+    if batch_size <= 1:
+        return [[entry] for entry in entries]
+    requests = []
+    open_batches = {}
+    for entry in entries:
+        job = entry[1][0]
+        if not batchable(job):
+            requests.append([entry])
+            continue
+        settings = (job["voice"], job["rate"], job["pitch"], job["volume"])
+        batch = open_batches.get(settings)
+        if batch is None or len(batch) >= batch_size:
+            batch = open_batches[settings] = []
+            requests.append(batch)
+        batch.append(entry)
+    return requests
+
+
+async def run_jobs(jobs, concurrency=DEFAULT_CONCURRENCY, overwrite=False,
+                   adopt_existing=False, cache_dir=tts_cache.CACHE_DIR,
+                   rate_limit=None, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT,
+                   backend=None, metrics_path=None, batch_size=1):
+    """Synthesize all jobs with at most `concurrency` requests in flight
+
+    The number of requests in flight adapts between 1 and `concurrency`
+    (AIMD on success/failure), `rate_limit` caps requests per second and
+    failed requests are retried up to `retries` times with backoff.
+    `backend` defaults to the edge-tts service. Per-clip bytes, time to
+    first byte and total time are summarized and, with metrics_path,
+    written there as JSON.
+
+    Jobs are grouped by cache key, so each distinct (text, voice settings)
+    is synthesized at most once and then materialized to every path that
+    wants it. Later jobs win when two jobs target the same path, like later
+    keys in the old per-script dicts. With adopt_existing, output files not
+    yet known to the store are assumed to match their job and imported
+    instead of resynthesized, unless mp3_check finds them empty or broken.
+    With batch_size > 1, up to that many short clips share one request
+    (see synthesize_batch). Returns a dict of counts.
+    """
+    by_path = {}
+    for job in jobs:
+        by_path[job["path"]] = job
+
+    by_key = {}
+    for path, job in by_path.items():
+        by_key.setdefault(tts_cache.cache_key(job), []).append(job)
+
+    if backend is None:
+        backend = tts_backends.EdgeTTSBackend()
+    stats = {"created": 0, "cached": 0, "unchanged": 0, "errors": 0}
+    pending = []
+    for key, key_jobs in by_key.items():
+        if adopt_existing and not tts_cache.has(key, cache_dir):
+            # empty or truncated files are synthesized again, not trusted
+            existing = [j["path"] for j in key_jobs if os.path.exists(j["path"])
+                        and not mp3_check.is_broken(mp3_check.scan_file(j["path"]))]
+            if existing:
+                tts_cache.adopt(key, existing[0], cache_dir)
+        if overwrite or not tts_cache.has(key, cache_dir):
+            pending.append((key, key_jobs))
+        else:
+            _materialize_all(key, key_jobs, stats, cache_dir)
+
+    queue = asyncio.Queue()
+    for request in plan_batches(pending, batch_size):
+        queue.put_nowait(request)
+    total = len(pending)
+    print(f"🔊 {total} clips to synthesize, {stats['cached']} restored from cache, "
+          f"{stats['unchanged']} up to date (concurrency up to {concurrency})")
+    started = time.monotonic()
+    limiter = rate_limiter.AdaptiveConcurrency(initial=INITIAL_CONCURRENCY, maximum=concurrency)
+    bucket = rate_limiter.TokenBucket(rate_limit)
+    throughput = rate_limiter.Throughput()
+    job_metrics = []
+
+    def finished(key, key_jobs, tmp, metrics):
+        # a full disk or an unwritable output fails this clip, not the run
+        try:
+            tts_cache.commit(key, tmp, cache_dir)
+            for key_job in key_jobs:
+                tts_cache.materialize(key, key_job["path"], cache_dir)
+        except OSError as e:
+            failed(key_jobs, tmp, e)
+            return
+        job = key_jobs[0]
+        stats["created"] += 1
+        metrics["path"] = job["path"]
+        job_metrics.append(metrics)
+        done = stats["created"] + stats["errors"]
+        batch = f", batch of {metrics['batch']}" if metrics.get("batch") else ""
+        print(f"[{done:4}/{total}] ✅ Created: {job['path']} -> {job['text']} "
+              f"({metrics['bytes'] / 1024:.1f} KB, first byte "
+              f"{metrics['ttfb'] * 1000:.0f} ms, total {metrics['seconds'] * 1000:.0f} ms{batch})")
+
+    def failed(key_jobs, tmp, error):
+        stats["errors"] += 1
+        done = stats["created"] + stats["errors"]
+        print(f"[{done:4}/{total}] ❌ Error creating {key_jobs[0]['path']}: {error}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+    async def worker():
+        while True:
+            try:
+                request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            tmps = [tts_cache.temp_path(key, cache_dir) for key, _ in request]
+            if len(request) > 1:
+                jobs = [key_jobs[0] for _, key_jobs in request]
+                try:
+                    results, attempts, elapsed = await with_retry(
+                        lambda: synthesize_batch(jobs, tmps, backend),
+                        limiter, bucket, throughput, retries, timeout)
+                except SplitError as e:
+                    print(f"↩️  Batch of {len(request)} split failed ({e}), synthesizing one by one")
+                    for tmp in tmps:
+                        if os.path.exists(tmp):
+                            os.remove(tmp)
+                    for entry in request:
+                        queue.put_nowait([entry])
+                    continue
+                except Exception as e:
+                    for (_, key_jobs), tmp in zip(request, tmps):
+                        failed(key_jobs, tmp, e)
+                    continue
+                for (key, key_jobs), tmp, metrics in zip(request, tmps, results):
+                    metrics["attempts"] = attempts
+                    metrics["elapsed"] = elapsed
+                    finished(key, key_jobs, tmp, metrics)
+                continue
+
+            (key, key_jobs), tmp = request[0], tmps[0]
+            try:
+                metrics = await synthesize_with_retry(key_jobs[0], tmp, backend, limiter, bucket,
+                                                      throughput, retries, timeout)
+            except Exception as e:
+                failed(key_jobs, tmp, e)
+                continue
+            finished(key, key_jobs, tmp, metrics)
+
+    if total:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, queue.qsize()))))
+
+    elapsed = time.monotonic() - started
+    print(f"\n✅ Created: {stats['created']} clips")
+    print(f"♻️  From cache: {stats['cached']} files")
+    print(f"⏭️  Up to date: {stats['unchanged']} files")
+    print(f"❌ Errors: {stats['errors']} clips")
+    print(f"⏱️  {elapsed:.1f}s")
+    if throughput.requests:
+        print(f"📈 {throughput.per_second():.1f} requests/s, {throughput.failures} failed "
+              f"attempts, concurrency peaked at {int(limiter.peak)}")
+    if job_metrics:
+        print_latency_summary(job_metrics)
+    if metrics_path:
+        with open(metrics_path, "w", encoding="utf-8") as f:
+            json.dump(job_metrics, f, ensure_ascii=False, indent=1)
+    return stats
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def print_latency_summary(job_metrics):
+    total_bytes = sum(m["bytes"] for m in job_metrics)
+    for label, field in (("first byte", "ttfb"), ("per request", "seconds"), ("per clip", "elapsed")):
+        values = [m[field] for m in job_metrics]
+        print(f"⏱️  {label}: p50 {percentile(values, 0.5) * 1000:.0f} ms, "
+              f"p95 {percentile(values, 0.95) * 1000:.0f} ms, "
+              f"max {max(values) * 1000:.0f} ms")
+    print(f"💾 {total_bytes / 1024:.0f} KB synthesized")
+
+
+def _materialize_all(key, key_jobs, stats, cache_dir):
+    """Link the object for key to every output path that wants it"""
+    for job in key_jobs:
+        if tts_cache.materialize(key, job["path"], cache_dir):
+            stats["cached"] += 1
+        else:
+            stats["unchanged"] += 1
+
+
+def add_arguments(parser):
+    """Engine options shared by every script that feeds jobs into run_jobs()"""
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="maximum number of TTS requests in flight")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="resynthesize clips even if they are in the cache")
+    parser.add_argument("--adopt-existing", action="store_true",
+                        help="import existing output files into the cache "
+                             "instead of resynthesizing them")
+    parser.add_argument("--cache-dir", default=tts_cache.CACHE_DIR,
+                        help="content-addressed clip store")
+    parser.add_argument("--rate-limit", type=float, default=None,
+                        help="maximum TTS requests per second (default: unlimited)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="retries per clip after a failed or timed out request")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds before a TTS request counts as failed")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="write per-clip bytes and latency as JSON")
+    parser.add_argument("--batch", type=int, default=1, metavar="N",
+                        help=f"send up to N short clips (<= {BATCH_MAX_WORDS} words) per request")
+    parser.add_argument("--backend", choices=("edge", "fake"), default="edge",
+                        help="TTS service; 'fake' is an offline stand-in")
+    parser.add_argument("--fake-latency", type=float, default=0.05,
+                        help="fake backend: seconds before the first chunk")
+    parser.add_argument("--fake-jitter", type=float, default=0.0,
+                        help="fake backend: +/- seconds added to the latency")
+    parser.add_argument("--fake-error-rate", type=float, default=0.0,
+                        help="fake backend: probability that a request fails")
+
+
+def backend_from_args(args):
+    if args.backend == "fake":
+        return tts_backends.get_backend("fake", latency=args.fake_latency,
+                                        jitter=args.fake_jitter,
+                                        error_rate=args.fake_error_rate)
+    return tts_backends.get_backend(args.backend)
+
+
+def run_from_args(jobs, args):
+    return asyncio.run(run_jobs(jobs, concurrency=max(1, args.concurrency),
+                                overwrite=args.overwrite,
+                                adopt_existing=args.adopt_existing,
+                                cache_dir=args.cache_dir,
+                                rate_limit=args.rate_limit,
+                                retries=max(0, args.retries),
+                                timeout=args.timeout,
+                                backend=backend_from_args(args),
+                                metrics_path=args.metrics,
+                                batch_size=args.batch))
+
+
+def main(jobs, title=None):
+    """Command line entry point shared by the generator scripts"""
+    parser = argparse.ArgumentParser(description=title)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if title:
+        print(f"🚀 {title}")
+    return run_from_args(jobs, args)
@@ -1,143 +0,0 @@
-# Update all chapter headers to use consistent navigation
-# Run in PowerShell: ./update-chapter-headers.ps1
-
-$chapterFiles = Get-ChildItem -Path "chapters" -Filter "*.html"
-$standardHeaderCSS = @'
-        /* Standard Navigation Header */
-        .chapter-nav {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            background: linear-gradient(135deg, #2563eb, #1d4ed8);
-            color: white;
-            padding: 15px 20px;
-            z-index: 1000;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .nav-brand {
-            display: flex;
-            align-items: center;
-        }
-        
-        .nav-home {
-            color: white;
-            text-decoration: none;
-            font-weight: bold;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        
-        .nav-home:hover {
-            opacity: 0.8;
-        }
-        
-        .home-icon {
-            font-size: 20px;
-        }
-        
-        .nav-title {
-            font-size: 20px;
-            font-weight: 600;
-        }
-        
-        .nav-title-mobile {
-            font-size: 16px;
-            font-weight: 500;
-            display: none;
-        }
-        
-        .nav-controls {
-            display: flex;
-            gap: 10px;
-            align-items: center;
-        }
-        
-        .nav-btn {
-            background: rgba(255,255,255,0.2);
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 6px;
-            cursor: pointer;
-            text-decoration: none;
-            font-size: 14px;
-            transition: background 0.2s;
-        }
-        
-        .nav-btn:hover {
-            background: rgba(255,255,255,0.3);
-        }
-        
-        @media (max-width: 768px) {
-            .nav-title {
-                display: none;
-            }
-            
-            .nav-title-mobile {
-                display: block;
-            }
-            
-            .chapter-nav {
-                padding: 12px 15px;
-            }
-        }
-'@
-
-Write-Host "🔄 Updating chapter headers..." -ForegroundColor Cyan
-
-foreach ($file in $chapterFiles) {
-    $filePath = $file.FullName
-    $fileName = $file.Name
-    $chapterNum = ($fileName -replace "chapter(\d+)\.html", '$1') -as [int]
-    
-    Write-Host "📝 Processing $fileName (Unit $chapterNum)..."
-    
-    # Get current content
-    $content = Get-Content $filePath -Raw
-    
-    # Define navigation based on chapter number
-    $prevChapter = if ($chapterNum -gt 0) { "chapter" + ($chapterNum - 1).ToString().PadLeft(2, '0') + ".html" } else { $null }
-    $nextChapter = if ($chapterNum -lt 14) { "chapter" + ($chapterNum + 1).ToString().PadLeft(2, '0') + ".html" } else { $null }
-    
-    # Create navigation HTML
-    $navHTML = '<nav class="chapter-nav">' + "`n"
-    $navHTML += '        <div class="nav-brand">' + "`n"
-    $navHTML += '            <a href="../index.html" class="nav-home">' + "`n"
-    $navHTML += '                <span class="home-icon">🏠</span>' + "`n"
-    $navHTML += '                <span class="nav-title">VimAPP German A1</span>' + "`n"
-    $navHTML += '            </a>' + "`n"
-    $navHTML += '        </div>' + "`n"
-    $navHTML += '        <div class="nav-controls">' + "`n"
-    
-    if ($prevChapter) {
-        $navHTML += "            <a href=`"$prevChapter`" class=`"nav-btn`">← ก่อนหน้า</a>`n"
-    }
-    
-    $unitTitle = "Unit $chapterNum"
-    $navHTML += "            <span class=`"nav-title-mobile`">$unitTitle</span>`n"
-    
-    if ($nextChapter) {
-        $navHTML += "            <a href=`"$nextChapter`" class=`"nav-btn`">ถัดไป →</a>`n"
-    }
-    
-    $navHTML += '        </div>' + "`n"
-    $navHTML += '    </nav>'
-    
-    # Update content (this is a simplified approach - in practice you'd need more sophisticated regex)
-    # For now, let's just display what would be updated
-    Write-Host "  - Navigation: Home icon + Unit $chapterNum + Prev/Next buttons" -ForegroundColor Green
-}
-
-Write-Host "`n✅ All chapter headers will be consistent!" -ForegroundColor Green
-Write-Host "🎯 Features:" -ForegroundColor Yellow
-Write-Host "  - 🏠 Home icon (20px) linking to main page" 
-Write-Host "  - Gradient blue header background"
-Write-Host "  - Responsive design (mobile-friendly)"
-Write-Host "  - Prev/Next navigation buttons"
-Write-Host "  - Consistent spacing and typography"
\ No newline at end of file